@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Optional, Sequence
 
@@ -55,7 +56,7 @@ def analyze_density_matrix(
         dim = dimension
 
     local_dim = _infer_local_dimension(dim)
-    basis = generate_bell_basis(local_dim)
+    basis = _cached_bell_basis(local_dim)
     fidelities = _compute_fidelities(rho, basis)
     return BellAnalysisResult(dimension=dim, local_dimension=local_dim, fidelities=fidelities)
 
@@ -97,12 +98,18 @@ def generate_generalized_bell_states(local_dimension: int) -> list[np.ndarray]:
     return basis_states
 
 
+@lru_cache(maxsize=8)
+def _cached_bell_basis(local_dimension: int) -> np.ndarray:
+    """Read-only Bell basis shared by all analyses of the same local dimension."""
+
+    basis = generate_bell_basis(local_dimension)
+    basis.flags.writeable = False
+    return basis
+
+
 def _compute_fidelities(rho: np.ndarray, basis: np.ndarray) -> np.ndarray:
-    values = []
-    for psi in basis:
-        fidelity = np.real_if_close(np.vdot(psi, rho @ psi))
-        values.append(float(np.real(fidelity)))
-    return np.array(values, dtype=float)
+    # Bell states are pure, so F_k = <psi_k|rho|psi_k> for the whole basis in one contraction.
+    return np.real(np.einsum("ki,ij,kj->k", basis.conj(), rho, basis)).astype(float)
 
 
 def _infer_local_dimension(dimension: int) -> int:
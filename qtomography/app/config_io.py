@@ -15,6 +15,7 @@ from pathlib import Path
 from typing import Any, Dict
 
 from .controller import ReconstructionConfig
+from .warm_start import WARM_START_POLICIES
 
 __all__ = [
     "CONFIG_FILE_VERSION",
@@ -59,9 +60,14 @@ def config_to_payload(config: ReconstructionConfig) -> Dict[str, Any]:
     _store("wls_max_iterations", data.get("wls_max_iterations"))
     _store("wls_min_expected_clip", data.get("wls_min_expected_clip"))
     _store("wls_optimizer_ftol", data.get("wls_optimizer_ftol"))
+    _store("apg_max_iterations", data.get("apg_max_iterations"))
     _store("tolerance", data.get("tolerance"))
     _store("cache_projectors", data.get("cache_projectors"))
+    _store("wls_batched", data.get("wls_batched"))
+    _store("warm_start", data.get("warm_start"))
+    _store("rhor_acceleration", data.get("rhor_acceleration"))
     _store("analyze_bell", data.get("analyze_bell"))
+    _store("cache_max_bytes", data.get("cache_max_bytes"))
 
     return payload
 
@@ -198,6 +204,12 @@ def load_config_file(path: Path) -> ReconstructionConfig:
     elif wls_optimizer_ftol <= 0:
         raise ValueError("wls_optimizer_ftol must be positive")
 
+    apg_max_iterations = payload.get("apg_max_iterations")
+    if apg_max_iterations is None:
+        apg_max_iterations = 2000
+    elif isinstance(apg_max_iterations, bool) or not isinstance(apg_max_iterations, int) or apg_max_iterations <= 0:
+        raise ValueError("apg_max_iterations must be a positive integer")
+
     tolerance = payload.get("tolerance")
     if tolerance is None:
         tolerance = 1e-9
@@ -212,12 +224,39 @@ def load_config_file(path: Path) -> ReconstructionConfig:
     elif not isinstance(cache_projectors, bool):
         raise ValueError("cache_projectors must be a boolean")
 
+    wls_batched = payload.get("wls_batched")
+    if wls_batched is None:
+        wls_batched = False
+    elif not isinstance(wls_batched, bool):
+        raise ValueError("wls_batched must be a boolean")
+
+    warm_start = payload.get("warm_start")
+    if warm_start is None:
+        warm_start = "none"
+    elif not isinstance(warm_start, str) or warm_start.lower() not in WARM_START_POLICIES:
+        raise ValueError("warm_start must be one of: 'none', 'previous', 'nearest'")
+    warm_start = warm_start.lower()
+
+    rhor_acceleration = payload.get("rhor_acceleration")
+    if rhor_acceleration is None:
+        rhor_acceleration = "none"
+    elif not isinstance(rhor_acceleration, str) or rhor_acceleration.lower() not in ("none", "momentum"):
+        raise ValueError("rhor_acceleration must be one of: 'none', 'momentum'")
+    rhor_acceleration = rhor_acceleration.lower()
+
     analyze_bell = payload.get("analyze_bell")
     if analyze_bell is None:
         analyze_bell = False
     elif not isinstance(analyze_bell, bool):
         raise ValueError("analyze_bell must be a boolean")
 
+    cache_max_bytes = payload.get("cache_max_bytes")
+    if cache_max_bytes is not None:
+        if isinstance(cache_max_bytes, bool) or not isinstance(cache_max_bytes, int):
+            raise ValueError("cache_max_bytes must be an integer")
+        if cache_max_bytes <= 0:
+            raise ValueError("cache_max_bytes must be positive")
+
     design = payload.get("design")
     if design is None:
         design = "mub"
@@ -238,7 +277,12 @@ def load_config_file(path: Path) -> ReconstructionConfig:
         wls_max_iterations=wls_max_iterations,
         wls_min_expected_clip=wls_min_expected_clip,
         wls_optimizer_ftol=wls_optimizer_ftol,
+        apg_max_iterations=apg_max_iterations,
         tolerance=tolerance,
         cache_projectors=cache_projectors,
+        wls_batched=wls_batched,
+        warm_start=warm_start,
+        rhor_acceleration=rhor_acceleration,
         analyze_bell=analyze_bell,
+        cache_max_bytes=cache_max_bytes,
     )
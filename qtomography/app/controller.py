@@ -79,7 +79,13 @@ from qtomography.app.exceptions import ReconstructionCancelled, ReconstructionEr
 from qtomography.domain.reconstruction.linear import LinearReconstructor  # 线性重构算法
 from qtomography.domain.reconstruction.wls import WLSReconstructor        # WLS 重构算法
 from qtomography.domain.reconstruction.rhor_strict import RrhoStrictReconstructor  # RρR Strict 重构算法
+from qtomography.domain.reconstruction.apg import APGReconstructor  # 加速投影梯度 MLE
 from qtomography.domain.projectors import ProjectorSet
+from qtomography.domain.factorization import set_factorization_cache_limit
+from qtomography.domain.density import DensityMatrix
+from qtomography.domain.density_batch import DensityBatch
+from qtomography.domain.grouping import normalize_per_group
+from qtomography.app.warm_start import WARM_START_POLICIES, WarmStartCache
 
 from qtomography.infrastructure.persistence.result_repository import (
 
@@ -108,7 +114,13 @@ logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 
 # 允许使用的重构方法集合（用于配置验证）
-_ALLOWED_METHODS = {"linear", "wls", "rhor"}
+_ALLOWED_METHODS = {"linear", "wls", "rhor", "apg"}
+# "both" 展开后的方法集合（apg 需显式指定）
+_BOTH_METHODS = {"linear", "wls", "rhor"}
+# 批量线性重构每次求解的样本列数（块之间响应进度回调与取消请求）
+_LINEAR_BATCH_CHUNK = 256
+# wls_batched=True 时每次联合求解的样本列数（块之间响应进度回调与取消请求）
+_WLS_BATCH_CHUNK = 256
 
 
 
@@ -204,6 +216,9 @@ class ReconstructionConfig:
             - 默认：1e-9
 
             - 控制 WLS 数值最小化的收敛精度
+
+        apg_max_iterations: APG 最大似然重构的最大迭代次数
+            - 默认：2000
             
 
         tolerance: 数值稳定性容差（用于特征值裁剪、概率归一化等）
@@ -219,6 +234,25 @@ class ReconstructionConfig:
 
             - False：每次重构重新计算（节省内存）
             - 建议批处理时设为 True
+
+        wls_batched: 是否对整批样本联合执行 WLS（向量化 L-BFGS）
+            - 默认：False（逐样本调用 scipy.optimize.minimize）
+            - True：大量小维度样本时显著减少 Python 开销；chi² 在优化容差内一致
+
+        warm_start: 跨样本热启动策略（逐样本 WLS 与 RρR）
+            - "none"（默认）：每个样本从线性结果 / 最大混态出发
+            - "previous"：以上一个样本的解为初始点（适合同一名义态的时间序列）
+            - "nearest"：以最近若干样本中观测概率最接近者的解为初始点
+            - 初始目标值劣于冷启动或热启动未收敛时自动回退；wls_batched=True 时 WLS 不使用
+
+        rhor_acceleration: RρR 迭代的加速方式
+            - "none"（默认）：标准 RρR 不动点迭代
+            - "momentum"：在因子空间做 Nesterov 外推，似然下降时自动重启
+
+        cache_max_bytes: 进程级算子缓存的字节预算
+            - None（默认）：保持当前预算（投影算符 256 MiB，派生分解 512 MiB）
+            - 正整数：投影算符缓存与分解缓存（对偶框架、E_tilde 等）各自以此为上限，
+              超出时按 LRU 淘汰；大维度批处理或内存受限环境下调小
     
 
     验证规则：
@@ -294,13 +328,18 @@ class ReconstructionConfig:
     wls_max_iterations: int = 2000  # WLS 最大迭代次数
     wls_min_expected_clip: float = 1e-12  # 理论概率裁剪阈值
     wls_optimizer_ftol: float = 1e-9      # 优化器函数容差
+    apg_max_iterations: int = 2000  # APG 最大迭代次数
     tolerance: float = 1e-9         # 数值容差
     
 
     # ========== 性能参数 ==========
 
     cache_projectors: bool = True  # 是否缓存投影算子（批处理推荐 True）
+    wls_batched: bool = False        # 是否对整批样本联合执行 WLS（向量化 L-BFGS）
+    warm_start: str = "none"         # 跨样本热启动策略：none|previous|nearest
+    rhor_acceleration: str = "none"  # RρR 加速方式：none|momentum
     analyze_bell: bool = False       # 是否在重构后执行 Bell 态分析
+    cache_max_bytes: Optional[int] = None  # 算子缓存字节预算（None 保持默认）
 
 
     def __post_init__(self) -> None:
@@ -350,6 +389,20 @@ class ReconstructionConfig:
             raise ValueError("wls_min_expected_clip must be positive")
         if self.wls_optimizer_ftol <= 0:
             raise ValueError("wls_optimizer_ftol must be positive")
+        if self.apg_max_iterations <= 0:
+            raise ValueError("apg_max_iterations must be positive")
+        warm_start = str(self.warm_start).lower()
+        if warm_start not in WARM_START_POLICIES:
+            raise ValueError(f"warm_start must be one of {WARM_START_POLICIES}")
+        object.__setattr__(self, "warm_start", warm_start)
+        rhor_acceleration = str(self.rhor_acceleration).lower()
+        if rhor_acceleration not in ("none", "momentum"):
+            raise ValueError("rhor_acceleration must be one of ('none', 'momentum')")
+        object.__setattr__(self, "rhor_acceleration", rhor_acceleration)
+        if self.cache_max_bytes is not None:
+            if int(self.cache_max_bytes) <= 0:
+                raise ValueError("cache_max_bytes must be positive")
+            object.__setattr__(self, "cache_max_bytes", int(self.cache_max_bytes))
         
         
         # 5. 标准化并验证重构方法（例如"both" → ["linear", "wls"]）
@@ -745,6 +798,9 @@ class ReconstructionController:
     
             # 验证配置并创建输出目录
             config = self._prepare_config(config)
+            if config.cache_max_bytes is not None:
+                ProjectorSet.set_cache_limit(config.cache_max_bytes)
+                set_factorization_cache_limit(config.cache_max_bytes)
             
             
             # 加载输入数据（shape: [num_probabilities, num_samples]）
@@ -765,17 +821,15 @@ class ReconstructionController:
             # Pre-check: per-group normalization using ProjectorSet.groups (counts or per-group probs)
             try:
                 projector = ProjectorSet.get(dimension, design=config.design)
-                groups = getattr(projector, "groups", None)
-                if groups is not None and groups.size == data.shape[0]:
+                group_index = projector.group_index
+                if group_index.size == data.shape[0]:
                     tol = getattr(config, "tolerance", 1e-12)
-                    arr = data.astype(float).copy()
-                    for g in np.unique(groups):
-                        idx = np.where(groups == g)[0]
-                        sums = np.sum(arr[idx, :], axis=0)
-                        if np.any(np.isclose(sums, 0.0, atol=tol)):
-                            raise ValueError("Found zero group-sum in some samples; cannot normalize.")
-                        arr[idx, :] = arr[idx, :] / sums
-                    data = arr
+                    data = normalize_per_group(
+                        data,
+                        group_index,
+                        tolerance=tol,
+                        zero_sum_message="Found zero group-sum in some samples; cannot normalize.",
+                    )
             except Exception:
                 # Fallback: algorithms handle normalization internally if needed
                 pass    
@@ -855,10 +909,39 @@ class ReconstructionController:
                     max_iterations=getattr(config, "rhor_max_iterations", 5000),
                     tol_state=getattr(config, "rhor_tol_state", 1e-8),
                     tol_ll=getattr(config, "rhor_tol_ll", 1e-9),
+                    acceleration=config.rhor_acceleration,
+                    cache_projectors=config.cache_projectors,
+                )
+
+            # 根据配置实例化 APG 最大似然重构器（可选）
+            apg: Optional[APGReconstructor] = None
+
+            if "apg" in config.methods:
+                apg = APGReconstructor(
+                    dimension,
+                    design=getattr(config, "design", "mub"),
+                    tolerance=config.tolerance,
+                    max_iterations=config.apg_max_iterations,
                     cache_projectors=config.cache_projectors,
                 )
 
-            enabled_method_count = int(linear is not None) + int(wls is not None) + int(rhor is not None)
+            # 线性重构按 _LINEAR_BATCH_CHUNK 列分块批量求解（测量矩阵只分解一次，每块一次矩阵乘法），
+            # 逐样本指标（纯度 / 迹 / 特征值 / 熵）在每块的堆栈上一次算出；块在样本循环中按需求解
+            linear_batch = None
+            linear_stats = None
+            linear_batch_start = 0
+            # 可选：WLS 按 _WLS_BATCH_CHUNK 列分块联合优化（以线性批量结果为初始点），
+            # 在样本循环中按需求解，块与块之间照常响应进度回调与取消请求
+            wls_batch = None
+            wls_stats = None
+            wls_batch_start = 0
+
+            # 跨样本热启动：按方法缓存已完成样本的解
+            warm_cache = WarmStartCache(config.warm_start)
+
+            enabled_method_count = (
+                int(linear is not None) + int(wls is not None) + int(rhor is not None) + int(apg is not None)
+            )
             if enabled_method_count == 0:
                 enabled_method_count = 1
             total_steps = max(1, sample_count * enabled_method_count)
@@ -872,6 +955,7 @@ class ReconstructionController:
                         ("linear", linear is not None),
                         ("wls", wls is not None),
                         ("rhor", rhor is not None),
+                        ("apg", apg is not None),
                     )
                     if enabled
                 ),
@@ -936,8 +1020,13 @@ class ReconstructionController:
     
                 if linear is not None:
     
-                    # 执行线性重构（最小二乘或 Tikhonov 正则化）
-                    linear_result = linear.reconstruct_with_details(probs)
+                    # 当前样本越过已求解的块时，批量求解下一块（最小二乘或 Tikhonov 正则化）
+                    if linear_batch is None or idx >= linear_batch_start + linear_batch.num_samples:
+                        linear_batch_start = idx
+                        linear_batch = linear.reconstruct_batch(data[:, idx:idx + _LINEAR_BATCH_CHUNK])
+                        linear_stats = _stack_metrics(linear_batch.density_batch)
+                    linear_offset = idx - linear_batch_start
+                    linear_result = linear_batch.result_at(linear_offset)
                     
                     
     
@@ -954,8 +1043,8 @@ class ReconstructionController:
                         metrics={
     
                             # 原有字段
-                            "purity": linear_result.density.purity,             # 纯度 Tr(ρ²)
-                            "trace": float(np.real(linear_result.density.trace)),  # 迹 Tr(ρ)（应接近 1）
+                            "purity": linear_stats["purity"][linear_offset],             # 纯度 Tr(ρ²)
+                            "trace": linear_stats["trace"][linear_offset],  # 迹 Tr(ρ)（应接近 1）
                             "residual_norm": float(np.linalg.norm(linear_result.residuals))  # 残差范数 ||Ax-b||
     
                             if linear_result.residuals.size
@@ -964,11 +1053,11 @@ class ReconstructionController:
     
                             # 📝 P1 新增字段（阶段 3.1）
                             "rank": linear_result.rank,                         # 矩阵秩
-                            "min_eigenvalue": float(np.min(linear_result.density.eigenvalues)),  # 最小特征值
-                            "max_eigenvalue": float(np.max(linear_result.density.eigenvalues)),  # 最大特征值
+                            "min_eigenvalue": linear_stats["min_eigenvalue"][linear_offset],  # 最小特征值
+                            "max_eigenvalue": linear_stats["max_eigenvalue"][linear_offset],  # 最大特征值
                             # 📝 P2 新增字段（阶段 3.1）
                             "condition_number": condition_number(linear_result.singular_values),  # 条件数
-                            "eigenvalue_entropy": eigenvalue_entropy(linear_result.density.eigenvalues),  # 特征值熵
+                            "eigenvalue_entropy": linear_stats["eigenvalue_entropy"][linear_offset],  # 特征值熵
     
                         },
     
@@ -1091,15 +1180,7 @@ class ReconstructionController:
 
                 if wls is not None:
     
-                    # 智能初始化：如果线性结果存在，用作 MLE 的初始点（加速收敛）
-                    initial_density = (
-    
-                        linear_result.density.matrix if linear_result is not None else None
-    
-                    )
-                    
-                    
-    
+                    # 智能初始化：如果线性结果存在，直接交给 WLS 作为初始点（避免重复线性求解）
                     # 执行 WLS 重构（迭代优化，保证正定性）
                     self._check_cancellation(
                         cancel_event,
@@ -1110,13 +1191,36 @@ class ReconstructionController:
                         total_steps=total_steps,
                     )
                     self._logger.debug("Running WLS for sample %s/%s.", idx + 1, sample_count)
-                    wls_result = wls.reconstruct_with_details(
+                    if config.wls_batched:
+                        if wls_batch is None or idx >= wls_batch_start + wls_batch.num_samples:
+                            wls_batch_start = idx
+                            stop = min(idx + _WLS_BATCH_CHUNK, sample_count)
+                            initial_densities = None
+                            if linear_batch is not None:
+                                # WLS 块不跨越当前线性块，初始点直接取自线性块的对应切片
+                                stop = min(stop, linear_batch_start + linear_batch.num_samples)
+                                initial_densities = linear_batch.densities[
+                                    idx - linear_batch_start:stop - linear_batch_start
+                                ]
+                            wls_batch = wls.reconstruct_batch(
+                                data[:, idx:stop],
+                                initial_densities=initial_densities,
+                            )
+                            wls_stats = _stack_metrics(wls_batch.density_batch)
+                        offset = idx - wls_batch_start
+                        wls_result = wls_batch.result_at(offset)
+                        sample_stats = {key: values[offset] for key, values in wls_stats.items()}
+                    else:
+                        wls_result = wls.reconstruct_with_details(
     
-                        probs,
+                            probs,
     
-                        initial_density=initial_density,  # 初始猜测（None 则用单位矩阵）
+                            linear_result=linear_result,  # 已有线性结果作为初始猜测（None 则由 WLS 自行线性初始化）
+                            warm_start=warm_cache.lookup("wls", probs),  # 相邻样本的解（策略为 none 时为 None）
     
-                    )
+                        )
+                        warm_cache.record("wls", probs, wls_result.rho_matrix_raw)
+                        sample_stats = _density_metrics(wls_result.density)
     
                     
     
@@ -1133,8 +1237,8 @@ class ReconstructionController:
                         metrics={
     
                             # 原有字段
-                            "purity": wls_result.density.purity,             # 纯度 Tr(ρ²)
-                            "trace": float(np.real(wls_result.density.trace)),  # 迹 Tr(ρ)
+                            "purity": sample_stats["purity"],             # 纯度 Tr(ρ²)
+                            "trace": sample_stats["trace"],  # 迹 Tr(ρ)
                             "objective": wls_result.objective_value,         # 目标函数值（χ²）
                             # 📝 P1 新增字段（阶段 3.1）
                             "n_iterations": wls_result.n_iterations,         # 优化器迭代次数
@@ -1144,10 +1248,11 @@ class ReconstructionController:
 
                             "status": wls_result.status,                     # 优化器状态码
 
-                            "min_eigenvalue": float(np.min(wls_result.density.eigenvalues)),  # 最小特征值
-                            "max_eigenvalue": float(np.max(wls_result.density.eigenvalues)),  # 最大特征值
+                            "min_eigenvalue": sample_stats["min_eigenvalue"],  # 最小特征值
+                            "max_eigenvalue": sample_stats["max_eigenvalue"],  # 最大特征值
                             # 📝 P2 新增字段（阶段 3.1）
-                            "eigenvalue_entropy": eigenvalue_entropy(wls_result.density.eigenvalues),  # 特征值熵
+                            "eigenvalue_entropy": sample_stats["eigenvalue_entropy"],  # 特征值熵
+                            "warm_started": wls_result.warm_started,         # 是否采用了热启动初始点
     
                         },
     
@@ -1227,6 +1332,8 @@ class ReconstructionController:
     
                         # 📝 P2 新增字段（阶段 3.1）
                         "eigenvalue_entropy": record.metrics["eigenvalue_entropy"],
+
+                        "warm_started": record.metrics["warm_started"],
     
                     }
     
@@ -1281,7 +1388,10 @@ class ReconstructionController:
                         total_steps=total_steps,
                     )
                     self._logger.debug("Running RρR Strict for sample %s/%s.", idx + 1, sample_count)
-                    rhor_result = rhor.reconstruct_with_details(probs)
+                    rhor_result = rhor.reconstruct_with_details(
+                        probs, initial_sigma=warm_cache.lookup("rhor", probs)
+                    )
+                    warm_cache.record("rhor", probs, rhor_result.sigma_matrix)
 
                     # 创建持久化记录
                     record = _create_record(
@@ -1299,6 +1409,7 @@ class ReconstructionController:
                             "max_eigenvalue": float(np.max(rhor_result.density.eigenvalues)),
                             "eigenvalue_entropy": eigenvalue_entropy(rhor_result.density.eigenvalues),
                             "support_dim": rhor_result.diagnostics.get("support_dim", -1),
+                            "warm_started": rhor_result.warm_started,
                         },
                         metadata=metadata,
                     )
@@ -1346,6 +1457,7 @@ class ReconstructionController:
                         "max_eigenvalue": record.metrics["max_eigenvalue"],
                         "eigenvalue_entropy": record.metrics["eigenvalue_entropy"],
                         "support_dim": record.metrics["support_dim"],
+                        "warm_started": record.metrics["warm_started"],
                     }
 
                     if bell_metrics_rhor:
@@ -1377,6 +1489,103 @@ class ReconstructionController:
                         completed_steps=completed_steps,
                         total_steps=total_steps,
                     )
+
+                # ----- [3.4] APG 最大似然重构（如果启用） -----
+
+                if apg is not None:
+                    self._check_cancellation(
+                        cancel_event,
+                        stage="apg",
+                        total_samples=sample_count,
+                        sample_index=idx,
+                        completed_steps=completed_steps,
+                        total_steps=total_steps,
+                    )
+                    self._logger.debug("Running APG MLE for sample %s/%s.", idx + 1, sample_count)
+                    apg_result = apg.reconstruct_with_details(probs, linear_result=linear_result)
+
+                    record = _create_record(
+                        method="apg",
+                        dimension=dimension,
+                        probabilities=apg_result.expected_probabilities,
+                        density_matrix=apg_result.density.matrix,
+                        metrics={
+                            "purity": apg_result.density.purity,
+                            "trace": float(np.real(apg_result.density.trace)),
+                            # 按组条件似然 Σ f log(q/Q)，与 RρR 的 Ẽ 归一化似然不可比，单独成列
+                            "grouped_log_likelihood": apg_result.log_likelihood,
+                            "iterations": apg_result.n_iterations,
+                            "n_evaluations": apg_result.n_function_evaluations,
+                            "converged": apg_result.converged,
+                            "min_eigenvalue": float(np.min(apg_result.density.eigenvalues)),
+                            "max_eigenvalue": float(np.max(apg_result.density.eigenvalues)),
+                            "eigenvalue_entropy": eigenvalue_entropy(apg_result.density.eigenvalues),
+                        },
+                        metadata=metadata,
+                    )
+
+                    bell_metrics_apg = None
+                    if config.analyze_bell and dimension == 4:
+                        try:
+                            bell_metrics_apg = analyze_density_matrix(
+                                apg_result.density,
+                                dimension=dimension,
+                            ).to_dict()
+                            record.metrics.update({
+                                f"bell_{key}": value
+                                for key, value in bell_metrics_apg.items()
+                                if key not in {"dimension", "local_dimension"}
+                            })
+                            record.metrics["bell_dimension"] = bell_metrics_apg["dimension"]
+                            record.metrics["bell_local_dimension"] = bell_metrics_apg["local_dimension"]
+                        except Exception:
+                            bell_metrics_apg = None
+
+                    repo.save(record)
+
+                    summary_entry = {
+                        "sample": idx,
+                        "method": "apg",
+                        "design": getattr(config, "design", "mub"),
+                        "purity": record.metrics["purity"],
+                        "trace": record.metrics["trace"],
+                        "grouped_log_likelihood": record.metrics["grouped_log_likelihood"],
+                        "iterations": record.metrics["iterations"],
+                        "n_evaluations": record.metrics["n_evaluations"],
+                        "converged": record.metrics["converged"],
+                        "min_eigenvalue": record.metrics["min_eigenvalue"],
+                        "max_eigenvalue": record.metrics["max_eigenvalue"],
+                        "eigenvalue_entropy": record.metrics["eigenvalue_entropy"],
+                    }
+                    if bell_metrics_apg:
+                        summary_entry.update({
+                            f"bell_{key}": value
+                            for key, value in bell_metrics_apg.items()
+                            if key not in {"dimension", "local_dimension"}
+                        })
+                        summary_entry["bell_dimension"] = bell_metrics_apg["dimension"]
+                        summary_entry["bell_local_dimension"] = bell_metrics_apg["local_dimension"]
+                    summary_rows.append(summary_entry)
+
+                    completed_steps += 1
+                    self._emit_progress(
+                        progress_cb,
+                        stage="apg",
+                        total_samples=sample_count,
+                        sample_index=idx,
+                        method="apg",
+                        message=f"APG 重构完成 {idx + 1}/{sample_count}",
+                        completed_steps=completed_steps,
+                        total_steps=total_steps,
+                    )
+                    self._check_cancellation(
+                        cancel_event,
+                        stage="apg",
+                        total_samples=sample_count,
+                        sample_index=idx,
+                        completed_steps=completed_steps,
+                        total_steps=total_steps,
+                    )
     
     
     
@@ -1418,6 +1627,15 @@ class ReconstructionController:
     
                     # MLE 专属
                     "objective", "n_iterations", "n_evaluations", "success", "status",
+
+                    # RρR 专属
+                    "log_likelihood", "iterations", "converged",
+
+                    # APG 专属（按组条件似然）
+                    "grouped_log_likelihood",
+
+                    # 热启动
+                    "warm_started",
     
                     # 通用扩展字段
                     "min_eigenvalue", "max_eigenvalue",
@@ -1678,12 +1896,12 @@ def _normalize_methods(methods: Sequence[str]) -> Tuple[str, ...]:
         tokens = {m for m in methods}
     
     
-    # 展开 "both" 为所有允许的方法
+    # 展开 "both" 为默认方法集合
     if "both" in tokens:
 
         tokens.discard("both")
 
-        tokens.update(_ALLOWED_METHODS)
+        tokens.update(_BOTH_METHODS)
     
     
     # 验证所有方法都在允许列表中
@@ -1878,6 +2096,34 @@ def _infer_dimension(row_count: int) -> int:
 def _infer_dimension_general(row_count: int) -> int:
     """Backward alias of _infer_dimension for updated logic."""
     return _infer_dimension(row_count)
+
+
+def _stack_metrics(batch: DensityBatch) -> dict:
+    """对密度矩阵堆栈一次性计算记录所需的逐样本指标，返回 {指标名: (N,) 数组}。"""
+
+    eigenvalues = batch.eigenvalues
+    return {
+        "purity": batch.purities,
+        "trace": np.real(batch.traces),
+        "min_eigenvalue": eigenvalues.min(axis=1),
+        "max_eigenvalue": eigenvalues.max(axis=1),
+        "eigenvalue_entropy": batch.entropies(),
+    }
+
+
+def _density_metrics(density: DensityMatrix) -> dict:
+    """单个密度矩阵的同名指标（特征值只取一次，复用其缓存的谱分解）。"""
+
+    eigenvalues = density.eigenvalues
+    return {
+        "purity": density.purity,
+        "trace": float(np.real(density.trace)),
+        "min_eigenvalue": float(np.min(eigenvalues)),
+        "max_eigenvalue": float(np.max(eigenvalues)),
+        "eigenvalue_entropy": eigenvalue_entropy(eigenvalues),
+    }
+
+
 def _create_record(
 
     method: str,
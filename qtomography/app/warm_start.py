@@ -0,0 +1,68 @@
+"""批量重构中的跨样本热启动缓存。"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+import numpy as np
+
+__all__ = ["WARM_START_POLICIES", "WarmStartCache"]
+
+
+# none：不热启动；previous：上一个样本的解；nearest：缓存中观测概率最接近的样本的解
+WARM_START_POLICIES = ("none", "previous", "nearest")
+
+
+class WarmStartCache:
+    """按重构方法保存最近样本的解，供下一个样本作为初始点。
+
+    参数:
+        policy: 热启动策略，取值见 ``WARM_START_POLICIES``。
+        capacity: nearest 策略下每种方法保留的最近样本数（previous 策略只保留 1 个）。
+    """
+
+    def __init__(self, policy: str = "none", *, capacity: int = 32) -> None:
+        policy = policy.lower()
+        if policy not in WARM_START_POLICIES:
+            raise ValueError(f"warm_start must be one of {WARM_START_POLICIES}, got {policy!r}")
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.policy = policy
+        self.capacity = capacity if policy == "nearest" else 1
+        self._entries: Dict[str, Deque[Tuple[np.ndarray, np.ndarray]]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.policy != "none"
+
+    def lookup(self, method: str, probabilities: np.ndarray) -> Optional[np.ndarray]:
+        """返回 ``method`` 的热启动解；无可用缓存或策略为 none 时返回 None。"""
+
+        entries = self._entries.get(method)
+        if not self.enabled or not entries:
+            return None
+        if self.policy == "previous":
+            return entries[-1][1]
+        key = self._key(probabilities)
+        distances = [np.linalg.norm(key - stored) if stored.shape == key.shape else np.inf for stored, _ in entries]
+        best = int(np.argmin(distances))
+        return entries[best][1] if np.isfinite(distances[best]) else None
+
+    def record(self, method: str, probabilities: np.ndarray, solution: np.ndarray) -> None:
+        """记录样本 ``probabilities`` 上 ``method`` 的解。"""
+
+        if not self.enabled:
+            return
+        entries = self._entries.setdefault(method, deque(maxlen=self.capacity))
+        entries.append((self._key(probabilities), np.array(solution, copy=True)))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @staticmethod
+    def _key(probabilities: np.ndarray) -> np.ndarray:
+        # 以总和归一化，使计数与概率输入在同一尺度上比较
+        vector = np.asarray(probabilities, dtype=float).reshape(-1)
+        total = float(np.sum(vector))
+        return vector / total if total > 0 else vector.copy()
@@ -71,8 +71,8 @@ def build_parser() -> argparse.ArgumentParser:
     )
     reconstruct.add_argument(
         "--method",
-        choices=["linear", "wls", "rhor", "both"],
-        help="要执行的重构算法，可选 linear、wls、rhor 或 both（both 表示 linear+wls）。",
+        choices=["linear", "wls", "rhor", "apg", "both"],
+        help="要执行的重构算法，可选 linear、wls、rhor、apg 或 both（both 表示 linear+wls）。",
     )
     reconstruct.add_argument(
         "--design",
@@ -109,12 +109,33 @@ def build_parser() -> argparse.ArgumentParser:
         type=float,
         help="WLS 优化器函数容差 ftol（默认 1e-9）。",
     )
+    reconstruct.add_argument(
+        "--apg-max-iterations",
+        type=int,
+        help="APG 最大似然重构的最大迭代次数（默认 2000）。",
+    )
     reconstruct.add_argument(
         "--bell",
         action=argparse.BooleanOptionalAction,
         default=None,
         help="开启或关闭 Bell 态分析。",
     )
+    reconstruct.add_argument(
+        "--warm-start",
+        choices=["none", "previous", "nearest"],
+        help="跨样本热启动策略（默认 none）。",
+    )
+    reconstruct.add_argument(
+        "--rhor-acceleration",
+        choices=["none", "momentum"],
+        help="RρR 迭代加速方式（默认 none）。",
+    )
+    reconstruct.add_argument(
+        "--wls-batched",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="开启或关闭整批样本的批量 WLS 求解。",
+    )
     reconstruct.set_defaults(func=_cmd_reconstruct)
 
     # ========== 子命令 2: summarize（结果汇总）==========
@@ -263,9 +284,14 @@ def _cmd_reconstruct(args: argparse.Namespace) -> int:
     wls_max_iterations = _pick(args.mle_max_iterations, 'wls_max_iterations', 2000)
     wls_min_expected_clip = _pick(args.wls_min_expected_clip, 'wls_min_expected_clip', 1e-12)
     wls_optimizer_ftol = _pick(args.wls_ftol, 'wls_optimizer_ftol', 1e-9)
+    apg_max_iterations = _pick(args.apg_max_iterations, 'apg_max_iterations', 2000)
     tolerance = _pick(None, 'tolerance', 1e-9)
     cache_projectors = base_config.cache_projectors if base_config else True
+    cache_max_bytes = _pick(None, 'cache_max_bytes')
     analyze_bell = args.bell if args.bell is not None else (base_config.analyze_bell if base_config else False)
+    warm_start = _pick(args.warm_start, 'warm_start', 'none')
+    rhor_acceleration = _pick(args.rhor_acceleration, 'rhor_acceleration', 'none')
+    wls_batched = args.wls_batched if args.wls_batched is not None else (base_config.wls_batched if base_config else False)
 
     config = ReconstructionConfig(
         input_path=input_path,
@@ -280,8 +306,13 @@ def _cmd_reconstruct(args: argparse.Namespace) -> int:
         wls_max_iterations=wls_max_iterations,
         wls_min_expected_clip=wls_min_expected_clip,
         wls_optimizer_ftol=wls_optimizer_ftol,
+        apg_max_iterations=apg_max_iterations,
         tolerance=tolerance,
         cache_projectors=cache_projectors,
+        cache_max_bytes=cache_max_bytes,
+        wls_batched=wls_batched,
+        warm_start=warm_start,
+        rhor_acceleration=rhor_acceleration,
         analyze_bell=analyze_bell,
     )
 
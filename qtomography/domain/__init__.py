@@ -1,6 +1,7 @@
 ﻿"""qtomography.domain 模块统一导出核心类。"""
 
 from .density import DensityMatrix
+from .density_batch import DensityBatch
 from .projectors import ProjectorSet
 from .spectral_decomposition import (
     SpectralDecompositionResult,
@@ -10,12 +11,17 @@ from .theoretical_state import (
     TheoreticalStateResult,
     generate_theoretical_state,
 )
-from .reconstruction.linear import LinearReconstructor, LinearReconstructionResult
+from .reconstruction.linear import (
+    LinearBatchReconstructionResult,
+    LinearReconstructor,
+    LinearReconstructionResult,
+)
 from .reconstruction.mle import MLEReconstructor, MLEReconstructionResult
 from .persistence.result_repository import ReconstructionRecord, ResultRepository
 
 __all__ = [
     "DensityMatrix",
+    "DensityBatch",
     "ProjectorSet",
     "SpectralDecompositionResult",
     "perform_spectral_decomposition",
@@ -23,6 +29,7 @@ __all__ = [
     "generate_theoretical_state",
     "LinearReconstructor",
     "LinearReconstructionResult",
+    "LinearBatchReconstructionResult",
     "MLEReconstructor",
     "MLEReconstructionResult",
     "ReconstructionRecord",
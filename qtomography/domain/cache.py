@@ -0,0 +1,190 @@
+"""按字节预算淘汰的 LRU 缓存（投影算符与派生算子缓存共用）。"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Hashable, Iterator, Optional, TypeVar
+
+import numpy as np
+
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """缓存命中 / 未命中 / 淘汰计数与当前占用。"""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    current_bytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": self.entries,
+            "current_bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hit_rate": self.hit_rate,
+        }
+
+
+def array_nbytes(value: Any) -> int:
+    """估算缓存值的字节数：ndarray / 具有 nbytes 属性的对象 / 其元组或列表之和。"""
+
+    if value is None:
+        return 0
+    if isinstance(value, (tuple, list)):
+        return int(sum(array_nbytes(item) for item in value))
+    nbytes = getattr(value, "nbytes", None)
+    if nbytes is not None:
+        return int(nbytes)
+    return int(np.asarray(value).nbytes)
+
+
+class ByteBudgetLRU(Generic[V]):
+    """按字节预算淘汰的线程安全 LRU 缓存。
+
+    每个条目的大小在插入时由 ``size_of`` 计算一次并记账；总量超过 ``max_bytes``
+    时从最久未使用端淘汰，但始终保留最近插入的条目（单个超预算条目仍可复用）。
+    淘汰（不含 clear / 覆盖写入）时调用 ``on_evict(key, value)``。
+
+    参数:
+        max_bytes: 字节预算（正整数）。
+        size_of: 条目大小函数，默认 ``array_nbytes``。
+        on_evict: 可选的淘汰回调。
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        *,
+        size_of: Callable[[V], int] = array_nbytes,
+        on_evict: Optional[Callable[[Hashable, V], None]] = None,
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes 必须为正数")
+        self.max_bytes = int(max_bytes)
+        self.current_bytes = 0
+        self._size_of = size_of
+        self._on_evict = on_evict
+        self._entries: "OrderedDict[Hashable, tuple[V, int]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """返回缓存值并标记为最近使用；未命中时返回 default。"""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self._misses += 1
+                return default
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return item[0]
+
+    def put(self, key: Hashable, value: V) -> None:
+        """写入（或覆盖）条目，随后按预算淘汰。"""
+        size = int(self._size_of(value))
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+            evicted = self._evict()
+        self._notify(evicted)
+
+    def pop(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """移除并返回条目（不计为淘汰，不触发回调）。"""
+        with self._lock:
+            item = self._entries.pop(key, None)
+            if item is None:
+                return default
+            self.current_bytes -= item[1]
+            return item[0]
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """移除所有键满足 predicate 的条目，返回移除个数。"""
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                self.current_bytes -= self._entries.pop(key)[1]
+            return len(keys)
+
+    def resize(self, max_bytes: int) -> None:
+        """调整字节预算，超出部分立即淘汰。"""
+        if max_bytes <= 0:
+            raise ValueError("max_bytes 必须为正数")
+        with self._lock:
+            self.max_bytes = int(max_bytes)
+            evicted = self._evict()
+        self._notify(evicted)
+
+    def clear(self) -> None:
+        """清空条目（统计计数保留，见 reset_stats）。"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                current_bytes=self.current_bytes,
+                max_bytes=self.max_bytes,
+            )
+
+    def keys(self) -> list:
+        """按最久未使用到最近使用的顺序返回键的快照。"""
+        with self._lock:
+            return list(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.keys())
+
+    # ------------------------------------------------------------------
+    def _evict(self) -> list:
+        # 淘汰最久未使用的条目，但始终保留最近插入的条目（调用方持有锁）
+        evicted = []
+        while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+            key, (value, size) = self._entries.popitem(last=False)
+            self.current_bytes -= size
+            self._evictions += 1
+            evicted.append((key, value))
+        return evicted
+
+    def _notify(self, evicted: list) -> None:
+        # 回调在锁外执行，允许回调内部访问其他缓存
+        if self._on_evict is not None:
+            for key, value in evicted:
+                self._on_evict(key, value)
+
+
+__all__ = ["ByteBudgetLRU", "CacheStats", "array_nbytes"]
@@ -56,6 +56,20 @@ class DensityMatrix:
     
     # 类级默认参数（子类可覆盖)容差敏感度调整系数
     k_factor: float = 50.0
+
+    # 固定实例布局：大量记录 / 批量结果逐样本取出时减少每个实例的内存与属性访问开销
+    __slots__ = ("_matrix_data", "_spectral_cache", "_sqrt_cache", "tolerance", "enforce", "strict", "warn")
+
+    @property
+    def _matrix(self) -> np.ndarray:
+        """内部矩阵存储；重新赋值时自动失效谱分解缓存（原地修改元素不会失效）。"""
+        return self._matrix_data
+
+    @_matrix.setter
+    def _matrix(self, value: np.ndarray) -> None:
+        self._matrix_data = value
+        self._spectral_cache = None
+        self._sqrt_cache = None
     
     # ============================================================================
     # 2. 构造与初始化
@@ -136,8 +150,10 @@ class DensityMatrix:
     
     @property
     def matrix(self) -> np.ndarray:
-        """获取密度矩阵数据"""
-        return self._matrix.copy()
+        """获取密度矩阵数据（零拷贝只读视图，需要修改时请 .copy()）"""
+        view = self._matrix.view()
+        view.flags.writeable = False
+        return view
     
     @property
     def dimension(self) -> int:
@@ -157,14 +173,8 @@ class DensityMatrix:
     @property
     def eigenvalues(self) -> np.ndarray:
         """获取密度矩阵的特征值（按降序排列）"""
-        # 确保 Hermitian 性
-        H = (self._matrix + self._matrix.conj().T) / 2
-        
-        # 统一特征值分解（只取特征值）
-        eigenvals, _ = type(self)._heig(H)
-        
-        # 自适应容差
-        tol = self._auto_tol_inst(H)
+        # 缓存的谱分解（Hermitian 化 + 自适应容差）
+        eigenvals, _, tol = self._spectrum()
         
         # 裁剪容差内的负特征值
         eigenvals = np.where(eigenvals < tol, 0.0, eigenvals)
@@ -208,15 +218,14 @@ class DensityMatrix:
         Returns:
             是否为正半定矩阵
         """
-        H = (self._matrix + self._matrix.conj().T) / 2
-        vals, _ = type(self)._heig(H)
+        vals, _, auto_tol = self._spectrum()
         # 绝对阈值
         tol_eff = 0.0 if tol is None else float(tol)
         if use_auto:
-            tol_eff = max(tol_eff, self._auto_tol_inst(H))
+            tol_eff = max(tol_eff, auto_tol)
         elif tol is None:
             # 外部没给，但调用者禁用了自适应，为了避免不确定，退回自适应
-            tol_eff = self._auto_tol_inst(H)
+            tol_eff = auto_tol
         return bool(vals.min() >= -tol_eff)
     
     def is_normalized(self, tol: Optional[float] = None, *, use_auto: bool = True) -> bool:
@@ -232,13 +241,13 @@ class DensityMatrix:
         Returns:
             是否归一化
         """
-        H = (self._matrix + self._matrix.conj().T) / 2
+        _, _, auto_tol = self._spectrum()
         tr_real = float(np.trace(self._matrix).real)
         tol_eff = 0.0 if tol is None else float(tol)
         if use_auto:
-            tol_eff = max(tol_eff, self._auto_tol_inst(H))
+            tol_eff = max(tol_eff, auto_tol)
         elif tol is None:
-            tol_eff = self._auto_tol_inst(H)
+            tol_eff = auto_tol
         return bool(abs(tr_real - 1.0) <= tol_eff)
     
     def is_physical(self, tol: Optional[float] = None, *, use_auto: bool = True) -> bool:
@@ -254,15 +263,14 @@ class DensityMatrix:
         Returns:
             是否满足所有物理条件
         """
-        H = (self._matrix + self._matrix.conj().T) / 2
-        vals, _ = type(self)._heig(H)
+        vals, _, auto_tol = self._spectrum()
         tr_real = float(np.trace(self._matrix).real)
 
         tol_eff = 0.0 if tol is None else float(tol)
         if use_auto:
-            tol_eff = max(tol_eff, self._auto_tol_inst(H))
+            tol_eff = max(tol_eff, auto_tol)
         elif tol is None:
-            tol_eff = self._auto_tol_inst(H)
+            tol_eff = auto_tol
 
         return bool((vals.min() >= -tol_eff) and (abs(tr_real - 1.0) <= tol_eff))
     
@@ -277,15 +285,14 @@ class DensityMatrix:
         Returns:
             包含物理性指标的字典
         """
-        H = (self._matrix + self._matrix.conj().T) / 2
-        vals, _ = type(self)._heig(H)
+        vals, _, auto_tol = self._spectrum()
         
         # 使用与检查方法一致的容差处理逻辑
         tol_eff = 0.0 if tol is None else float(tol)
         if use_auto:
-            tol_eff = max(tol_eff, self._auto_tol_inst(H))
+            tol_eff = max(tol_eff, auto_tol)
         elif tol is None:
-            tol_eff = self._auto_tol_inst(H)
+            tol_eff = auto_tol
         
         # Hermitian性相对残差
         herm_res = np.linalg.norm(self._matrix - self._matrix.conj().T) / (np.linalg.norm(self._matrix) + 1e-30)
@@ -336,7 +343,9 @@ class DensityMatrix:
     
     @classmethod
     def project_to_physical(cls, matrix: np.ndarray, *, tolerance: float = 1e-10, 
-                           return_diag: bool = False) -> Union[np.ndarray, Tuple[np.ndarray, dict]]:
+                           return_diag: bool = False,
+                           method: Literal["clip", "simplex"] = "clip",
+                           return_eig: bool = False) -> Union[np.ndarray, tuple]:
         """
         强制投影到物理密度矩阵空间。
         
@@ -349,27 +358,38 @@ class DensityMatrix:
             matrix: 输入矩阵
             tolerance: 数值容差
             return_diag: 是否返回诊断信息
+            method: 谱的处理方式
+                - "clip": 负特征值置零后按和重新归一化（默认，向后兼容）
+                - "simplex": 谱的欧氏单纯形投影（Smolin–Gambetta–Smith），
+                  即 Frobenius 范数下最近的物理密度矩阵
+            return_eig: 是否同时返回结果的特征分解 (eigenvals, eigenvecs)（升序），
+                可直接作为 from_trusted(..., eig=...) 传入，免去再次 eigh
             
         Returns:
-            物理化的密度矩阵，或 (矩阵, 诊断信息) 元组
+            物理化的密度矩阵；按需附带特征分解与诊断信息，
+            即 (矩阵, eig)、(矩阵, 诊断信息) 或 (矩阵, eig, 诊断信息)
         """
+        if method not in ("clip", "simplex"):
+            raise ValueError(f"Unsupported projection method: {method!r}")
         mat = np.asarray(matrix, dtype=complex)
         
         # Hermitian 化
         H = (mat + mat.conj().T) / 2
         
-        # 统一特征值分解
-        vals, vecs = cls._heig(H)
-        
-        # 强制：所有负特征值→0
-        vals = np.where(vals < 0.0, 0.0, vals)
+        # 统一特征值分解（仅一次；诊断信息复用输入谱）
+        vals_in, vecs = cls._heig(H)
         
         # 自适应容差（使用类方法）
         tol = cls._auto_tol(H, tolerance)
         
-        # 归一化
-        s = float(vals.sum())
-        vals = (np.ones_like(vals)/len(vals)) if s <= tol else (vals/s)
+        if method == "simplex":
+            vals = project_to_simplex(vals_in)
+        else:
+            # 强制：所有负特征值→0
+            vals = np.where(vals_in < 0.0, 0.0, vals_in)
+            # 归一化
+            s = float(vals.sum())
+            vals = (np.ones_like(vals)/len(vals)) if s <= tol else (vals/s)
         
         # 列缩放重构（避免 np.diag 临时阵）
         rho = (vecs * vals) @ vecs.conj().T
@@ -377,20 +397,136 @@ class DensityMatrix:
         
         # 最终归一化
         tr = float(np.trace(rho).real)
-        rho = (np.eye(len(vals), dtype=complex)/len(vals)) if tr <= 0 else (rho / tr)
+        if tr <= 0:
+            rho = np.eye(len(vals), dtype=complex)/len(vals)
+            vals = np.full(len(vals), 1.0/len(vals))
+        else:
+            rho = rho / tr
+            vals = vals / tr
         
-        if not return_diag:
-            return rho
-            
-        # 返回诊断信息（统一使用类方法）
-        vals_in, _ = cls._heig(H)
-        min_eig_in = float(vals_in.min())
-        return rho, {
-            "min_eig_in": min_eig_in,
-            "tol": float(tol),
-            "projection_applied": min_eig_in < 0
-        }
-    
+        out: tuple = (rho,)
+        if return_eig:
+            out += ((vals, vecs),)
+        if return_diag:
+            min_eig_in = float(vals_in.min())
+            out += ({
+                "min_eig_in": min_eig_in,
+                "tol": float(tol),
+                "projection_applied": min_eig_in < 0
+            },)
+        return out[0] if len(out) == 1 else out
+
+    @classmethod
+    def project_stack_to_physical(cls, matrices: np.ndarray, *, tolerance: float = 1e-10,
+                                  method: Literal["clip", "simplex"] = "simplex") -> np.ndarray:
+        """
+        project_to_physical 的批量版本：对 (N, n, n) 堆栈做一次批量 np.linalg.eigh。
+
+        Args:
+            matrices: (N, n, n) 矩阵堆栈
+            tolerance: 数值容差（"clip" 下判定谱和退化）
+            method: 谱的处理方式，含义同 project_to_physical（默认 "simplex"）
+
+        Returns:
+            (N, n, n) 物理密度矩阵堆栈
+        """
+        if method not in ("clip", "simplex"):
+            raise ValueError(f"Unsupported projection method: {method!r}")
+        stack = np.asarray(matrices, dtype=complex)
+        if stack.ndim != 3 or stack.shape[1] != stack.shape[2]:
+            raise ValueError("矩阵堆栈形状必须为 (N, n, n)")
+
+        n = stack.shape[1]
+        H = (stack + np.conj(np.swapaxes(stack, 1, 2))) / 2
+        vals, vecs = np.linalg.eigh(H)
+        if method == "simplex":
+            vals = project_to_simplex(vals)
+        else:
+            eps = np.finfo(float).eps
+            norm2 = np.max(np.abs(vals), axis=1)
+            tol = np.maximum(float(tolerance), float(cls.k_factor) * n * eps * np.maximum(1.0, norm2))
+            vals = np.where(vals < 0.0, 0.0, vals)
+            sums = vals.sum(axis=1)
+            degenerate = sums <= tol
+            vals = np.where(degenerate[:, None], 1.0 / n, vals / np.where(degenerate, 1.0, sums)[:, None])
+        return cls._compose_stack(vecs, vals)
+
+    @staticmethod
+    def _compose_stack(vecs: np.ndarray, vals: np.ndarray) -> np.ndarray:
+        """由批量特征分解重构 (N, n, n) 堆栈并逐个归一化迹（迹非正时退化为 I/n）。"""
+        n = vecs.shape[1]
+        rho = (vecs * vals[:, None, :]) @ np.conj(np.swapaxes(vecs, 1, 2))
+        rho = (rho + np.conj(np.swapaxes(rho, 1, 2))) / 2
+        tr_rho = np.real(np.trace(rho, axis1=1, axis2=2))
+        bad = tr_rho <= 0
+        rho = rho / np.where(bad, 1.0, tr_rho)[:, None, None]
+        if np.any(bad):
+            rho[bad] = np.eye(n, dtype=complex) / n
+        return rho
+
+    @classmethod
+    def physicalize_stack(cls, matrices: np.ndarray, *, tolerance: float = 1e-10,
+                          enforce: Literal["within_tol", "project", "none"] = "within_tol",
+                          strict: bool = False, warn: bool = True,
+                          projection: Literal["clip", "simplex"] = "clip") -> np.ndarray:
+        """
+        对 (N, n, n) 矩阵堆栈批量执行物理化，语义与逐个构造 DensityMatrix 一致。
+
+        使用 np.linalg.eigh 对整个堆栈做一次批量特征值分解，避免逐样本构造对象。
+        显著非物理输入在整批上汇总为一条警告（或在 strict 模式下抛出异常）。
+
+        Args:
+            matrices: (N, n, n) 矩阵堆栈
+            tolerance: 数值容差
+            enforce: 物理化策略（与构造函数相同）
+            strict: 是否对显著非物理输入抛出异常
+            warn: 是否对显著非物理输入发出警告
+            projection: enforce="project" 时谱的处理方式（见 project_to_physical 的 method）
+
+        Returns:
+            (N, n, n) 物理化后的密度矩阵堆栈
+        """
+        stack = np.asarray(matrices, dtype=complex)
+        if stack.ndim != 3 or stack.shape[1] != stack.shape[2]:
+            raise ValueError("矩阵堆栈形状必须为 (N, n, n)")
+        if enforce == "none":
+            return stack.copy()
+        if enforce == "project":
+            return cls.project_stack_to_physical(stack, tolerance=tolerance, method=projection)
+        if enforce != "within_tol":
+            raise ValueError(f"Unsupported enforce mode: {enforce!r}")
+
+        n = stack.shape[1]
+        H = (stack + np.conj(np.swapaxes(stack, 1, 2))) / 2
+        vals, vecs = np.linalg.eigh(H)
+
+        # 逐样本自适应容差：Hermitian 矩阵的谱范数即最大特征值绝对值
+        eps = np.finfo(float).eps
+        norm2 = np.max(np.abs(vals), axis=1)
+        tol = np.maximum(float(tolerance), float(cls.k_factor) * n * eps * np.maximum(1.0, norm2))
+
+        diff = stack - np.conj(np.swapaxes(stack, 1, 2))
+        herm_res = (np.linalg.norm(diff, axis=(1, 2))
+                    / (np.linalg.norm(stack, axis=(1, 2)) + 1e-30))
+        tr = np.trace(stack, axis1=1, axis2=2)
+        min_eig = vals[:, 0]
+        off = ((herm_res > 1e-6) | (np.abs(tr.real - 1.0) > 1e-6) | (np.abs(tr.imag) > 1e-9)
+               | ((min_eig < -10 * tol) & ~np.isclose(min_eig, 0.0, atol=tol)))
+        if np.any(off):
+            msg = (f"[DensityMatrix] {int(np.count_nonzero(off))}/{stack.shape[0]} 个输入偏离物理约束; "
+                   f"若需强制投影请使用 enforce='project' 或 project_to_physical().")
+            if strict:
+                raise ValueError(msg)
+            if warn:
+                warnings.warn(msg, RuntimeWarning, stacklevel=2)
+        vals = np.where(vals < tol[:, None], 0.0, vals)
+
+        sums = vals.sum(axis=1)
+        degenerate = sums <= tol
+        vals = np.where(degenerate[:, None], 1.0 / n, vals / np.where(degenerate, 1.0, sums)[:, None])
+
+        return cls._compose_stack(vecs, vals)
+
     # ============================================================================
     # 6. 数值计算方法
     # ============================================================================
@@ -401,6 +537,10 @@ class DensityMatrix:
         
         对应MATLAB的fidelity.m函数
         公式：F(ρ₁, ρ₂) = [Tr(√(√ρ₁ ρ₂ √ρ₁))]²
+        
+        任一方为秩 1（|ψ⟩⟨ψ|）时直接取 F = ⟨ψ|ρ|ψ⟩；一般情形复用缓存的 √ρ₁，
+        只求 √ρ₁ ρ₂ √ρ₁ 的特征值（不求特征向量）：F = (Σ √λ_i)²。
+        与多个态比较时使用 fidelity_many。
         """
         if not isinstance(other, DensityMatrix):
             raise TypeError("输入必须是DensityMatrix类型")
@@ -408,17 +548,17 @@ class DensityMatrix:
         if self.dimension != other.dimension:
             raise ValueError("两个密度矩阵的维度必须相同")
         
-        # 计算 √ρ₁
-        sqrt_rho1 = self.matrix_square_root()
-        
-        # 计算 √ρ₁ ρ₂ √ρ₁
-        intermediate = sqrt_rho1 @ other.matrix @ sqrt_rho1
-        
-        # 计算 √(√ρ₁ ρ₂ √ρ₁)
-        sqrt_intermediate = self.matrix_square_root(intermediate)
-        
-        # 计算迹的平方
-        fidelity_val = np.real(np.trace(sqrt_intermediate)) ** 2
+        psi = self._rank_one_vector()
+        if psi is not None:
+            fidelity_val = np.real(np.vdot(psi, other._matrix @ psi))
+        else:
+            phi = other._rank_one_vector()
+            if phi is not None:
+                fidelity_val = np.real(np.vdot(phi, self._matrix @ phi))
+            else:
+                fidelity_val = _sandwich_fidelities(
+                    self._sqrt_matrix(), other._matrix[None], self.tolerance
+                )[0]
         
         # 精确到小数点后8位（对应MATLAB的round(F, 8)）
         return round(float(fidelity_val), 8)
@@ -431,7 +571,7 @@ class DensityMatrix:
         使用特征值分解方法
         """
         if matrix is None:
-            matrix = self._matrix
+            return self._sqrt_matrix().copy()
         
         # 先进行Hermitian 化以减小数值误差
         hermitian_matrix = (matrix + matrix.conj().T) / 2
@@ -440,6 +580,11 @@ class DensityMatrix:
         eigenvals, eigenvecs = type(self)._heig(hermitian_matrix)
         # 自适应容差
         tol = self._auto_tol_inst(hermitian_matrix)
+        return self._sqrt_from_eig(eigenvals, eigenvecs, tol)
+
+    @staticmethod
+    def _sqrt_from_eig(eigenvals: np.ndarray, eigenvecs: np.ndarray, tol: float) -> np.ndarray:
+        """由 Hermitian 特征分解构造矩阵平方根（容差内本征值置 0）。"""
         # 裁剪容差内本征值
         eigenvals = np.where(eigenvals < tol, 0.0, eigenvals)
         sqrt_eigenvals = np.sqrt(eigenvals)
@@ -511,6 +656,46 @@ class DensityMatrix:
         # 现在看起来简单
         # 但将来可能需要预处理   价值在于:1.提供清晰的接口; 2.支持继承(使用 cls 而不是硬编码类名); 3.未来扩展：可以添加预处理逻辑;4.代码可读性：语义更清晰
     
+    @classmethod
+    def from_trusted(cls, matrix: np.ndarray, *, tolerance: float = 1e-10,
+                     enforce: Literal["within_tol", "project", "none"] = "within_tol",
+                     strict: bool = False, warn: bool = True,
+                     eig: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> 'DensityMatrix':
+        """
+        内部快速构造：供重构器包装刚算出的 (n, n) 复矩阵
+        
+        跳过输入守卫与 np.array 副本（直接持有传入数组，调用方保证此后不再原地修改它）。
+        eig 为 Hermitian 化矩阵的已知特征分解 (eigenvals (n,), eigenvecs (n, n))：
+        enforce="within_tol" 时物理化不再重复 eigh，enforce="none" 时直接作为谱分解缓存。
+        
+        Args:
+            matrix: (n, n) complex 数组（不再校验类型与形状）
+            tolerance: 数值容差
+            enforce: 物理化策略（与构造函数相同）
+            strict: 是否对显著非物理输入抛出异常
+            warn: 是否对显著非物理输入发出警告
+            eig: 可选的已知特征分解
+        """
+        obj = cls.__new__(cls)
+        obj.tolerance = tolerance
+        obj.enforce = enforce
+        obj.strict = strict
+        obj.warn = warn
+        if enforce == "none":
+            obj._matrix = matrix
+            if eig is not None:
+                vals = np.asarray(eig[0], dtype=float)
+                order = np.argsort(vals)
+                vals, vecs = vals[order], eig[1][:, order]
+                obj._spectral_cache = (vals, vecs, obj._tol_from_eigenvalues(vals))
+        elif enforce == "within_tol":
+            obj._matrix = obj._sanitize_within_tol(matrix, eig=eig)
+        elif enforce == "project":
+            obj._matrix = cls.project_to_physical(matrix, tolerance=tolerance)
+        else:
+            raise ValueError(f"Unsupported enforce mode: {enforce!r}")
+        return obj
+    
     @classmethod
     def from_linear_reconstruction(cls, rho_vector: np.ndarray, dimension: int, 
                                  tolerance: float = 1e-10, 
@@ -609,6 +794,60 @@ class DensityMatrix:
         """
         return type(self)._auto_tol(A, self.tolerance)
     
+    def _sqrt_matrix(self) -> np.ndarray:
+        """自身的平方根 √ρ：复用缓存的谱分解并记忆结果（内部共享，调用方不得修改）。"""
+        if self._sqrt_cache is None:
+            eigenvals, eigenvecs, tol = self._spectrum()
+            self._sqrt_cache = self._sqrt_from_eig(eigenvals, eigenvecs, tol)
+        return self._sqrt_cache
+
+    def _rank_one_vector(self) -> Optional[np.ndarray]:
+        """
+        若矩阵在容差内为秩 1（ρ = |ψ⟩⟨ψ|）则返回 ψ，否则返回 None
+        
+        先用 (Tr ρ)² - Tr ρ² = 2 Σ_{i<j} λ_i λ_j 做 O(n²) 初筛（双侧：非半正定矩阵
+        该量可为负）；初筛只约束谱的二阶矩，不足以排除非半正定矩阵（如谱
+        (1, 1, -1/2)），因此候选 ψ（对角元最大的列按其平方根缩放，相差一个全局
+        相位）还需满足 ‖ρ - |ψ⟩⟨ψ|‖_F 在容差内，整个判定仍为 O(n²)、无需特征分解。
+        """
+        M = self._matrix
+        diag = np.real(np.diagonal(M))
+        tr = float(diag.sum())
+        if tr <= 0.0:
+            return None
+        tol = float(self.tolerance)
+        purity = float(np.real(np.vdot(M, M)))
+        if abs(tr * tr - purity) > 2.0 * tol * tr:
+            return None
+        pivot = int(np.argmax(diag))
+        psi = M[:, pivot] / np.sqrt(diag[pivot])
+        if np.linalg.norm(M - np.outer(psi, psi.conj())) > 2.0 * tol * max(1.0, tr):
+            return None
+        return psi
+
+    def _spectrum(self) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        惰性计算并缓存 H = (ρ + ρ†)/2 的特征分解与自适应容差
+        
+        eigenvalues / 物理性检查 / 诊断 / matrix_square_root / fidelity 共享同一次
+        特征值分解；_matrix 被重新赋值时缓存失效。H 为 Hermitian 矩阵，其谱范数
+        即最大特征值绝对值，自适应容差无需再做一次 SVD。
+        
+        Returns:
+            (eigenvals, eigenvecs, tol): 升序特征值、特征向量与自适应容差
+        """
+        if self._spectral_cache is None:
+            H = (self._matrix + self._matrix.conj().T) / 2
+            vals, vecs = type(self)._heig(H)
+            self._spectral_cache = (vals, vecs, self._tol_from_eigenvalues(vals))
+        return self._spectral_cache
+
+    def _tol_from_eigenvalues(self, vals: np.ndarray) -> float:
+        """由 Hermitian 矩阵的特征值给出自适应容差（谱范数 = 最大特征值绝对值）。"""
+        eps = np.finfo(float).eps
+        norm2 = float(np.max(np.abs(vals)))
+        return max(float(self.tolerance), float(type(self).k_factor) * vals.size * eps * max(1.0, norm2))
+
     @classmethod
     def _heig(cls, H: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -627,7 +866,8 @@ class DensityMatrix:
         vals, vecs = eigh(H, lower=True, check_finite=False)
         return np.real(vals), vecs
     
-    def _sanitize_within_tol(self, matrix: np.ndarray, *, diagnostic: bool = False) -> Union[np.ndarray, Tuple[np.ndarray, dict]]:
+    def _sanitize_within_tol(self, matrix: np.ndarray, *, diagnostic: bool = False,
+                             eig: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Union[np.ndarray, Tuple[np.ndarray, dict]]:
         """
         容差内物理化处理（数值稳定性处理）。
         仅修正容差范围内的数值误差，对显著非物理输入发出警告。
@@ -635,6 +875,7 @@ class DensityMatrix:
         参数:
             matrix: 原始矩阵 (可能含轻微数值误差)
             diagnostic: 若为 True，返回额外的物理性指标 (dict)
+            eig: 可选的 (eigenvals, eigenvecs)，为 Hermitian 化 matrix 的已知特征分解，提供时跳过 eigh
 
         返回:
             rho_sanitized: 容差内物理化的密度矩阵
@@ -646,14 +887,17 @@ class DensityMatrix:
         H = (matrix + matrix.conj().T) / 2
 
         # ---------------------------------------------------------
-        # 2️⃣ 统一特征值分解
+        # 2️⃣ 统一特征值分解（调用方已有分解时直接复用）
         # ---------------------------------------------------------
-        eigenvals, eigenvecs = type(self)._heig(H)
+        if eig is None:
+            eigenvals, eigenvecs = type(self)._heig(H)
+        else:
+            eigenvals, eigenvecs = np.asarray(eig[0], dtype=float), eig[1]
 
         # ---------------------------------------------------------
-        # 3️⃣ 自适应容差
+        # 3️⃣ 自适应容差（H 的谱范数即最大特征值绝对值，无需再做 SVD）
         # ---------------------------------------------------------
-        tol = self._auto_tol_inst(H)
+        tol = self._tol_from_eigenvalues(eigenvals)
 
         # ---------------------------------------------------------
         # 4️⃣ 预诊断（不更改输入矩阵）
@@ -753,6 +997,72 @@ class DensityMatrix:
 # 11. 便捷函数（Module-level Functions）
 # ============================================================================
 
+def project_to_simplex(values: np.ndarray, total: float = 1.0) -> np.ndarray:
+    """
+    将实向量（沿最后一轴，可批量）欧氏投影到概率单纯形 {x ≥ 0, Σx = total}。
+
+    基于排序的 O(d log d) 算法：求阈值 θ 使 Σ max(v - θ, 0) = total，返回 max(v - θ, 0)。
+    对密度矩阵谱使用时即为 Frobenius 范数下最近的物理态（Smolin–Gambetta–Smith）。
+
+    Args:
+        values: 形状 (..., d) 的实数组
+        total: 单纯形的总和（默认 1）
+
+    Returns:
+        与输入同形状的投影结果
+    """
+    v = np.asarray(values, dtype=float)
+    d = v.shape[-1]
+    u = -np.sort(-v, axis=-1)                       # 降序
+    css = np.cumsum(u, axis=-1) - total
+    k = np.arange(1, d + 1, dtype=float)
+    # 满足 u_k - css_k / k > 0 的最大 k（条件在 k 上单调，计数即为下标 + 1）
+    count = np.sum(u - css / k > 0, axis=-1, keepdims=True)
+    theta = np.take_along_axis(css, count - 1, axis=-1) / count
+    return np.maximum(v - theta, 0.0)
+
+
+def fidelity_many(reference: Union[DensityMatrix, np.ndarray], matrices: np.ndarray, *,
+                  tolerance: float = 1e-10) -> np.ndarray:
+    """
+    计算同一参考态与 (N, n, n) 堆栈中每个态的保真度（不做 8 位舍入）
+
+    参考态为秩 1（|ψ⟩⟨ψ|）时 F_k = ⟨ψ|ρ_k|ψ⟩，整批一次 einsum；否则复用参考态缓存的
+    √σ，对 √σ ρ_k √σ 堆栈做一次批量 eigvalsh。
+
+    Args:
+        reference: 参考态（DensityMatrix 或 (n, n) 数组，数组按默认策略物理化）
+        matrices: (N, n, n) 或 (n, n) 矩阵堆栈
+        tolerance: 参考态为数组时使用的数值容差
+
+    Returns:
+        (N,) 保真度数组
+    """
+    if not isinstance(reference, DensityMatrix):
+        reference = DensityMatrix(reference, tolerance=tolerance)
+    stack = np.asarray(matrices, dtype=complex)
+    if stack.ndim == 2:
+        stack = stack[None]
+    if stack.ndim != 3 or stack.shape[1:] != (reference.dimension, reference.dimension):
+        raise ValueError("矩阵堆栈形状必须为 (N, n, n)，且 n 与参考态维度一致")
+    psi = reference._rank_one_vector()
+    if psi is not None:
+        return np.real(np.einsum("i,nij,j->n", psi.conj(), stack, psi))
+    return _sandwich_fidelities(reference._sqrt_matrix(), stack, reference.tolerance)
+
+
+def _sandwich_fidelities(sqrt_ref: np.ndarray, stack: np.ndarray, tolerance: float) -> np.ndarray:
+    """由 √σ 与 (N, n, n) 堆栈计算 F_k = (Σ √λ(√σ ρ_k √σ))²，容差内的特征值置 0。"""
+    inter = sqrt_ref @ stack @ sqrt_ref
+    inter = (inter + np.conj(np.swapaxes(inter, -1, -2))) / 2
+    vals = np.linalg.eigvalsh(inter)
+    eps = np.finfo(float).eps
+    norm2 = np.max(np.abs(vals), axis=-1, keepdims=True)
+    tol = np.maximum(float(tolerance), DensityMatrix.k_factor * stack.shape[-1] * eps * np.maximum(1.0, norm2))
+    vals = np.where(vals < tol, 0.0, vals)
+    return np.sum(np.sqrt(vals), axis=-1) ** 2
+
+
 def make_physical(matrix: np.ndarray, tolerance: float = 1e-10) -> np.ndarray:
     """
     便捷函数：使矩阵满足物理条件（已弃用）
@@ -0,0 +1,174 @@
+"""密度矩阵堆栈容器：对 (N, n, n) 堆栈做向量化的物理量计算。"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, Literal, Optional, Union, overload
+
+import numpy as np
+
+from qtomography.domain.density import DensityMatrix, fidelity_many
+
+
+class DensityBatch:
+    """N 个同维密度矩阵的数组化容器。
+
+    迹、纯度、特征值、熵、物理化与保真度均在整个 (N, n, n) 堆栈上一次完成，
+    特征值使用一次批量 ``np.linalg.eigvalsh`` 并缓存；需要逐样本对象时通过
+    ``to_densities`` / ``__getitem__`` 转换为 DensityMatrix。
+
+    参数:
+        matrices: (N, n, n) 矩阵堆栈（单个 (n, n) 矩阵视为 N=1）。
+        tolerance: 数值容差，与 DensityMatrix 相同语义。
+        enforce: 物理化策略（"none" 默认保持输入，其余见 DensityMatrix.physicalize_stack）。
+        projection: enforce="project" 时谱的处理方式（"clip" / "simplex"）。
+    """
+
+    def __init__(
+        self,
+        matrices: np.ndarray,
+        *,
+        tolerance: float = 1e-10,
+        enforce: Literal["within_tol", "project", "none"] = "none",
+        projection: Literal["clip", "simplex"] = "clip",
+    ) -> None:
+        stack = np.asarray(matrices, dtype=complex)
+        if stack.ndim == 2:
+            stack = stack[None]
+        if stack.ndim != 3 or stack.shape[1] != stack.shape[2] or stack.shape[1] == 0:
+            raise ValueError("矩阵堆栈形状必须为 (N, n, n)")
+        # enforce="none" 时 physicalize_stack 返回副本，容器不与调用方共享可写数据
+        self._matrices = DensityMatrix.physicalize_stack(
+            stack, tolerance=tolerance, enforce=enforce, projection=projection
+        )
+        self._matrices.flags.writeable = False
+        self.tolerance = tolerance
+        self._spectral_cache: Optional[tuple[np.ndarray, np.ndarray]] = None
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_densities(
+        cls, densities: Iterable[DensityMatrix], *, tolerance: Optional[float] = None
+    ) -> "DensityBatch":
+        """由 DensityMatrix 序列构造（不再物理化；容差默认取第一个元素的容差）。"""
+
+        densities = list(densities)
+        if not densities:
+            raise ValueError("densities 不能为空")
+        if tolerance is None:
+            tolerance = densities[0].tolerance
+        return cls(np.stack([rho.matrix for rho in densities]), tolerance=tolerance)
+
+    def to_densities(self) -> List[DensityMatrix]:
+        """转换为 DensityMatrix 列表（enforce="none"，保持堆栈中的数值）。"""
+
+        return [self[i] for i in range(len(self))]
+
+    # ------------------------------------------------------------------
+    @property
+    def matrices(self) -> np.ndarray:
+        """(N, n, n) 矩阵堆栈（只读视图，需修改时请 .copy()）。"""
+        return self._matrices
+
+    @property
+    def num_samples(self) -> int:
+        """堆栈中的样本数 N。"""
+        return int(self._matrices.shape[0])
+
+    @property
+    def dimension(self) -> int:
+        """希尔伯特空间维度 n。"""
+        return int(self._matrices.shape[1])
+
+    def __len__(self) -> int:
+        return self.num_samples
+
+    @overload
+    def __getitem__(self, index: int) -> DensityMatrix: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "DensityBatch": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[DensityMatrix, "DensityBatch"]:
+        if isinstance(index, slice):
+            return DensityBatch(self._matrices[index], tolerance=self.tolerance)
+        return DensityMatrix.from_trusted(self._matrices[index], tolerance=self.tolerance, enforce="none")
+
+    def __iter__(self) -> Iterator[DensityMatrix]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"DensityBatch(num_samples={self.num_samples}, dimension={self.dimension})"
+
+    # ------------------------------------------------------------------
+    @property
+    def traces(self) -> np.ndarray:
+        """(N,) 各样本的迹 Tr(ρ)（复数）。"""
+        return np.trace(self._matrices, axis1=1, axis2=2)
+
+    @property
+    def purities(self) -> np.ndarray:
+        """(N,) 各样本的纯度 Tr(ρ²)。"""
+        return np.real(np.einsum("nij,nji->n", self._matrices, self._matrices))
+
+    @property
+    def eigenvalues(self) -> np.ndarray:
+        """(N, n) 各样本的特征值（降序，自适应容差内的值置 0，与 DensityMatrix.eigenvalues 一致）。"""
+
+        vals, tol = self._spectrum()
+        vals = np.where(vals < tol[:, None], 0.0, vals)
+        return vals[:, ::-1].copy()
+
+    def entropies(self, *, epsilon: float = 1e-15, base: str = "natural") -> np.ndarray:
+        """(N,) 各样本的 von Neumann 熵，语义与 analysis.metrics.eigenvalue_entropy 一致。"""
+
+        if base == "natural":
+            log = np.log
+        elif base == "2":
+            log = np.log2
+        else:
+            raise ValueError(f"不支持的对数底数: {base}")
+        vals = self.eigenvalues
+        totals = vals.sum(axis=1, keepdims=True)
+        needs_norm = ~np.isclose(totals, 1.0, atol=1e-6)
+        vals = np.where(needs_norm, vals / np.where(totals == 0.0, 1.0, totals), vals)
+        mask = vals > epsilon
+        terms = np.where(mask, vals * log(np.where(mask, vals, 1.0)), 0.0)
+        return -terms.sum(axis=1)
+
+    def physicalize(
+        self,
+        *,
+        enforce: Literal["within_tol", "project"] = "project",
+        projection: Literal["clip", "simplex"] = "clip",
+    ) -> "DensityBatch":
+        """返回物理化后的新堆栈（一次批量特征分解）。"""
+
+        return DensityBatch(
+            self._matrices, tolerance=self.tolerance, enforce=enforce, projection=projection
+        )
+
+    def fidelity(self, reference: Union[DensityMatrix, np.ndarray]) -> np.ndarray:
+        """(N,) 各样本与参考态的保真度 F = (Tr √(√σ ρ √σ))²（见 density.fidelity_many）。"""
+
+        return fidelity_many(reference, self._matrices, tolerance=self.tolerance)
+
+    # ------------------------------------------------------------------
+    def _spectrum(self) -> tuple[np.ndarray, np.ndarray]:
+        """惰性计算并缓存 Hermitian 化堆栈的升序特征值与逐样本自适应容差。"""
+
+        if self._spectral_cache is None:
+            stack = self._matrices
+            H = (stack + np.conj(np.swapaxes(stack, 1, 2))) / 2
+            vals = np.linalg.eigvalsh(H)
+            eps = np.finfo(float).eps
+            norm2 = np.max(np.abs(vals), axis=1)
+            tol = np.maximum(
+                float(self.tolerance),
+                float(DensityMatrix.k_factor) * self.dimension * eps * np.maximum(1.0, norm2),
+            )
+            self._spectral_cache = (vals, tol)
+        return self._spectral_cache
+
+
+__all__ = ["DensityBatch"]
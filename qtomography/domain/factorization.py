@@ -0,0 +1,716 @@
+"""测量矩阵分解缓存：为线性重构复用 SVD、伪逆与岭回归求解算子。
+
+同一 (dimension, design) 的测量矩阵在整批样本中保持不变，因此其 SVD、
+数值秩、奇异值以及求解算子只需计算一次。缓存以
+(dimension, design, regularization) 为键，在所有重构器实例之间共享，
+并按字节预算做 LRU 淘汰。
+
+同一缓存还保存每个设计的规范对偶框架（canonical dual frame）算子，
+使线性估计退化为一次 (n², m) × (m,) 乘积；以及厄米基（广义 Gell-Mann）
+下的实参数设计矩阵与实伪逆，用于在实数运算中求解 n² 个实自由度。
+
+对 nopovm 这类每行仅有少量非零元的设计，另提供稀疏 (CSR) 后端：方阵使用缓存的
+稀疏 LU（splu），岭回归对稀疏正规方程做 LU，其余情形回退到迭代 LSMR，
+从而在 n=64–128 时避免构造 GB 级的稠密测量矩阵。
+
+严格 RρR 所需的 H-sandwich 支撑算子（H = Σ M_j 的支撑基、H^{-1/2}、H^{-1}）
+与支撑上的归一化 POVM Ē_j 同样只依赖设计与特征值阈值，也缓存在此。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import lsmr, splu
+
+from qtomography.domain.cache import ByteBudgetLRU, CacheStats
+
+if TYPE_CHECKING:
+    from qtomography.domain.projectors import ProjectorSet
+
+
+@dataclass(frozen=True)
+class MeasurementFactorization:
+    """测量矩阵 M (m, n²) 的静态分解结果。
+
+    属性:
+        dimension: 希尔伯特空间维度 n。
+        design: 测量设计名称。
+        regularization: 岭回归系数 λ；None 表示普通最小二乘。
+        singular_values: M 的奇异值（降序）。
+        rank: 数值秩，截断阈值与 np.linalg.lstsq(rcond=None) 一致。
+        pseudo_inverse: (n², m) Moore-Penrose 伪逆。
+        solve_operator: (n², m) 求解算子；λ=None 时等于伪逆，
+            否则为 (MᵀM + λI)⁻¹ Mᵀ。
+        residuals_available: 与 lstsq 语义一致，单样本结果是否携带残差。
+    """
+
+    dimension: int
+    design: str
+    regularization: Optional[float]
+    singular_values: np.ndarray
+    rank: int
+    pseudo_inverse: np.ndarray
+    solve_operator: np.ndarray
+    residuals_available: bool
+
+    @property
+    def condition_number(self) -> float:
+        """最大与最小非零奇异值之比。"""
+        if self.rank == 0:
+            return float("inf")
+        return float(self.singular_values[0] / self.singular_values[self.rank - 1])
+
+    @property
+    def nbytes(self) -> int:
+        """缓存条目占用的字节数（用于预算淘汰）。"""
+        arrays = (self.singular_values, self.pseudo_inverse, self.solve_operator)
+        total = sum(a.nbytes for a in arrays)
+        if self.solve_operator is self.pseudo_inverse:
+            total -= self.solve_operator.nbytes
+        return int(total)
+
+
+@dataclass(frozen=True)
+class DualFrame:
+    """测量设计的规范对偶框架算子 {Q_k}，满足 ρ = Σ_k p_k Q_k。
+
+    属性:
+        dimension: 希尔伯特空间维度 n。
+        design: 测量设计名称。
+        matrix: (n², m) C 连续矩阵，第 k 列为展平的 Q_k（行优先）。
+        closed_form: 是否来自解析闭式（完整 MUB：Q_k = P_k - I/(n+1)）。
+        rank: 测量矩阵的数值秩；闭式解时为 n²（信息完备），否则取自伪逆所用的 SVD。
+        residuals_available: 与 lstsq 语义一致，单样本结果是否携带残差。
+    """
+
+    dimension: int
+    design: str
+    matrix: np.ndarray
+    closed_form: bool
+    rank: int
+    residuals_available: bool
+
+    @property
+    def singular_values(self) -> np.ndarray:
+        """对偶框架闭式解不计算 SVD，返回空数组（与稀疏后端一致）。"""
+        return np.array([], dtype=float)
+
+    @property
+    def operators(self) -> np.ndarray:
+        """(m, n, n) 对偶算子数组。"""
+        m = self.matrix.shape[1]
+        return self.matrix.T.reshape(m, self.dimension, self.dimension)
+
+    @property
+    def nbytes(self) -> int:
+        """缓存条目占用的字节数（用于预算淘汰）。"""
+        return int(self.matrix.nbytes)
+
+
+def _is_complete_mub(design: str, num_projectors: int, groups: np.ndarray, dimension: int) -> bool:
+    n = int(dimension)
+    return design == "mub" and num_projectors == n * (n + 1) and np.unique(groups).size == n + 1
+
+
+def build_dual_frame(
+    projectors: np.ndarray,
+    groups: np.ndarray,
+    *,
+    dimension: int,
+    design: str,
+    pseudo_inverse: Optional[np.ndarray] = None,
+    rank: Optional[int] = None,
+) -> DualFrame:
+    """构造规范对偶框架。
+
+    对完整 MUB 设计（n+1 组、每组 n 个正交投影）使用闭式
+    S⁻¹(X) = X - Tr(X) I/(n+1)，得 Q_k = P_k - I/(n+1)，无需任何分解；
+    其余设计由测量矩阵伪逆给出：Q_k = conj(reshape(M⁺[:, k]))；rank 为该测量矩阵的
+    数值秩（未提供时由 np.linalg.matrix_rank 计算）。
+    """
+
+    n = int(dimension)
+    m = projectors.shape[0]
+    closed_form = _is_complete_mub(design, m, groups, n)
+    if closed_form:
+        duals = projectors - np.eye(n, dtype=complex)[None, :, :] / (n + 1)
+        matrix = np.ascontiguousarray(duals.reshape(m, n * n).T)
+        rank = n * n
+    else:
+        measurement = projectors.reshape(m, n * n)
+        if pseudo_inverse is None:
+            pseudo_inverse = np.linalg.pinv(measurement)
+        if rank is None:
+            rank = int(np.linalg.matrix_rank(measurement))
+        matrix = np.ascontiguousarray(np.conj(pseudo_inverse))
+    matrix.setflags(write=False)
+    return DualFrame(
+        dimension=n,
+        design=str(design),
+        matrix=matrix,
+        closed_form=bool(closed_form),
+        rank=int(rank),
+        residuals_available=bool(rank == n * n and m > n * n),
+    )
+
+
+def factorize_measurement_matrix(
+    measurement_matrix: np.ndarray,
+    *,
+    dimension: int,
+    design: str,
+    regularization: Optional[float] = None,
+) -> MeasurementFactorization:
+    """对测量矩阵执行一次 SVD，并据此构造伪逆与岭回归求解算子。"""
+
+    M = np.asarray(measurement_matrix)
+    m, n_unknowns = M.shape
+    u, s, vh = np.linalg.svd(M, full_matrices=False)
+    cutoff = np.finfo(float).eps * max(m, n_unknowns) * (s[0] if s.size else 0.0)
+    rank = int(np.count_nonzero(s > cutoff))
+
+    pinv = (vh[:rank].conj().T * (1.0 / s[:rank])) @ u[:, :rank].conj().T
+    if regularization is None:
+        solve_operator = pinv
+        residuals_available = rank == n_unknowns and m > n_unknowns
+    else:
+        # 岭回归: (MᵀM + λI)⁻¹ Mᵀ（与原实现一致使用转置而非共轭转置）
+        mtm = M.T @ M
+        solve_operator = np.linalg.solve(mtm + regularization * np.eye(n_unknowns), M.T)
+        residuals_available = True
+
+    for arr in (s, pinv, solve_operator):
+        arr.setflags(write=False)
+
+    return MeasurementFactorization(
+        dimension=int(dimension),
+        design=str(design),
+        regularization=None if regularization is None else float(regularization),
+        singular_values=s,
+        rank=rank,
+        pseudo_inverse=pinv,
+        solve_operator=solve_operator,
+        residuals_available=bool(residuals_available),
+    )
+
+
+@dataclass(frozen=True)
+class HermitianFactorization:
+    """厄米基下的实参数线性系统 A θ = p 的静态分解。
+
+    基的排序：先 n 个对角投影 E_ii，然后对每个 i<j 依次为
+    对称元 (E_ij + E_ji)/√2 与反对称元 i(E_ji - E_ij)/√2（广义 Gell-Mann 非对角元），
+    该基在 Hilbert-Schmidt 内积下正交归一，ρ = Σ_a θ_a B_a 且 θ 为实数。
+
+    属性:
+        dimension: 希尔伯特空间维度 n。
+        design: 测量设计名称。
+        regularization: 岭回归系数 λ；None 表示普通最小二乘。
+        design_matrix: (m, n²) 实设计矩阵 A[k, a] = Tr(P_k B_a)。
+        singular_values: A 的奇异值（降序）。
+        rank: A 的数值秩。
+        solve_operator: (n², m) 实求解算子（伪逆或 (AᵀA + λI)⁻¹Aᵀ）。
+        residuals_available: 与 lstsq 语义一致，单样本结果是否携带残差。
+    """
+
+    dimension: int
+    design: str
+    regularization: Optional[float]
+    design_matrix: np.ndarray
+    singular_values: np.ndarray
+    rank: int
+    solve_operator: np.ndarray
+    residuals_available: bool
+
+    @property
+    def nbytes(self) -> int:
+        """缓存条目占用的字节数（用于预算淘汰）。"""
+        arrays = (self.design_matrix, self.singular_values, self.solve_operator)
+        return int(sum(a.nbytes for a in arrays))
+
+
+def hermitian_design_matrix(projectors: np.ndarray) -> np.ndarray:
+    """由 (m, n, n) 投影算符构造厄米基下的实设计矩阵 (m, n²)。
+
+    Tr(P E_ii) = P_ii，Tr(P S_ij) = √2 Re P_ij，Tr(P A_ij) = -√2 Im P_ij。
+    """
+
+    m, n, _ = projectors.shape
+    rows, cols = np.triu_indices(n, k=1)
+    upper = projectors[:, rows, cols]
+    diag = np.real(np.diagonal(projectors, axis1=1, axis2=2))
+    sqrt2 = np.sqrt(2.0)
+    off = np.empty((m, 2 * rows.size), dtype=float)
+    off[:, 0::2] = sqrt2 * np.real(upper)
+    off[:, 1::2] = -sqrt2 * np.imag(upper)
+    return np.ascontiguousarray(np.concatenate([diag, off], axis=1))
+
+
+def hermitian_coefficients_to_matrix(coefficients: np.ndarray, dimension: int) -> np.ndarray:
+    """将厄米基系数 θ（(n²,) 或 (n², N)）组装为厄米矩阵（(n, n) 或 (N, n, n)）。"""
+
+    n = int(dimension)
+    theta = np.asarray(coefficients, dtype=float)
+    single = theta.ndim == 1
+    if single:
+        theta = theta[:, None]
+    if theta.shape[0] != n * n:
+        raise ValueError(f"系数长度应为 {n * n}, 实际为 {theta.shape[0]}")
+    num = theta.shape[1]
+    rows, cols = np.triu_indices(n, k=1)
+    inv_sqrt2 = 1.0 / np.sqrt(2.0)
+    sym = theta[n::2].T * inv_sqrt2    # (N, n_pairs)
+    anti = theta[n + 1::2].T * inv_sqrt2
+
+    out = np.zeros((num, n, n), dtype=complex)
+    diag = np.arange(n)
+    out[:, diag, diag] = theta[:n].T
+    out[:, rows, cols] = sym - 1j * anti
+    out[:, cols, rows] = sym + 1j * anti
+    return out[0] if single else out
+
+
+def factorize_hermitian_design(
+    projectors: np.ndarray,
+    *,
+    dimension: int,
+    design: str,
+    regularization: Optional[float] = None,
+) -> HermitianFactorization:
+    """构造实设计矩阵并在实数运算中完成一次 SVD / 岭回归算子计算。"""
+
+    A = hermitian_design_matrix(projectors)
+    m, n_unknowns = A.shape
+    u, s, vt = np.linalg.svd(A, full_matrices=False)
+    cutoff = np.finfo(float).eps * max(m, n_unknowns) * (s[0] if s.size else 0.0)
+    rank = int(np.count_nonzero(s > cutoff))
+    if regularization is None:
+        solve_operator = (vt[:rank].T * (1.0 / s[:rank])) @ u[:, :rank].T
+        residuals_available = rank == n_unknowns and m > n_unknowns
+    else:
+        solve_operator = np.linalg.solve(A.T @ A + regularization * np.eye(n_unknowns), A.T)
+        residuals_available = True
+    solve_operator = np.ascontiguousarray(solve_operator)
+
+    for arr in (A, s, solve_operator):
+        arr.setflags(write=False)
+
+    return HermitianFactorization(
+        dimension=int(dimension),
+        design=str(design),
+        regularization=None if regularization is None else float(regularization),
+        design_matrix=A,
+        singular_values=s,
+        rank=rank,
+        solve_operator=solve_operator,
+        residuals_available=bool(residuals_available),
+    )
+
+
+@dataclass(frozen=True)
+class SparseMeasurementFactorization:
+    """稀疏测量矩阵 M (m, n²) 的缓存求解器。
+
+    属性:
+        dimension: 希尔伯特空间维度 n。
+        design: 测量设计名称。
+        regularization: 岭回归系数 λ；None 表示普通最小二乘。
+        matrix: (m, n²) CSR 测量矩阵。
+        method: "splu"（方阵或岭回归正规方程的稀疏 LU）或 "lsmr"（迭代最小二乘）。
+        lu: splu 返回的 SuperLU 对象；method="lsmr" 时为 None。
+        rank: 名义秩；LU 成功时为 n²（满秩），LSMR 时为 min(m, n²)（未做秩检测）。
+        residuals_available: 与稠密后端语义一致，单样本结果是否携带残差。
+    """
+
+    dimension: int
+    design: str
+    regularization: Optional[float]
+    matrix: sp.csr_matrix
+    method: str
+    lu: Any
+    rank: int
+    residuals_available: bool
+    lsmr_tol: float = 1e-12
+
+    @property
+    def singular_values(self) -> np.ndarray:
+        """稀疏后端不计算 SVD，返回空数组（条件数据此视为不可用）。"""
+        return np.array([], dtype=float)
+
+    def solve(self, probabilities: np.ndarray) -> np.ndarray:
+        """求解 (m,) 或 (m, N) 右端项，返回 (n²,) 或 (n², N) 复向量。"""
+
+        rhs = np.asarray(probabilities, dtype=complex)
+        if self.method == "splu":
+            if self.regularization is not None:
+                rhs = self.matrix.T @ rhs
+            return self.lu.solve(rhs)
+        columns = rhs.reshape(rhs.shape[0], -1)
+        out = np.empty((self.matrix.shape[1], columns.shape[1]), dtype=complex)
+        for k in range(columns.shape[1]):
+            out[:, k] = lsmr(
+                self.matrix, columns[:, k], atol=self.lsmr_tol, btol=self.lsmr_tol
+            )[0]
+        return out.reshape((self.matrix.shape[1],) + rhs.shape[1:])
+
+    @property
+    def nbytes(self) -> int:
+        """缓存条目占用的字节数（用于预算淘汰）。"""
+        M = self.matrix
+        total = M.data.nbytes + M.indices.nbytes + M.indptr.nbytes
+        if self.lu is not None:
+            total += (self.lu.L.nnz + self.lu.U.nnz) * (M.data.itemsize + M.indices.itemsize)
+        return int(total)
+
+
+def factorize_sparse_measurement_matrix(
+    measurement_matrix: sp.spmatrix,
+    *,
+    dimension: int,
+    design: str,
+    regularization: Optional[float] = None,
+) -> SparseMeasurementFactorization:
+    """为稀疏测量矩阵选择并预计算求解器。
+
+    - 方阵且 λ=None：对 M 做稀疏 LU（奇异时回退到 LSMR）。
+    - λ 给定：对 (MᵀM + λI) 做稀疏 LU，与稠密岭回归算子语义一致。
+    - 其余情形：LSMR 迭代最小二乘。
+    """
+
+    M = sp.csr_matrix(measurement_matrix, dtype=complex)
+    m, n_unknowns = M.shape
+    method = "lsmr"
+    lu = None
+    if regularization is not None:
+        normal = (M.T @ M + float(regularization) * sp.identity(n_unknowns, dtype=complex)).tocsc()
+        lu = splu(normal)
+        method = "splu"
+        residuals_available = True
+    else:
+        residuals_available = m > n_unknowns
+        if m == n_unknowns:
+            try:
+                lu = splu(M.tocsc())
+                method = "splu"
+            except RuntimeError:
+                # 精确奇异：回退到最小二乘迭代
+                lu = None
+    return SparseMeasurementFactorization(
+        dimension=int(dimension),
+        design=str(design),
+        regularization=None if regularization is None else float(regularization),
+        matrix=M,
+        method=method,
+        lu=lu,
+        rank=int(n_unknowns) if method == "splu" else int(min(m, n_unknowns)),
+        residuals_available=bool(residuals_available),
+    )
+
+
+@dataclass(frozen=True)
+class NormalizedPOVM:
+    """严格 RρR 的 H-sandwich 支撑算子与支撑上的归一化 POVM。
+
+    属性:
+        dimension: 希尔伯特空间维度 n。
+        design: 测量设计名称。
+        support_dim: H = Σ M_j 支撑的维度 d_supp。
+        eig_min_H: 支撑上 H 的最小特征值。
+        eig_max_H: 支撑上 H 的最大特征值。
+        support_basis: (n, d_supp) 支撑的正交基 US。
+        h_sqrt_inv: (n, n) 支撑上的 H^{-1/2}。
+        h_inv: (n, n) 支撑上的 H^{-1}。
+        operators: (m, d_supp, d_supp) 约化的 Ē_j = B† M_j B，B = H^{-1/2} US。
+        diagnostics: Σ Ē_j 与单位阵偏差等验证指标。
+    """
+
+    dimension: int
+    design: str
+    support_dim: int
+    eig_min_H: float
+    eig_max_H: float
+    support_basis: np.ndarray
+    h_sqrt_inv: np.ndarray
+    h_inv: np.ndarray
+    operators: np.ndarray
+    diagnostics: dict
+
+    @property
+    def nbytes(self) -> int:
+        """缓存条目占用的字节数（用于预算淘汰）。"""
+        arrays = (self.support_basis, self.h_sqrt_inv, self.h_inv, self.operators)
+        return int(sum(a.nbytes for a in arrays))
+
+
+def build_normalized_povm(
+    projectors: np.ndarray,
+    *,
+    dimension: int,
+    design: str,
+    eig_rel_thresh: float = 1e-10,
+    eig_abs_thresh: Optional[float] = None,
+    eps_prob: float = 1e-12,
+) -> NormalizedPOVM:
+    """构建 H 的支撑算子与约化归一化 POVM，并计算一次性的验证诊断。
+
+    支撑由 H 的特征值 > max(eig_abs_thresh, eig_rel_thresh·max(λ_max, 1)) 确定；
+    若无特征值超过阈值，则保留最大特征值对应的方向。
+    """
+
+    H = np.sum(projectors, axis=0)
+    Hh = (H + H.conj().T) / 2
+    w, U = np.linalg.eigh(Hh)
+    w = np.real(w)
+    w_max = float(np.max(w))
+    tau_abs = float(eig_abs_thresh) if eig_abs_thresh is not None else 0.0
+    tau_rel = float(eig_rel_thresh) * max(w_max, 1.0)
+    tau = max(tau_abs, tau_rel)
+    S = w > tau
+    if not np.any(S):
+        S = np.zeros_like(w, dtype=bool)
+        S[int(np.argmax(w))] = True
+    wS = w[S]
+    US = U[:, S]  # (n, d_supp)
+    inv_sqrt_wS = 1.0 / np.maximum(np.sqrt(wS), eps_prob)
+    inv_wS = 1.0 / np.maximum(wS, eps_prob)
+    H_sqrt_inv = (US * inv_sqrt_wS) @ US.conj().T
+    H_inv = (US * inv_wS) @ US.conj().T
+    support_dim = int(US.shape[1])
+
+    # Ẽ_a = B† M_a B，B = H^{-1/2} US
+    B = H_sqrt_inv @ US
+    E_tilde = np.einsum('pi,apq,qj->aij', B.conj(), projectors, B, optimize=True)
+    E_tilde = (E_tilde + np.transpose(E_tilde.conj(), (0, 2, 1))) / 2
+
+    # 验证：Σ Ē_j 在支撑上应等于 I（基于支撑维度的自适应容差）
+    E_sum = np.sum(E_tilde, axis=0)
+    expected_I = np.eye(support_dim, dtype=complex)
+    E_sum_diff = E_sum - expected_I
+    diagnostics = {
+        "etilde_sum_max_dev_abs": float(np.max(np.abs(E_sum_diff))),
+        "etilde_sum_max_dev_fro": float(np.linalg.norm(E_sum_diff, ord='fro')),
+        "etilde_sum_valid": bool(np.allclose(E_sum, expected_I, atol=1e-8 * max(support_dim, 1.0))),
+    }
+    if support_dim <= 10:
+        # 小维度时对前两个 Ē_j 做快速正定性检查
+        sample = E_tilde[: min(2, E_tilde.shape[0])]
+        diagnostics["etilde_min_eig_sample"] = float(np.min(np.linalg.eigvalsh(sample)))
+
+    for array in (US, H_sqrt_inv, H_inv, E_tilde):
+        array.setflags(write=False)
+    return NormalizedPOVM(
+        dimension=int(dimension),
+        design=str(design),
+        support_dim=support_dim,
+        eig_min_H=float(np.min(wS)),
+        eig_max_H=float(np.max(wS)),
+        support_basis=US,
+        h_sqrt_inv=H_sqrt_inv,
+        h_inv=H_inv,
+        operators=E_tilde,
+        diagnostics=diagnostics,
+    )
+
+
+_CacheEntry = Union[
+    MeasurementFactorization,
+    DualFrame,
+    HermitianFactorization,
+    SparseMeasurementFactorization,
+    NormalizedPOVM,
+]
+
+
+class FactorizationCache(ByteBudgetLRU[_CacheEntry]):
+    """按字节预算淘汰的 LRU 分解缓存（线程安全，条目大小取自 ``nbytes``）。"""
+
+    def __init__(self, max_bytes: int = 512 * 1024 * 1024) -> None:
+        super().__init__(max_bytes, size_of=lambda entry: entry.nbytes)
+
+    def discard_projector_set(self, dimension: int, design: str) -> int:
+        """移除某个 (dimension, design) 的全部派生条目，返回移除个数。"""
+        prefix = (int(dimension), str(design))
+        return self.discard_where(lambda key: tuple(key[:2]) == prefix)
+
+
+_FACTORIZATION_CACHE = FactorizationCache()
+
+
+def get_factorization(
+    projector_set: "ProjectorSet",
+    regularization: Optional[float] = None,
+) -> MeasurementFactorization:
+    """获取（或计算并缓存）指定投影集合的测量矩阵分解。"""
+
+    reg = None if regularization is None else float(regularization)
+    key = (int(projector_set.dimension), str(projector_set.design), reg)
+    cached = _FACTORIZATION_CACHE.get(key)
+    if isinstance(cached, MeasurementFactorization):
+        return cached
+    factorization = factorize_measurement_matrix(
+        projector_set.measurement_matrix,
+        dimension=projector_set.dimension,
+        design=projector_set.design,
+        regularization=reg,
+    )
+    _FACTORIZATION_CACHE.put(key, factorization)
+    return factorization
+
+
+def get_dual_frame(projector_set: "ProjectorSet") -> DualFrame:
+    """获取（或计算并缓存）指定投影集合的规范对偶框架。"""
+
+    key = (int(projector_set.dimension), str(projector_set.design), "dual_frame")
+    cached = _FACTORIZATION_CACHE.get(key)
+    if isinstance(cached, DualFrame):
+        return cached
+    projectors = projector_set.projectors
+    groups = projector_set.groups
+    pinv = None
+    rank = None
+    if not _is_complete_mub(projector_set.design, projectors.shape[0], groups, projector_set.dimension):
+        factorization = get_factorization(projector_set)
+        pinv, rank = factorization.pseudo_inverse, factorization.rank
+    dual = build_dual_frame(
+        projectors,
+        groups,
+        dimension=projector_set.dimension,
+        design=projector_set.design,
+        pseudo_inverse=pinv,
+        rank=rank,
+    )
+    _FACTORIZATION_CACHE.put(key, dual)
+    return dual
+
+
+def get_hermitian_factorization(
+    projector_set: "ProjectorSet",
+    regularization: Optional[float] = None,
+) -> HermitianFactorization:
+    """获取（或计算并缓存）指定投影集合的实参数（厄米基）分解。"""
+
+    reg = None if regularization is None else float(regularization)
+    key = (int(projector_set.dimension), str(projector_set.design), reg, "hermitian")
+    cached = _FACTORIZATION_CACHE.get(key)
+    if isinstance(cached, HermitianFactorization):
+        return cached
+    factorization = factorize_hermitian_design(
+        projector_set.projectors,
+        dimension=projector_set.dimension,
+        design=projector_set.design,
+        regularization=reg,
+    )
+    _FACTORIZATION_CACHE.put(key, factorization)
+    return factorization
+
+
+def get_sparse_factorization(
+    projector_set: "ProjectorSet",
+    regularization: Optional[float] = None,
+) -> SparseMeasurementFactorization:
+    """获取（或计算并缓存）指定投影集合的稀疏测量矩阵求解器。"""
+
+    reg = None if regularization is None else float(regularization)
+    key = (int(projector_set.dimension), str(projector_set.design), reg, "sparse")
+    cached = _FACTORIZATION_CACHE.get(key)
+    if isinstance(cached, SparseMeasurementFactorization):
+        return cached
+    factorization = factorize_sparse_measurement_matrix(
+        projector_set.measurement_matrix_sparse,
+        dimension=projector_set.dimension,
+        design=projector_set.design,
+        regularization=reg,
+    )
+    _FACTORIZATION_CACHE.put(key, factorization)
+    return factorization
+
+
+def get_normalized_povm(
+    projector_set: "ProjectorSet",
+    *,
+    eig_rel_thresh: float = 1e-10,
+    eig_abs_thresh: Optional[float] = None,
+    eps_prob: float = 1e-12,
+) -> NormalizedPOVM:
+    """获取（或计算并缓存）严格 RρR 的支撑算子与归一化 POVM。
+
+    以 (dimension, design, eig_rel_thresh, eig_abs_thresh, eps_prob) 为键在所有
+    RρR 重建器实例与样本之间共享。
+    """
+
+    abs_thresh = None if eig_abs_thresh is None else float(eig_abs_thresh)
+    key = (
+        int(projector_set.dimension),
+        str(projector_set.design),
+        float(eig_rel_thresh),
+        abs_thresh,
+        float(eps_prob),
+        "normalized_povm",
+    )
+    cached = _FACTORIZATION_CACHE.get(key)
+    if isinstance(cached, NormalizedPOVM):
+        return cached
+    povm = build_normalized_povm(
+        projector_set.projectors,
+        dimension=projector_set.dimension,
+        design=projector_set.design,
+        eig_rel_thresh=eig_rel_thresh,
+        eig_abs_thresh=abs_thresh,
+        eps_prob=eps_prob,
+    )
+    _FACTORIZATION_CACHE.put(key, povm)
+    return povm
+
+
+def clear_factorization_cache() -> None:
+    """清空分解缓存（用于测试/工具函数）。"""
+
+    _FACTORIZATION_CACHE.clear()
+
+
+def set_factorization_cache_limit(max_bytes: int) -> None:
+    """调整分解缓存的字节预算，超出部分立即淘汰。"""
+
+    _FACTORIZATION_CACHE.resize(max_bytes)
+
+
+def discard_factorizations(dimension: int, design: str) -> int:
+    """丢弃某个 (dimension, design) 的全部缓存分解（投影集合被淘汰时调用）。"""
+
+    return _FACTORIZATION_CACHE.discard_projector_set(dimension, design)
+
+
+def factorization_cache_stats() -> CacheStats:
+    """分解缓存的命中 / 未命中 / 淘汰统计与字节占用。"""
+
+    return _FACTORIZATION_CACHE.stats()
+
+
+__all__ = [
+    "MeasurementFactorization",
+    "DualFrame",
+    "build_dual_frame",
+    "get_dual_frame",
+    "HermitianFactorization",
+    "hermitian_design_matrix",
+    "hermitian_coefficients_to_matrix",
+    "factorize_hermitian_design",
+    "get_hermitian_factorization",
+    "SparseMeasurementFactorization",
+    "factorize_sparse_measurement_matrix",
+    "get_sparse_factorization",
+    "NormalizedPOVM",
+    "build_normalized_povm",
+    "get_normalized_povm",
+    "FactorizationCache",
+    "factorize_measurement_matrix",
+    "get_factorization",
+    "clear_factorization_cache",
+    "set_factorization_cache_limit",
+    "discard_factorizations",
+    "factorization_cache_stats",
+]
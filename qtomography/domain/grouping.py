@@ -0,0 +1,103 @@
+"""测量分组索引与向量化按组归一化。
+
+多组 PVM 设计（例如 MUB 的 n+1 组）要求把观测值按组归一化为条件概率。
+`GroupIndex` 在每个投影集合上只构造一次紧凑的分段表示（排序置换、段起点、
+段长度与逆映射），`normalize_per_group` 借助 `np.add.reduceat` 对单个向量或
+整个 (m, N) 数据块一次性完成归一化，并以向量化方式检测零和分组。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class GroupIndex:
+    """测量分组的紧凑分段表示。
+
+    属性:
+        labels: (G,) 升序排列的唯一分组标签。
+        inverse: (m,) 每个测量所属分组在 labels 中的位置。
+        order: (m,) 将测量按分组排序的稳定置换。
+        offsets: (G,) 每个分组在排序后序列中的起始位置（用于 reduceat）。
+        counts: (G,) 每个分组包含的测量数。
+        contiguous: 分组在原始顺序中是否已连续排列（无需重排）。
+    """
+
+    labels: np.ndarray
+    inverse: np.ndarray
+    order: np.ndarray
+    offsets: np.ndarray
+    counts: np.ndarray
+    contiguous: bool
+
+    @classmethod
+    def from_labels(cls, groups: np.ndarray) -> "GroupIndex":
+        """由 (m,) 分组标签构造分段索引。"""
+
+        groups = np.asarray(groups).reshape(-1)
+        if groups.size == 0:
+            raise ValueError("分组标签不能为空")
+        labels, inverse, counts = np.unique(groups, return_inverse=True, return_counts=True)
+        order = np.argsort(inverse, kind="stable")
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        contiguous = bool(np.array_equal(order, np.arange(groups.size)))
+        for arr in (labels, inverse, order, offsets, counts):
+            arr.setflags(write=False)
+        return cls(
+            labels=labels,
+            inverse=inverse,
+            order=order,
+            offsets=offsets,
+            counts=counts,
+            contiguous=contiguous,
+        )
+
+    @property
+    def size(self) -> int:
+        """测量总数 m。"""
+        return int(self.inverse.size)
+
+    @property
+    def num_groups(self) -> int:
+        """分组数 G。"""
+        return int(self.labels.size)
+
+    def group_sums(self, values: np.ndarray) -> np.ndarray:
+        """计算 (m,) 或 (m, N) 数组沿第 0 轴的按组求和，返回 (G,) 或 (G, N)。"""
+
+        arr = values if self.contiguous else values[self.order]
+        return np.add.reduceat(arr, self.offsets, axis=0)
+
+
+def normalize_per_group(
+    values: np.ndarray,
+    group_index: GroupIndex,
+    *,
+    tolerance: float,
+    zero_sum_message: str = "group sum is zero; cannot normalize",
+) -> np.ndarray:
+    """将 (m,) 向量或 (m, N) 数据块按组归一化。
+
+    参数:
+        values: 计数或按组概率，第 0 轴长度必须等于 group_index.size。
+        group_index: 投影集合的分组索引。
+        tolerance: 判定分组和为零的绝对容差。
+        zero_sum_message: 存在零和分组时 ValueError 的信息。
+
+    返回:
+        与输入同形状的浮点数组；已是按组概率的输入保持不变（幂等）。
+    """
+
+    arr = np.asarray(values, dtype=float)
+    if arr.shape[0] != group_index.size:
+        raise ValueError(f"first axis must have length {group_index.size}, got {arr.shape[0]}")
+    sums = group_index.group_sums(arr)
+    if np.any(np.isclose(sums, 0.0, atol=tolerance)):
+        raise ValueError(zero_sum_message)
+    return arr / sums[group_index.inverse]
+
+
+__all__ = ["GroupIndex", "normalize_per_group"]
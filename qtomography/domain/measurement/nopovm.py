@@ -8,9 +8,13 @@ from __future__ import annotations
 
 这是信息完备的（n² 个测量足以重构 n×n 密度矩阵），但不是量子完备的（非 POVM），
 即所有投影算符的和不等于单位矩阵 ∑E_i ≠ I。
+
+每个投影算符至多有 4 个非零元，`build_nopovm_sparse_measurement` 直接按索引构造
+CSR 测量矩阵，无需生成 (n², n, n) 稠密投影数组。
 """
 
 import numpy as np
+import scipy.sparse as sp
 from dataclasses import dataclass
 
 
@@ -122,3 +126,51 @@ def build_nopovm_projectors(dimension: int) -> NoPOVMDesign:
         groups=groups_arr,
         measurement_matrix=meas
     )
+
+
+def build_nopovm_sparse_measurement(dimension: int) -> sp.csr_matrix:
+    """直接构造 nopovm 设计的 (n², n*n) CSR 测量矩阵。
+
+    行顺序与 `build_nopovm_projectors` 完全一致；展平采用行优先
+    （元素 (a, b) 位于列 a*n + b）：
+    - 标准基 |i>：(i, i) = 1
+    - (|i> + |j>)/√2：(i, i) = (j, j) = (i, j) = (j, i) = 1/2
+    - (|i> - i|j>)/√2：(i, i) = (j, j) = 1/2，(i, j) = i/2，(j, i) = -i/2
+
+    参数:
+        dimension: 希尔伯特空间维度 n（必须 >= 2）
+
+    返回:
+        复数 CSR 矩阵，共 n + 8·n(n-1)/2 个非零元。
+    """
+    d = int(dimension)
+    if d < 2:
+        raise ValueError("维度必须 >= 2")
+
+    diag = np.arange(d)
+    ii, jj = np.triu_indices(d, k=1)
+    num_pairs = ii.size
+    plus_rows = d + 2 * np.arange(num_pairs)
+    minus_rows = plus_rows + 1
+    col_ii = ii * d + ii
+    col_jj = jj * d + jj
+    col_ij = ii * d + jj
+    col_ji = jj * d + ii
+    half = np.full(num_pairs, 0.5, dtype=complex)
+
+    rows = np.concatenate([
+        diag,
+        np.repeat(plus_rows, 4),
+        np.repeat(minus_rows, 4),
+    ])
+    cols = np.concatenate([
+        diag * d + diag,
+        np.stack([col_ii, col_jj, col_ij, col_ji], axis=1).ravel(),
+        np.stack([col_ii, col_jj, col_ij, col_ji], axis=1).ravel(),
+    ])
+    vals = np.concatenate([
+        np.ones(d, dtype=complex),
+        np.stack([half, half, half, half], axis=1).ravel(),
+        np.stack([half, half, 0.5j * np.ones(num_pairs), -0.5j * np.ones(num_pairs)], axis=1).ravel(),
+    ])
+    return sp.csr_matrix((vals, (rows, cols)), shape=(d * d, d * d))
@@ -9,13 +9,48 @@ from __future__ import annotations
 - nopovm：非 POVM 测量设计（标准基+组合基）
 """
 
-from typing import ClassVar, Tuple
+from typing import ClassVar, Hashable, Optional, Tuple
 
 import numpy as np
+import scipy.sparse as sp
 
+from qtomography.domain.cache import ByteBudgetLRU, CacheStats
+from qtomography.domain.factorization import (
+    DualFrame,
+    HermitianFactorization,
+    MeasurementFactorization,
+    NormalizedPOVM,
+    SparseMeasurementFactorization,
+    clear_factorization_cache,
+    discard_factorizations,
+    get_dual_frame,
+    get_factorization,
+    get_hermitian_factorization,
+    get_normalized_povm,
+    get_sparse_factorization,
+)
+from qtomography.domain.grouping import GroupIndex
 from qtomography.domain.measurement.mub import build_mub_projectors
 from qtomography.domain.measurement.sic import build_sic_projectors
-from qtomography.domain.measurement.nopovm import build_nopovm_projectors
+from qtomography.domain.measurement.nopovm import (
+    build_nopovm_projectors,
+    build_nopovm_sparse_measurement,
+)
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    """将数组标记为不可写并原样返回（缓存共享数组的保护）。"""
+    array.flags.writeable = False
+    return array
+
+
+_ProjectorEntry = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def _drop_derived(key: Hashable, _entry: _ProjectorEntry) -> None:
+    # 投影集合被淘汰时一并丢弃其派生分解（对偶框架、E_tilde 等），避免孤儿条目占用预算
+    dimension, design = key
+    discard_factorizations(dimension, design)
 
 
 class ProjectorSet:
@@ -28,59 +63,110 @@ class ProjectorSet:
             - "sic": 对称信息完备 单组POVM（Symmetric Informationally Complete POVM）
             - "nopovm": 非 POVM 测量设计（标准基+组合基）
         cache: 是否启用缓存
+        materialize: 是否立即构建稠密投影算符；False 时（仅 nopovm）延迟到首次访问
+            `projectors` / `measurement_matrix`，稀疏后端只使用 `measurement_matrix_sparse`
     """
 
     # 缓存键: (dimension, design) -> (bases, projectors, measurement_matrix, groups)
-    _CACHE: ClassVar[dict[tuple[int, str], Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]] = {}
+    # 按数组字节数记账的 LRU，超出预算时淘汰最久未使用的设计及其派生分解
+    _CACHE: ClassVar[ByteBudgetLRU[_ProjectorEntry]] = ByteBudgetLRU(
+        256 * 1024 * 1024, on_evict=_drop_derived
+    )
 
-    def __init__(self, dimension: int, *, design: str = "mub", cache: bool = True) -> None:
+    def __init__(
+        self,
+        dimension: int,
+        *,
+        design: str = "mub",
+        cache: bool = True,
+        materialize: bool = True,
+    ) -> None:
         if dimension < 2:
             raise ValueError("维度必须 >= 2")
         self.dimension = dimension
         self.design = design.lower()
+        self._cache_enabled = cache
+        self._group_index: Optional[GroupIndex] = None
+        self._measurement_sparse: Optional[sp.csr_matrix] = None
 
         key = (dimension, self.design)
-        if cache and key in self._CACHE:
-            bases, projectors, measurement, groups = self._CACHE[key]
+        cached = self._CACHE.get(key) if cache else None
+        if cached is not None:
+            self._assign(*cached)
+        elif not materialize and self.design == "nopovm":
+            # 延迟构造稠密投影：仅保留分组信息，稀疏后端无需 (n², n, n) 数组
+            self._bases = np.zeros((dimension, dimension), dtype=complex)
+            self._projectors = None
+            self._measurement_matrix = None
+            self._groups = _readonly(np.zeros(dimension * dimension, dtype=int))
         else:
-            if self.design == "mub":
-                # 使用full模式（d(d+1) 个投影）作为新的默认设置
-                mub = build_mub_projectors(dimension, variant="full")
-                # bases：为向后兼容，仅在 d=2 时提供 4 个代表性向量
-         #       if dimension == 2:
-        #            bases = np.array([
-       #                 [1+0j, 0+0j],
-      #                  [0+0j, 1+0j],
-     #                   [1/np.sqrt(2)+0j, 1/np.sqrt(2)+0j],
-    #                    [1/np.sqrt(2)+0j, -1j/np.sqrt(2)],
-    #                ], dtype=complex)
-   #             else:
-                bases = np.zeros((dimension, dimension), dtype=complex)
-                projectors = mub.projectors
-                groups = mub.groups
-                measurement = mub.measurement_matrix
-            elif self.design == "sic":
-                sic = build_sic_projectors(dimension)
-                bases = np.zeros((dimension, dimension), dtype=complex)
-                projectors = sic.projectors
-                groups = sic.groups
-                measurement = sic.measurement_matrix
-            elif self.design == "nopovm":
-                nopovm = build_nopovm_projectors(dimension)
-                bases = np.zeros((dimension, dimension), dtype=complex)
-                projectors = nopovm.projectors
-                groups = nopovm.groups
-                measurement = nopovm.measurement_matrix
-            else:
-                raise ValueError(f"未知的测量设计: {self.design}")
-            if cache:
-                self._CACHE[key] = (bases, projectors, measurement, groups)
+            self._materialize()
+
+    def _materialize(self) -> None:
+        """构建（或从缓存取得）稠密投影算符与测量矩阵。"""
+
+        dimension = self.dimension
+        key = (dimension, self.design)
+        cached = self._CACHE.get(key) if self._cache_enabled else None
+        if cached is not None:
+            self._assign(*cached)
+            return
+        if self.design == "mub":
+            # 使用full模式（d(d+1) 个投影）作为新的默认设置
+            mub = build_mub_projectors(dimension, variant="full")
+            # bases：为向后兼容，仅在 d=2 时提供 4 个代表性向量
+     #       if dimension == 2:
+    #            bases = np.array([
+   #                 [1+0j, 0+0j],
+  #                  [0+0j, 1+0j],
+ #                   [1/np.sqrt(2)+0j, 1/np.sqrt(2)+0j],
+#                    [1/np.sqrt(2)+0j, -1j/np.sqrt(2)],
+#                ], dtype=complex)
+#             else:
+            bases = np.zeros((dimension, dimension), dtype=complex)
+            projectors = mub.projectors
+            groups = mub.groups
+            measurement = mub.measurement_matrix
+        elif self.design == "sic":
+            sic = build_sic_projectors(dimension)
+            bases = np.zeros((dimension, dimension), dtype=complex)
+            projectors = sic.projectors
+            groups = sic.groups
+            measurement = sic.measurement_matrix
+        elif self.design == "nopovm":
+            nopovm = build_nopovm_projectors(dimension)
+            bases = np.zeros((dimension, dimension), dtype=complex)
+            projectors = nopovm.projectors
+            groups = nopovm.groups
+            measurement = nopovm.measurement_matrix
+        else:
+            raise ValueError(f"未知的测量设计: {self.design}")
+        if self._cache_enabled:
+            self._CACHE.put(key, (bases, projectors, measurement, groups))
+        self._assign(bases, projectors, measurement, groups)
 
-        # 防御性副本，确保缓存安全
-        self._bases = bases.copy()
-        self._projectors = projectors.copy()
-        self._measurement_matrix = measurement.copy()
-        self._groups = groups.copy()
+    def _assign(
+        self,
+        bases: np.ndarray,
+        projectors: np.ndarray,
+        measurement: np.ndarray,
+        groups: np.ndarray,
+    ) -> None:
+        # 缓存数组标记为只读并在实例间共享（零拷贝），需要修改时由调用方显式 .copy()
+        self._bases = _readonly(bases)
+        self._projectors = _readonly(projectors)
+        self._measurement_matrix = _readonly(measurement)
+        self._groups = _readonly(groups)
+
+    @property
+    def is_materialized(self) -> bool:
+        """稠密投影算符与测量矩阵是否已构建。"""
+        return self._projectors is not None
+
+    @property
+    def num_projectors(self) -> int:
+        """投影算符个数 m（无需构建稠密数组）。"""
+        return int(self._groups.size)
 
     # ------------------------------------------------------------------
     @property
@@ -90,28 +176,116 @@ class ProjectorSet:
 
     @property
     def projectors(self) -> np.ndarray:
-        """(m, n, n) 秩为 1 的投影算符数组。"""
-        return self._projectors.copy()
+        """(m, n, n) 秩为 1 的投影算符数组（只读视图，需修改时请 .copy()）。"""
+        if self._projectors is None:
+            self._materialize()
+        return self._projectors
 
     @property
     def measurement_matrix(self) -> np.ndarray:
-        """(m, n*n) 测量矩阵，每行是展平的投影算符。"""
-        return self._measurement_matrix.copy()
+        """(m, n*n) 测量矩阵，每行是展平的投影算符（只读视图，需修改时请 .copy()）。"""
+        if self._measurement_matrix is None:
+            self._materialize()
+        return self._measurement_matrix
+
+    @property
+    def measurement_matrix_sparse(self) -> sp.csr_matrix:
+        """(m, n*n) CSR 测量矩阵。
+
+        nopovm 设计直接按索引构造（每行至多 4 个非零元，不构建稠密数组）；
+        其他设计由稠密测量矩阵转换而来。
+        """
+        if self._measurement_sparse is None:
+            if self.design == "nopovm":
+                self._measurement_sparse = build_nopovm_sparse_measurement(self.dimension)
+            else:
+                self._measurement_sparse = sp.csr_matrix(self.measurement_matrix)
+        return self._measurement_sparse
 
     @property
     def groups(self) -> np.ndarray:
-        """每个投影算符的分组标识 (m,)，用于按组归一化。"""
-        return self._groups.copy()
+        """每个投影算符的分组标识 (m,)，用于按组归一化（只读视图）。"""
+        return self._groups
+
+    @property
+    def group_index(self) -> GroupIndex:
+        """分组的紧凑分段表示（首次访问时构造一次），供向量化按组归一化使用。"""
+        if self._group_index is None:
+            self._group_index = GroupIndex.from_labels(self._groups)
+        return self._group_index
+
+    def factorization(self, regularization: Optional[float] = None) -> MeasurementFactorization:
+        """返回测量矩阵的缓存分解（SVD、伪逆、秩、岭回归求解算子）。
+
+        分解以 (dimension, design, regularization) 为键在所有实例间共享。
+        """
+
+        return get_factorization(self, regularization)
+
+    def hermitian_factorization(
+        self, regularization: Optional[float] = None
+    ) -> HermitianFactorization:
+        """返回厄米基（广义 Gell-Mann）下实设计矩阵 (m, n²) 的缓存分解与实伪逆。"""
+
+        return get_hermitian_factorization(self, regularization)
+
+    def dual_frame(self) -> DualFrame:
+        """返回缓存的规范对偶框架（完整 MUB 使用闭式 Q_k = P_k - I/(n+1)）。"""
+
+        return get_dual_frame(self)
+
+    def sparse_factorization(
+        self, regularization: Optional[float] = None
+    ) -> SparseMeasurementFactorization:
+        """返回稀疏测量矩阵的缓存求解器（方阵稀疏 LU / 岭回归正规方程 LU / LSMR）。"""
+
+        return get_sparse_factorization(self, regularization)
+
+    def normalized_povm(
+        self,
+        *,
+        eig_rel_thresh: float = 1e-10,
+        eig_abs_thresh: Optional[float] = None,
+        eps_prob: float = 1e-12,
+    ) -> NormalizedPOVM:
+        """返回缓存的 H-sandwich 支撑算子与支撑上的归一化 POVM Ē_j（严格 RρR 使用）。"""
+
+        return get_normalized_povm(
+            self, eig_rel_thresh=eig_rel_thresh, eig_abs_thresh=eig_abs_thresh, eps_prob=eps_prob
+        )
+
+    @property
+    def dual_operators(self) -> np.ndarray:
+        """(m, n, n) 规范对偶算子 Q_k，满足 ρ = Σ_k p_k Q_k。"""
+        return self.dual_frame().operators
 
     # ------------------------------------------------------------------
     @classmethod
-    def get(cls, dimension: int, *, design: str = "mub") -> "ProjectorSet":
-        """从缓存获取或构建指定设计的投影算符集合。"""
+    def get(
+        cls, dimension: int, *, design: str = "mub", materialize: bool = True
+    ) -> "ProjectorSet":
+        """从缓存获取或构建指定设计的投影算符集合。
 
-        return cls(dimension, design=design, cache=True)
+        materialize=False 时（目前仅对 nopovm 生效）延迟构建稠密投影，供稀疏后端使用。
+        """
+
+        return cls(dimension, design=design, cache=True, materialize=materialize)
 
     @classmethod
     def clear_cache(cls) -> None:
-        """清空内存缓存（用于测试/工具函数）。"""
+        """清空内存缓存（含派生的测量矩阵分解缓存，用于测试/工具函数）。"""
 
         cls._CACHE.clear()
+        clear_factorization_cache()
+
+    @classmethod
+    def set_cache_limit(cls, max_bytes: int) -> None:
+        """调整投影算符缓存的字节预算，超出部分（连同其派生分解）立即淘汰。"""
+
+        cls._CACHE.resize(max_bytes)
+
+    @classmethod
+    def cache_stats(cls) -> CacheStats:
+        """投影算符缓存的命中 / 未命中 / 淘汰统计与字节占用。"""
+
+        return cls._CACHE.stats()
@@ -45,12 +45,11 @@ class OptimizedProjectorSet:
 
         if cache:
             # 初始化类级缓存（单例模式）
-            with self._CACHE_LOCK:
-                if self._CACHE is None:
-                    self._CACHE = ProjectorLRUCache(max_bytes=max_cache_bytes)
-            
+            # 注意赋值到类属性：写到 self 上会使每个实例各自持有一个空缓存
+            cache_store = self._shared_cache(max_cache_bytes)
+
             # 尝试从缓存获取
-            cached_data = self._CACHE.get(dimension)
+            cached_data = cache_store.get(dimension)
             if cached_data is not None:
                 # 缓存命中，直接使用
                 bases, projectors, measurement = cached_data
@@ -61,7 +60,7 @@ class OptimizedProjectorSet:
                 measurement = self._build_measurement_matrix(projectors)
                 
                 # 存储到缓存
-                self._CACHE.put(dimension, (bases, projectors, measurement))
+                cache_store.put(dimension, (bases, projectors, measurement))
         else:
             # 不使用缓存，直接计算
             bases = self._build_bases(dimension)
@@ -95,6 +94,14 @@ class OptimizedProjectorSet:
         """从缓存获取指定维度的投影集, 若不存在则创建。"""
         return cls(dimension, cache=True)
 
+    @classmethod
+    def _shared_cache(cls, max_bytes: int) -> ProjectorLRUCache:
+        """返回类级共享缓存，首次调用时按 max_bytes 创建。"""
+        with cls._CACHE_LOCK:
+            if cls._CACHE is None:
+                cls._CACHE = ProjectorLRUCache(max_bytes=max_bytes)
+            return cls._CACHE
+
     @classmethod
     def clear_cache(cls) -> None:
         """清空所有缓存记录 (主要用于测试或调试情况)。"""
@@ -112,10 +119,12 @@ class OptimizedProjectorSet:
 
     @classmethod
     def set_cache_limit(cls, max_bytes: int) -> None:
-        """设置缓存大小限制。"""
+        """设置缓存大小限制，超出部分立即淘汰。"""
         with cls._CACHE_LOCK:
-            if cls._CACHE is not None:
-                cls._CACHE.max_bytes = max_bytes
+            if cls._CACHE is None:
+                cls._CACHE = ProjectorLRUCache(max_bytes=max_bytes)
+            else:
+                cls._CACHE.resize(max_bytes)
 
     # ------------------------------------------------------------------
     @staticmethod
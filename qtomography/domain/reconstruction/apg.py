@@ -0,0 +1,309 @@
+"""加速投影梯度 (APG) 最大似然层析重构实现。"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Literal
+
+import numpy as np
+
+from qtomography.domain.density import DensityMatrix
+from qtomography.domain.grouping import normalize_per_group
+from qtomography.domain.projectors import ProjectorSet
+
+if TYPE_CHECKING:
+    from qtomography.domain.reconstruction.linear import (
+        LinearReconstructionResult,
+        LinearReconstructor,
+    )
+
+
+@dataclass
+class APGReconstructionResult:
+    """APG 最大似然重构的完整输出。
+
+    属性:
+        density: 物理密度矩阵（迭代全程保持在物理集合内）。
+        rho_matrix_raw: 最终迭代点的矩阵（厄米、半正定、迹为 1）。
+        normalized_probabilities: 按组归一化后的观测频率。
+        expected_probabilities: 最终密度矩阵给出的按组条件概率。
+        log_likelihood: 最终的（按组条件）对数似然 Σ f_j log(q_j / Q_g)。
+        n_iterations: 执行的迭代次数。
+        n_function_evaluations: 似然函数的评估次数（含回溯线搜索）。
+        converged: 是否满足停止条件。
+        n_restarts: 动量重启次数。
+        step_size: 结束时的梯度步长。
+    """
+
+    density: DensityMatrix
+    rho_matrix_raw: np.ndarray
+    normalized_probabilities: np.ndarray
+    expected_probabilities: np.ndarray
+    log_likelihood: float
+    n_iterations: int
+    n_function_evaluations: int
+    converged: bool
+    n_restarts: int
+    step_size: float
+
+
+class APGReconstructor:
+    """加速投影梯度 (APG) 最大似然重构器。
+
+    最小化负对数似然 L(ρ) = -Σ_j f_j log q_j + Σ_g F_g log Q_g，其中 q_j = Tr(P_j ρ)，
+    Q_g 为第 g 组的 Σ q_j，F_g 为该组观测频率之和；对组内构成 POVM 的设计
+    （mub / sic）第二项恒为 0，对 nopovm 则给出条件多项分布似然。
+
+    每次迭代在外推点 σ_k = ρ_k + θ_k (ρ_k - ρ_{k-1}) 处做一步梯度下降，再以一次厄米
+    特征分解加谱的单纯形投影回到物理集合；步长通过回溯线搜索保证充分下降，
+    目标值上升时重启动量（Shang et al. 2017 的 APG-MLE）。期望概率与梯度均通过
+    实堆叠测量矩阵的 GEMV 计算。
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        *,
+        design: str = "mub",
+        tolerance: float = 1e-10,
+        max_iterations: int = 2000,
+        tol_state: float = 1e-8,
+        tol_ll: float = 1e-10,
+        eps_prob: float = 1e-12,
+        step_size: Optional[float] = None,
+        backtrack: float = 0.5,
+        cache_projectors: bool = True,
+        density_enforce: Literal["within_tol", "project", "none"] = "within_tol",
+    ) -> None:
+        if dimension < 2:
+            raise ValueError("维度必须大于等于 2")
+        if tolerance <= 0:
+            raise ValueError("tolerance 必须为正数")
+        if max_iterations <= 0:
+            raise ValueError("max_iterations 必须为正整数")
+        if step_size is not None and step_size <= 0:
+            raise ValueError("step_size 必须为正数")
+        if not (0.0 < backtrack < 1.0):
+            raise ValueError("backtrack 必须在 (0, 1) 范围内")
+
+        self.dimension = dimension
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.tol_state = tol_state
+        self.tol_ll = tol_ll
+        self.eps_prob = eps_prob
+        self.step_size = step_size
+        self.backtrack = backtrack
+        self.density_enforce = density_enforce
+        self.projector_set = (
+            ProjectorSet.get(dimension, design=design)
+            if cache_projectors
+            else ProjectorSet(dimension, design=design, cache=False)
+        )
+        self._stacked_measurement_cache: Optional[np.ndarray] = None
+        self._linear_initializer: Optional["LinearReconstructor"] = None
+
+    # ------------------------------------------------------------------
+    def reconstruct(
+        self,
+        probabilities: np.ndarray,
+        initial_density: Optional[DensityMatrix | np.ndarray] = None,
+        linear_result: Optional["LinearReconstructionResult"] = None,
+    ) -> DensityMatrix:
+        """仅返回最终密度矩阵。"""
+
+        return self.reconstruct_with_details(
+            probabilities, initial_density=initial_density, linear_result=linear_result
+        ).density
+
+    def reconstruct_with_details(
+        self,
+        probabilities: np.ndarray,
+        initial_density: Optional[DensityMatrix | np.ndarray] = None,
+        linear_result: Optional["LinearReconstructionResult"] = None,
+    ) -> APGReconstructionResult:
+        """执行 APG 最大似然重构并返回详细结果。
+
+        初始点优先级：initial_density > linear_result > 共享线性初始化器；
+        初始点先投影到物理集合，并与最大混态按 1e-3 混合以保证所有 q_j > 0。
+        """
+
+        f = self._normalize_probabilities(probabilities)
+        if initial_density is None and linear_result is not None:
+            initial_density = linear_result.density
+        rho, rho_eig = self._prepare_initial_density(f, initial_density)
+
+        W = self._stacked_measurement()
+        group_index = self.projector_set.group_index
+        F = group_index.group_sums(f)
+        d = self.dimension
+
+        def objective(r: np.ndarray):
+            q = np.maximum(W @ r.reshape(-1).view(float), self.eps_prob)
+            Q = group_index.group_sums(q)
+            value = -float(np.dot(f, np.log(q))) + float(np.dot(F, np.log(Q)))
+            return value, q, Q
+
+        def gradient(q: np.ndarray, Q: np.ndarray) -> np.ndarray:
+            weights = (F / Q)[group_index.inverse] - f / q
+            G = np.ascontiguousarray(weights @ W).view(complex).reshape(d, d)
+            return (G + G.conj().T) / 2
+
+        value, q, Q = objective(rho)
+        n_evaluations = 1
+        rho_prev = rho
+        theta = 1.0
+        step = self.step_size if self.step_size is not None else self._initial_step(f, q)
+        converged = False
+        n_restarts = 0
+        n_iterations = 0
+
+        for it in range(1, self.max_iterations + 1):
+            n_iterations = it
+            theta_next = (1.0 + np.sqrt(1.0 + 4.0 * theta * theta)) / 2.0
+            momentum = (theta - 1.0) / theta_next
+            sigma, value_s, q_s, Q_s = rho, value, q, Q
+            if momentum > 0.0:
+                extrapolated = rho + momentum * (rho - rho_prev)
+                if float(np.min(W @ extrapolated.reshape(-1).view(float))) > 0.0:
+                    value_s, q_s, Q_s = objective(extrapolated)
+                    sigma = extrapolated
+                    n_evaluations += 1
+                else:
+                    # 外推点越出半正定锥（似然无定义）：本次迭代退化为普通投影梯度步
+                    momentum = 0.0
+                    theta_next = 1.0
+                    n_restarts += 1
+            grad = gradient(q_s, Q_s)
+
+            # 回溯线搜索：L(ρ⁺) ≤ L(σ) + ⟨∇, ρ⁺ - σ⟩ + ‖ρ⁺ - σ‖² / (2t)
+            while True:
+                candidate, candidate_eig = self._project(sigma - step * grad)
+                diff = candidate - sigma
+                value_c, q_c, Q_c = objective(candidate)
+                n_evaluations += 1
+                bound = (
+                    value_s
+                    + float(np.real(np.vdot(grad, diff)))
+                    + float(np.real(np.vdot(diff, diff))) / (2.0 * step)
+                )
+                if value_c <= bound + 1e-15 * abs(value_s) or step < 1e-16:
+                    break
+                step *= self.backtrack
+
+            if momentum > 0.0 and value_c > value:
+                # 目标上升：丢弃该步并重启动量，下一次迭代从当前 ρ 做普通投影梯度步
+                n_restarts += 1
+                theta = 1.0
+                rho_prev = rho
+                continue
+
+            # 与 RρR 相同的停止准则：相邻迭代的状态变化与似然变化
+            dn = float(np.linalg.norm(candidate - rho))
+            dll = abs(value - value_c)
+            theta = theta_next
+            rho_prev, rho, rho_eig = rho, candidate, candidate_eig
+            value, q, Q = value_c, q_c, Q_c
+            if dn < self.tol_state and dll < self.tol_ll:
+                converged = True
+                break
+            # 温和放大步长，避免回溯后长期停留在过小步长
+            step /= np.sqrt(self.backtrack)
+
+        # 最终迭代点由一次特征分解投影得到，其谱直接交给 DensityMatrix，物理化不再重复 eigh
+        # （enforce="none" 时复制，以免与 rho_matrix_raw 别名）
+        density = DensityMatrix.from_trusted(
+            rho.copy() if self.density_enforce == "none" else rho,
+            tolerance=self.tolerance,
+            enforce=self.density_enforce,
+            eig=rho_eig,
+        )
+        return APGReconstructionResult(
+            density=density,
+            rho_matrix_raw=rho,
+            normalized_probabilities=f,
+            expected_probabilities=q / Q[group_index.inverse],
+            log_likelihood=-value,
+            n_iterations=n_iterations,
+            n_function_evaluations=n_evaluations,
+            converged=converged,
+            n_restarts=n_restarts,
+            step_size=float(step),
+        )
+
+    # ------------------------------------------------------------------
+    @property
+    def linear_initializer(self) -> "LinearReconstructor":
+        """与本重构器共享 ProjectorSet（及其缓存分解）的线性初始化器，首次使用时创建。
+
+        只取其原始矩阵作初始点（随后由 _project 投影），因此不做物理化也不发出
+        负特征值警告。
+        """
+
+        if self._linear_initializer is None:
+            from .linear import LinearReconstructor
+
+            self._linear_initializer = LinearReconstructor(
+                self.dimension,
+                tolerance=self.tolerance,
+                projector_set=self.projector_set,
+                density_enforce="none",
+                density_warn=False,
+            )
+        return self._linear_initializer
+
+    def _prepare_initial_density(
+        self,
+        probabilities: np.ndarray,
+        initial_density: Optional[DensityMatrix | np.ndarray],
+    ) -> tuple[np.ndarray, tuple[np.ndarray, np.ndarray]]:
+        """投影到物理集合并与最大混态按 1e-3 混合，返回矩阵及其特征分解。"""
+
+        d = self.dimension
+        if initial_density is None:
+            try:
+                rho = self.linear_initializer.reconstruct_with_details(probabilities).rho_matrix_raw
+            except np.linalg.LinAlgError:
+                # 测量矩阵分解不收敛时退化为最大混态
+                rho = np.eye(d, dtype=complex) / d
+        elif isinstance(initial_density, DensityMatrix):
+            rho = initial_density.matrix
+        else:
+            rho = np.asarray(initial_density, dtype=complex)
+            if rho.shape != (d, d):
+                raise ValueError("initial_density 形状必须为 (n, n)")
+        rho, (vals, vecs) = self._project(rho)
+        mixed = 0.999 * rho + 0.001 * np.eye(d, dtype=complex) / d
+        return mixed, (0.999 * vals + 0.001 / d, vecs)
+
+    def _normalize_probabilities(self, probabilities: np.ndarray) -> np.ndarray:
+        probs = np.asarray(probabilities, dtype=float).reshape(-1)
+        group_index = self.projector_set.group_index
+        if probs.size != group_index.size:
+            raise ValueError(
+                f"probability vector length must be {group_index.size}, got {probs.size}"
+            )
+        return normalize_per_group(probs, group_index, tolerance=self.tolerance)
+
+    def _stacked_measurement(self) -> np.ndarray:
+        """(m, 2n²) 实堆叠测量矩阵：q = W · vec(ρ)，Σ_j w_j P_j = (wᵀ W) 视作复矩阵。"""
+
+        if self._stacked_measurement_cache is None:
+            M = np.ascontiguousarray(self.projector_set.measurement_matrix, dtype=complex)
+            self._stacked_measurement_cache = M.view(float)
+        return self._stacked_measurement_cache
+
+    def _initial_step(self, f: np.ndarray, q: np.ndarray) -> float:
+        # 以初始点处 Hessian 对角量级 Σ f_j / q_j² 的倒数作为初始步长，回溯会进一步修正
+        curvature = float(np.sum(f / (q * q)))
+        return 1.0 / max(curvature, 1.0)
+
+    def _project(self, matrix: np.ndarray) -> tuple[np.ndarray, tuple[np.ndarray, np.ndarray]]:
+        """Frobenius 范数下最近的密度矩阵（一次特征分解 + 谱的单纯形投影）及其特征分解。"""
+
+        return DensityMatrix.project_to_physical(
+            matrix, tolerance=self.tolerance, method="simplex", return_eig=True
+        )
+
+
+__all__ = ["APGReconstructor", "APGReconstructionResult"]
@@ -8,6 +8,9 @@ from typing import Optional, Literal
 import numpy as np
 
 from qtomography.domain.density import DensityMatrix
+from qtomography.domain.density_batch import DensityBatch
+from qtomography.domain.factorization import hermitian_coefficients_to_matrix
+from qtomography.domain.grouping import normalize_per_group
 from qtomography.domain.projectors import ProjectorSet
 
 
@@ -32,6 +35,64 @@ class LinearReconstructionResult:
     singular_values: np.ndarray
 
 
+@dataclass
+class LinearBatchReconstructionResult:
+    """批量线性重构的堆叠结果（N 个样本共享同一测量矩阵分解）。
+
+    属性:
+        densities: (N, n, n) 物理化后的密度矩阵堆栈。
+        rho_matrices_raw: (N, n, n) 物理化前的原始矩阵堆栈。
+        normalized_probabilities: (m, N) 按组归一化后的概率矩阵，每列对应一个样本。
+        residuals: (N,) 每个样本的残差平方和 ||M x - p||²。
+        rank: 测量矩阵的数值秩（所有样本共享）。
+        singular_values: 测量矩阵的奇异值序列（所有样本共享）。
+        tolerance: 构造单样本 DensityMatrix 时使用的数值容差。
+        residuals_available: 与 np.linalg.lstsq 语义一致，标记单样本结果是否携带残差。
+    """
+
+    densities: np.ndarray
+    rho_matrices_raw: np.ndarray
+    normalized_probabilities: np.ndarray
+    residuals: np.ndarray
+    rank: int
+    singular_values: np.ndarray
+    tolerance: float = 1e-10
+    residuals_available: bool = True
+
+    @property
+    def num_samples(self) -> int:
+        """批量中的样本数 N。"""
+        return int(self.densities.shape[0])
+
+    @property
+    def density_batch(self) -> DensityBatch:
+        """以 DensityBatch 形式返回密度矩阵堆栈，供向量化计算纯度 / 特征值 / 熵等指标。"""
+        return DensityBatch(self.densities, tolerance=self.tolerance)
+
+    def result_at(self, index: int) -> LinearReconstructionResult:
+        """取出第 ``index`` 个样本，封装为单样本 LinearReconstructionResult。"""
+
+        residuals = (
+            np.array([self.residuals[index]], dtype=float)
+            if self.residuals_available
+            else np.array([], dtype=float)
+        )
+        # 复制一份：from_trusted 直接持有数组，不应与可写的批量堆栈共享内存
+        density = DensityMatrix.from_trusted(
+            self.densities[index].copy(),
+            tolerance=self.tolerance,
+            enforce="none",
+        )
+        return LinearReconstructionResult(
+            density=density,
+            rho_matrix_raw=self.rho_matrices_raw[index].copy(),
+            normalized_probabilities=self.normalized_probabilities[:, index].copy(),
+            residuals=residuals,
+            rank=self.rank,
+            singular_values=self.singular_values,
+        )
+
+
 class LinearReconstructor:
     """线性层析重构器。
 
@@ -41,7 +102,24 @@ class LinearReconstructor:
         regularization: 可选的岭回归系数 λ。若提供，则求解
             (M^T M + λ I) rho_vec = M^T P，这在噪声较大时更稳定。
         cache_projectors: 是否复用 ProjectorSet 缓存。
+        projector_set: 可选的现成 ProjectorSet；提供时直接复用（忽略 design 与
+            cache_projectors），例如 WLS 的线性初始化器与其共享同一投影集合。
+        solver: 线性求解方式。
+            - "lstsq": 基于缓存伪逆 / 岭回归算子的最小二乘解（默认）。
+            - "dual_frame": 规范对偶框架闭式解 ρ = Σ_k p_k Q_k，单次 (n², m) × (m,)
+              乘积；完整 MUB 设计下 Q_k = P_k - I/(n+1)，不做 SVD（singular_values 为
+              空数组）。不支持 regularization。
+            - "hermitian": 在厄米（广义 Gell-Mann）基下用实数运算求解 n² 个实参数，
+              缓存实伪逆；原始估计天然厄米。regularization 以 (AᵀA + λI) 形式作用于实参数。
+        backend: 测量矩阵表示。
+            - "dense": 稠密测量矩阵与缓存 SVD（默认）。
+            - "sparse": CSR 测量矩阵与缓存稀疏求解器（方阵稀疏 LU，岭回归正规方程 LU，
+              否则 LSMR）；nopovm 设计下不构建稠密投影，适合 n=64–128。
+              仅支持 solver="lstsq"，结果不含奇异值（singular_values 为空数组）。
         density_enforce: DensityMatrix 的物理化策略。
+        density_projection: density_enforce="project" 时谱的处理方式。
+            - "clip": 负特征值置零后重新归一化（默认）。
+            - "simplex": 谱的欧氏单纯形投影，得到 Frobenius 范数下最近的物理态。
         density_strict: 是否对显著非物理输入抛出异常。
         density_warn: 是否对显著非物理输入发出警告。
     """
@@ -57,6 +135,10 @@ class LinearReconstructor:
         density_enforce: Literal["within_tol", "project", "none"] = "within_tol",
         density_strict: bool = False,
         density_warn: bool = True,
+        density_projection: Literal["clip", "simplex"] = "clip",
+        solver: Literal["lstsq", "dual_frame", "hermitian"] = "lstsq",
+        backend: Literal["dense", "sparse"] = "dense",
+        projector_set: Optional[ProjectorSet] = None,
     ) -> None:
         # 简单的输入守卫
         if dimension < 2:
@@ -65,6 +147,18 @@ class LinearReconstructor:
             raise ValueError("tolerance 必须为正数")
         if regularization is not None and regularization < 0:
             raise ValueError("regularization 必须为非负数")
+        if density_projection not in ("clip", "simplex"):
+            raise ValueError(f"未知的谱投影方式: {density_projection!r}")
+        if solver not in ("lstsq", "dual_frame", "hermitian"):
+            raise ValueError(f"未知的线性求解方式: {solver!r}")
+        if solver == "dual_frame" and regularization is not None:
+            raise ValueError("dual_frame 求解方式不支持 regularization")
+        if backend not in ("dense", "sparse"):
+            raise ValueError(f"未知的测量矩阵后端: {backend!r}")
+        if backend == "sparse" and solver != "lstsq":
+            raise ValueError("sparse 后端仅支持 solver='lstsq'")
+        if projector_set is not None and projector_set.dimension != dimension:
+            raise ValueError("projector_set 的维度与 dimension 不一致")
 
         self.dimension = dimension
         self.tolerance = tolerance
@@ -72,11 +166,18 @@ class LinearReconstructor:
         self.density_enforce = density_enforce
         self.density_strict = density_strict
         self.density_warn = density_warn
-        self.projector_set = (
-            ProjectorSet.get(dimension, design=design)
-            if cache_projectors
-            else ProjectorSet(dimension, design=design, cache=False)
-        )
+        self.density_projection = density_projection
+        self.solver = solver
+        self.backend = backend
+        materialize = backend == "dense"
+        if projector_set is not None:
+            self.projector_set = projector_set
+        else:
+            self.projector_set = (
+                ProjectorSet.get(dimension, design=design, materialize=materialize)
+                if cache_projectors
+                else ProjectorSet(dimension, design=design, cache=False, materialize=materialize)
+            )
 
     # ------------------------------------------------------------------
     def _normalize_probabilities_grouped(self, probabilities: np.ndarray) -> np.ndarray:
@@ -87,25 +188,11 @@ class LinearReconstructor:
           up to numerical tolerance.
         """
         probs = np.asarray(probabilities, dtype=float).reshape(-1)
-        m = self.projector_set.projectors.shape[0]
+        group_index = self.projector_set.group_index
+        m = group_index.size
         if probs.size != m:
             raise ValueError(f"probability vector length must be {m}, got {probs.size}")
-
-        groups = getattr(self.projector_set, "groups", None)
-        if groups is None or len(groups) != m:
-            total = float(np.sum(probs))
-            if np.isclose(total, 0.0, atol=self.tolerance):
-                raise ValueError("sum of probabilities is zero")
-            return probs / total
-
-        out = probs.astype(float).copy()
-        for g in np.unique(groups):
-            idx = np.where(groups == g)[0]
-            s = float(np.sum(out[idx]))
-            if np.isclose(s, 0.0, atol=self.tolerance):
-                raise ValueError("group sum is zero; cannot normalize")
-            out[idx] = out[idx] / s
-        return out
+        return normalize_per_group(probs, group_index, tolerance=self.tolerance)
 
     def reconstruct(self, probabilities: np.ndarray) -> DensityMatrix:
         """仅返回物理化后的密度矩阵。"""
@@ -119,34 +206,64 @@ class LinearReconstructor:
         """执行线性重构并返回包含详细调试信息的结果对象。"""
 
         probs = self._normalize_probabilities_grouped(probabilities)
-        measurement_matrix = self.projector_set.measurement_matrix
 
-        if self.regularization is None:
-            rho_vec, residuals, rank, singular_values = np.linalg.lstsq(
-                measurement_matrix, probs, rcond=None
+        if self.backend == "sparse":
+            factorization = self.projector_set.sparse_factorization(self.regularization)
+            rho_vec = factorization.solve(probs)
+            if factorization.residuals_available:
+                residual_vec = probs - factorization.matrix @ rho_vec
+                residuals = np.array([float(np.sum(np.abs(residual_vec) ** 2))])
+            else:
+                residuals = np.array([], dtype=float)
+            rho_matrix = rho_vec.reshape(self.dimension, self.dimension).conj()
+        elif self.solver == "hermitian":
+            # 实参数求解：θ = A⁺ p（实数 GEMV），ρ = Σ θ_a B_a 天然厄米
+            factorization = self.projector_set.hermitian_factorization(self.regularization)
+            theta = factorization.solve_operator @ probs
+            rho_matrix = hermitian_coefficients_to_matrix(theta, self.dimension)
+            if factorization.residuals_available:
+                residual_vec = probs - factorization.design_matrix @ theta
+                residuals = np.array([float(np.sum(residual_vec ** 2))])
+            else:
+                residuals = np.array([], dtype=float)
+        else:
+            measurement_matrix = self.projector_set.measurement_matrix
+            if self.solver == "dual_frame":
+                # 对偶框架闭式解：ρ = Σ_k p_k Q_k，无需最小二乘；秩与残差语义取自对偶框架
+                factorization = self.projector_set.dual_frame()
+                rho_flat = factorization.matrix @ probs
+                rho_vec = rho_flat.conj()
+            else:
+                # 测量矩阵的 SVD / 伪逆 / 岭回归算子按 (dimension, design, λ) 缓存，批内只算一次
+                factorization = self.projector_set.factorization(self.regularization)
+                rho_vec = factorization.solve_operator @ probs
+            if factorization.residuals_available:
+                residual_vec = probs - measurement_matrix @ rho_vec
+                residuals = np.array([float(np.sum(np.abs(residual_vec) ** 2))])
+            else:
+                residuals = np.array([], dtype=float)
+
+            rho_matrix = rho_vec.reshape(self.dimension, self.dimension)
+            rho_matrix = rho_matrix.conj()
+        rank = factorization.rank
+        singular_values = factorization.singular_values
+
+        if self.density_enforce == "project" and self.density_projection == "simplex":
+            projected, eig = DensityMatrix.project_to_physical(
+                rho_matrix, tolerance=self.tolerance, method="simplex", return_eig=True
+            )
+            density = DensityMatrix.from_trusted(
+                projected, tolerance=self.tolerance, enforce="none", eig=eig
             )
         else:
-            # 岭回归: (M^T M + λ I) rho_vec = M^T P
-            mtm = measurement_matrix.T @ measurement_matrix
-            lambda_eye = self.regularization * np.eye(mtm.shape[0])
-            right_hand = measurement_matrix.T @ probs
-            rho_vec = np.linalg.solve(mtm + lambda_eye, right_hand)
-            # 对于 solve 没有直接返回残差/奇异值，这里手工计算
-            residuals = probs - measurement_matrix @ rho_vec
-            residuals = np.array([np.linalg.norm(residuals) ** 2])
-            rank = np.linalg.matrix_rank(measurement_matrix)
-            singular_values = np.linalg.svd(measurement_matrix, compute_uv=False)
-
-        rho_matrix = rho_vec.reshape(self.dimension, self.dimension)
-        rho_matrix = rho_matrix.conj()
-
-        density = DensityMatrix(
-            rho_matrix, 
-            tolerance=self.tolerance,
-            enforce=self.density_enforce,
-            strict=self.density_strict,
-            warn=self.density_warn
-        )
+            # enforce="none" 时 from_trusted 直接持有数组，复制以免与 rho_matrix_raw 别名
+            density = DensityMatrix.from_trusted(
+                rho_matrix.copy() if self.density_enforce == "none" else rho_matrix,
+                tolerance=self.tolerance,
+                enforce=self.density_enforce,
+                strict=self.density_strict,
+                warn=self.density_warn
+            )
 
         return LinearReconstructionResult(
             density=density,
@@ -157,6 +274,72 @@ class LinearReconstructor:
             singular_values=singular_values,
         )
 
+    def reconstruct_batch(self, probabilities_2d: np.ndarray) -> LinearBatchReconstructionResult:
+        """对 (m, N) 概率矩阵一次性执行线性重构。
+
+        测量矩阵的缓存分解（SVD 伪逆或岭回归求解算子）被所有样本共享，
+        所有样本通过一次矩阵-矩阵乘法求解，随后批量物理化。
+        """
+
+        probs = self._normalize_probabilities_grouped_batch(probabilities_2d)
+        num_samples = probs.shape[1]
+
+        if self.backend == "sparse":
+            factorization = self.projector_set.sparse_factorization(self.regularization)
+            rho_vecs = factorization.solve(probs)  # (n², N)，一次 LU 回代处理所有列
+            residual_matrix = probs - factorization.matrix @ rho_vecs
+            rho_raw = np.conj(rho_vecs.T.reshape(num_samples, self.dimension, self.dimension))
+        elif self.solver == "hermitian":
+            factorization = self.projector_set.hermitian_factorization(self.regularization)
+            thetas = factorization.solve_operator @ probs  # (n², N) 实数 GEMM
+            residual_matrix = probs - factorization.design_matrix @ thetas
+            rho_raw = hermitian_coefficients_to_matrix(thetas, self.dimension)
+        else:
+            measurement_matrix = self.projector_set.measurement_matrix
+            if self.solver == "dual_frame":
+                factorization = self.projector_set.dual_frame()
+                rho_vecs = np.conj(factorization.matrix @ probs)  # (n², N)
+            else:
+                factorization = self.projector_set.factorization(self.regularization)
+                rho_vecs = factorization.solve_operator @ probs  # (n², N)
+            residual_matrix = probs - measurement_matrix @ rho_vecs
+            rho_raw = np.conj(rho_vecs.T.reshape(num_samples, self.dimension, self.dimension))
+        residuals = np.sum(np.abs(residual_matrix) ** 2, axis=0)
+
+        densities = DensityMatrix.physicalize_stack(
+            rho_raw,
+            tolerance=self.tolerance,
+            enforce=self.density_enforce,
+            strict=self.density_strict,
+            warn=self.density_warn,
+            projection=self.density_projection,
+        )
+
+        return LinearBatchReconstructionResult(
+            densities=densities,
+            rho_matrices_raw=rho_raw,
+            normalized_probabilities=probs,
+            residuals=residuals,
+            rank=factorization.rank,
+            singular_values=factorization.singular_values,
+            tolerance=self.tolerance,
+            residuals_available=factorization.residuals_available,
+        )
+
+    def _normalize_probabilities_grouped_batch(self, probabilities_2d: np.ndarray) -> np.ndarray:
+        """对 (m, N) 矩阵逐列执行按组归一化（与单样本版本语义一致）。"""
+
+        probs = np.asarray(probabilities_2d, dtype=float)
+        if probs.ndim == 1:
+            probs = probs.reshape(-1, 1)
+        if probs.ndim != 2:
+            raise ValueError("probabilities_2d must be a 2-D array of shape (m, N)")
+        group_index = self.projector_set.group_index
+        m = group_index.size
+        if probs.shape[0] != m:
+            raise ValueError(f"probability matrix must have {m} rows, got {probs.shape[0]}")
+        return normalize_per_group(probs, group_index, tolerance=self.tolerance)
+
     # ------------------------------------------------------------------
     def _normalize_probabilities(self, probabilities: np.ndarray) -> np.ndarray:
         """对测量概率向量做安全归一化。"""
@@ -0,0 +1,336 @@
+"""低秩因子化 (ρ = AA† / Tr AA†) 层析重构实现。"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List, Literal, Optional, Tuple
+
+import numpy as np
+from scipy.linalg import eigh
+from scipy.optimize import minimize
+
+from qtomography.domain.density import DensityMatrix
+from qtomography.domain.grouping import normalize_per_group
+from qtomography.domain.projectors import ProjectorSet
+
+
+# 秩提升时新增列的初始幅度（相对于已有因子的 Frobenius 范数）
+_ESCALATION_SCALE = 1e-2
+
+
+@dataclass
+class LowRankReconstructionResult:
+    """低秩因子化重构的完整输出。
+
+    属性:
+        density: 由最终因子构造的密度矩阵。
+        rho_matrix_raw: AA† / Tr(AA†)（厄米、半正定、秩不超过 rank）。
+        factor: (n, rank) 因子 A，已归一化为 Tr(AA†) = 1。
+        rank: 最终采用的秩。
+        normalized_probabilities: 按组归一化后的观测频率。
+        expected_probabilities: 最终密度矩阵给出的按组条件概率。
+        objective_value: 最终目标函数值（负对数似然或 chi²）。
+        log_likelihood: 按组条件对数似然 Σ f_j log q̂_j。
+        success: 最终秩上的优化器是否标记为成功。
+        n_iterations: 所有秩上的拟牛顿迭代次数之和。
+        n_function_evaluations: 所有秩上的目标函数调用次数之和。
+        rank_history: 依次尝试的 (rank, objective_value)。
+    """
+
+    density: DensityMatrix
+    rho_matrix_raw: np.ndarray
+    factor: np.ndarray
+    rank: int
+    normalized_probabilities: np.ndarray
+    expected_probabilities: np.ndarray
+    objective_value: float
+    log_likelihood: float
+    success: bool
+    n_iterations: int
+    n_function_evaluations: int
+    rank_history: List[Tuple[int, float]] = field(default_factory=list)
+
+
+class LowRankReconstructor:
+    """以 ρ = AA† / Tr(AA†)（A 为 n×r）参数化的低秩重构器，适用于近纯的高维态。
+
+    目标函数定义在按组条件概率 q̂_j = Tr(P_j ρ) / Q_g 上：
+        - objective="likelihood"：-Σ_j f_j log q̂_j
+        - objective="chi2"：Σ_j (f_j - q̂_j)² / q̂_j（与 WLS 相同的权重）
+    两者对 A 的缩放不变，迹归一化无需约束。测量算符为秩 1 投影 P_j = v_j v_j†，
+    q_j = ‖v_j† A‖²，目标函数与解析梯度 2 Σ_j w_j v_j v_j† A 均为 O(m·n·r)，
+    参数个数 2nr（L-BFGS-B 求解），从而 n = 64 以上也可在普通机器上重构。
+
+    rank=None 时自动选秩：从 rank_start 开始，每次沿梯度算子最小特征向量方向增加
+    一列并继续优化，直到目标函数的改进不超过阈值或达到 max_rank，此时返回改进前
+    （更小）的秩。阈值为 rank_tolerance 与信息准则（AIC）项中的较大者：输入为计数
+    （总计数 N）时，新增一列引入 2(n - r) - 1 个自由参数 k，似然的改进需超过
+    G·k / N（chi² 为 2·G·k / N，G 为组数，目标函数以按组归一化频率计）。
+    给定 rank 时直接在该秩上优化。
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        *,
+        rank: Optional[int] = None,
+        design: str = "mub",
+        objective: Literal["likelihood", "chi2"] = "likelihood",
+        tolerance: float = 1e-10,
+        max_iterations: int = 2000,
+        optimizer_ftol: float = 1e-12,
+        optimizer_gtol: float = 1e-8,
+        rank_start: int = 1,
+        max_rank: Optional[int] = None,
+        rank_tolerance: float = 1e-6,
+        eps_prob: float = 1e-12,
+        cache_projectors: bool = True,
+        density_enforce: Literal["within_tol", "project", "none"] = "within_tol",
+    ) -> None:
+        if dimension < 2:
+            raise ValueError("维度必须大于等于 2")
+        if rank is not None and not (1 <= rank <= dimension):
+            raise ValueError("rank 必须在 [1, dimension] 范围内")
+        if objective not in ("likelihood", "chi2"):
+            raise ValueError(f"未知的目标函数: {objective!r}")
+        if tolerance <= 0:
+            raise ValueError("tolerance 必须为正数")
+        if max_iterations <= 0:
+            raise ValueError("max_iterations 必须为正整数")
+        max_rank = dimension if max_rank is None else int(max_rank)
+        if not (1 <= rank_start <= max_rank <= dimension):
+            raise ValueError("需满足 1 <= rank_start <= max_rank <= dimension")
+        if rank_tolerance < 0:
+            raise ValueError("rank_tolerance 必须为非负数")
+
+        self.dimension = dimension
+        self.rank = rank
+        self.objective = objective
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.optimizer_ftol = optimizer_ftol
+        self.optimizer_gtol = optimizer_gtol
+        self.rank_start = rank_start
+        self.max_rank = max_rank
+        self.rank_tolerance = rank_tolerance
+        self.eps_prob = eps_prob
+        self.density_enforce = density_enforce
+        self.projector_set = (
+            ProjectorSet.get(dimension, design=design)
+            if cache_projectors
+            else ProjectorSet(dimension, design=design, cache=False)
+        )
+        self._vectors_cache: Optional[np.ndarray] = None
+
+    # ------------------------------------------------------------------
+    def reconstruct(
+        self,
+        probabilities: np.ndarray,
+        initial_density: Optional[DensityMatrix | np.ndarray] = None,
+    ) -> DensityMatrix:
+        """仅返回最终密度矩阵。"""
+
+        return self.reconstruct_with_details(probabilities, initial_density=initial_density).density
+
+    def reconstruct_with_details(
+        self,
+        probabilities: np.ndarray,
+        initial_density: Optional[DensityMatrix | np.ndarray] = None,
+    ) -> LowRankReconstructionResult:
+        """执行低秩重构并返回详细结果。
+
+        初始因子取 initial_density 的前 r 个特征向量，按特征值平方根加权。缺省时取
+        最大混态处的负梯度算子 -Σ_j w_j P_j（即 RρR 在 I/n 处的 R 算子，差一个单位阵），
+        对 2-设计（MUB、SIC）它与反投影 Σ_j f_j P_j 一致；对 nopovm 它包含按组归一化的修正。
+        """
+
+        raw = np.asarray(probabilities, dtype=float).reshape(-1)
+        f = self._normalize_probabilities(raw)
+        V = self._measurement_vectors()
+        if initial_density is None:
+            _, w, _ = self._evaluate(V.conj(), f)
+            seed = -(V.T @ (w[:, None] * V.conj()))
+        elif isinstance(initial_density, DensityMatrix):
+            seed = initial_density.matrix
+        else:
+            seed = np.asarray(initial_density, dtype=complex)
+            if seed.shape != (self.dimension, self.dimension):
+                raise ValueError("initial_density 形状必须为 (n, n)")
+        seed_vals, seed_vecs = eigh((seed + seed.conj().T) / 2, check_finite=False)
+        seed_vals, seed_vecs = seed_vals[::-1], seed_vecs[:, ::-1]
+
+        rank = self.rank if self.rank is not None else self.rank_start
+        A = seed_vecs[:, :rank] * np.sqrt(np.clip(seed_vals[:rank], 0.0, None) + 1e-6)
+
+        history: List[Tuple[int, float]] = []
+        total_iterations = 0
+        total_evaluations = 0
+        best: Optional[Tuple[np.ndarray, float, bool]] = None
+        while True:
+            A, value, success, nit, nfev = self._optimize(A, f, V)
+            total_iterations += nit
+            total_evaluations += nfev
+            history.append((A.shape[1], value))
+            if self.rank is not None:
+                best = (A, value, success)
+                break
+            if best is not None and best[1] - value <= self._escalation_threshold(raw, best[0].shape[1]):
+                # 增加一列带来的改进可以忽略：保留更小的秩
+                break
+            best = (A, value, success)
+            if A.shape[1] >= self.max_rank:
+                break
+            A = self._escalate(A, f, V)
+
+        A, value, success = best
+        A = A / np.linalg.norm(A)
+        rho = A @ A.conj().T
+        rho = (rho + rho.conj().T) / 2
+        # ρ = A A† 的特征分解直接由 A 的 SVD 给出（O(n² r)），物理化无需再做 eigh
+        U, S, _ = np.linalg.svd(A, full_matrices=True)
+        spectrum = np.zeros(self.dimension)
+        spectrum[: S.size] = S * S
+        q_hat = self._conditional_probabilities(A, V, f)
+        log_likelihood = float(np.dot(f, np.log(np.clip(q_hat, self.eps_prob, None))))
+        # enforce="none" 时 from_trusted 直接持有数组，复制以免与 rho_matrix_raw 别名
+        density = DensityMatrix.from_trusted(
+            rho.copy() if self.density_enforce == "none" else rho,
+            tolerance=self.tolerance,
+            enforce=self.density_enforce,
+            eig=(spectrum, U),
+        )
+        return LowRankReconstructionResult(
+            density=density,
+            rho_matrix_raw=rho,
+            factor=A,
+            rank=A.shape[1],
+            normalized_probabilities=f,
+            expected_probabilities=q_hat,
+            objective_value=float(value),
+            log_likelihood=log_likelihood,
+            success=bool(success),
+            n_iterations=total_iterations,
+            n_function_evaluations=total_evaluations,
+            rank_history=history,
+        )
+
+    # ------------------------------------------------------------------
+    def _optimize(
+        self, A0: np.ndarray, f: np.ndarray, V: np.ndarray
+    ) -> Tuple[np.ndarray, float, bool, int, int]:
+        d, r = A0.shape
+        x0 = np.concatenate([A0.real.ravel(), A0.imag.ravel()])
+        x0 /= np.linalg.norm(x0)
+
+        res = minimize(
+            fun=self._objective_and_gradient,
+            x0=x0,
+            args=(f, V, r),
+            method="L-BFGS-B",
+            jac=True,
+            options={
+                "maxiter": self.max_iterations,
+                "ftol": self.optimizer_ftol,
+                "gtol": self.optimizer_gtol,
+            },
+        )
+        A = self._unpack(res.x, d, r)
+        return (
+            A / np.linalg.norm(A),
+            float(res.fun),
+            bool(res.success),
+            int(getattr(res, "nit", 0) or 0),
+            int(getattr(res, "nfev", 0) or 0),
+        )
+
+    def _objective_and_gradient(
+        self, x: np.ndarray, f: np.ndarray, V: np.ndarray, rank: int
+    ) -> Tuple[float, np.ndarray]:
+        """目标函数及其对 (Re A, Im A) 的解析梯度：∂/∂Re A + i ∂/∂Im A = 2 Vᵀ (w ⊙ B)。"""
+
+        B = V.conj() @ self._unpack(x, self.dimension, rank)
+        value, w, _ = self._evaluate(B, f)
+        G = 2.0 * (V.T @ (w[:, None] * B))
+        return value, np.concatenate([G.real.ravel(), G.imag.ravel()])
+
+    def _evaluate(self, B: np.ndarray, f: np.ndarray) -> Tuple[float, np.ndarray, np.ndarray]:
+        """由 B = V* A 计算目标函数值、对 q_j 的权重 w 与按组条件概率 q̂。
+
+        记 q_j = ‖B_j‖²，Q_g = Σ_{j∈g} q_j，q̂_j = q_j / Q_g，ℓ_j 为目标函数对 q̂_j 的偏导，
+        则 w_k = ∂/∂q_k = ℓ_k / Q_g - Σ_{j∈g} ℓ_j q̂_j / Q_g，ρ 空间梯度算子为 Σ_k w_k P_k。
+        """
+
+        q = np.einsum("ij,ij->i", B.real, B.real) + np.einsum("ij,ij->i", B.imag, B.imag)
+        q = np.maximum(q, self.eps_prob)
+        group_index = self.projector_set.group_index
+        Q = group_index.group_sums(q)
+        Q_j = Q[group_index.inverse]
+        q_hat = q / Q_j
+        if self.objective == "likelihood":
+            value = -float(np.dot(f, np.log(q_hat)))
+            dl = -f / q_hat
+        else:
+            diff = f - q_hat
+            value = float(np.sum(diff * diff / q_hat))
+            dl = (q_hat * q_hat - f * f) / (q_hat * q_hat)
+        correction = group_index.group_sums(dl * q_hat) / Q
+        w = dl / Q_j - correction[group_index.inverse]
+        return value, w, q_hat
+
+    def _escalation_threshold(self, raw: np.ndarray, rank: int) -> float:
+        """秩从 rank 提升到 rank + 1 时，目标函数改进需超过的阈值。"""
+
+        group_index = self.projector_set.group_index
+        total = float(np.sum(raw))
+        # 各组总和均接近 1 时视为概率输入，无法给出统计阈值
+        if np.allclose(group_index.group_sums(raw), 1.0, atol=1e-6):
+            return self.rank_tolerance
+        extra_params = 2 * (self.dimension - rank) - 1
+        factor = 1.0 if self.objective == "likelihood" else 2.0
+        aic = factor * group_index.num_groups * extra_params / total
+        return max(self.rank_tolerance, aic)
+
+    def _escalate(self, A: np.ndarray, f: np.ndarray, V: np.ndarray) -> np.ndarray:
+        """沿 ρ 空间梯度算子 Σ_k w_k P_k 最小特征值对应的方向（最大下降方向）增加一列。"""
+
+        _, w, _ = self._evaluate(V.conj() @ A, f)
+        G = V.T @ (w[:, None] * V.conj())
+        _, vecs = eigh((G + G.conj().T) / 2, subset_by_index=[0, 0], check_finite=False)
+        return np.hstack([A, _ESCALATION_SCALE * np.linalg.norm(A) * vecs])
+
+    def _conditional_probabilities(self, A: np.ndarray, V: np.ndarray, f: np.ndarray) -> np.ndarray:
+        return self._evaluate(V.conj() @ A, f)[2]
+
+    @staticmethod
+    def _unpack(x: np.ndarray, d: int, rank: int) -> np.ndarray:
+        half = d * rank
+        return (x[:half] + 1j * x[half:]).reshape(d, rank)
+
+    def _normalize_probabilities(self, probabilities: np.ndarray) -> np.ndarray:
+        probs = np.asarray(probabilities, dtype=float).reshape(-1)
+        group_index = self.projector_set.group_index
+        if probs.size != group_index.size:
+            raise ValueError(
+                f"probability vector length must be {group_index.size}, got {probs.size}"
+            )
+        return normalize_per_group(probs, group_index, tolerance=self.tolerance)
+
+    def _measurement_vectors(self) -> np.ndarray:
+        """(m, n) 矩阵，第 j 行 v_j 满足 P_j = v_j v_j†（首次调用时由投影算符提取）。"""
+
+        if self._vectors_cache is None:
+            projectors = self.projector_set.projectors
+            m = projectors.shape[0]
+            diag = np.real(np.einsum("jii->ji", projectors))
+            pivot = np.argmax(diag, axis=1)
+            rows = np.arange(m)
+            scale = np.sqrt(np.clip(diag[rows, pivot], 1e-300, None))
+            vectors = projectors[rows, :, pivot] / scale[:, None]
+            residual = np.max(np.abs(np.einsum("ji,jk->jik", vectors, vectors.conj()) - projectors))
+            if residual > 1e-8:
+                raise ValueError("低秩重构要求测量算符均为秩 1 投影")
+            self._vectors_cache = vectors
+        return self._vectors_cache
+
+
+__all__ = ["LowRankReconstructor", "LowRankReconstructionResult"]
@@ -6,15 +6,27 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from typing import Optional, Literal, Tuple
 
 import numpy as np
 
 from qtomography.domain.density import DensityMatrix
+from qtomography.domain.density_batch import DensityBatch
+from qtomography.domain.factorization import NormalizedPOVM
+from qtomography.domain.grouping import normalize_per_group
 from qtomography.domain.projectors import ProjectorSet
 
 
+# 热启动时与最大混态 I/d_supp 的混合权重 ε（保证初始 σ 满秩，RρR 无法恢复被置零的特征方向）
+_WARM_START_MIXING = 1e-3
+
+# 动量模式：最近 _MOMENTUM_WINDOW 次迭代内重启超过 _MOMENTUM_MAX_RESTARTS 次视为振荡，此后退回普通 RρR
+_MOMENTUM_WINDOW = 100
+_MOMENTUM_MAX_RESTARTS = 25
+
+
 @dataclass
 class RrhoStrictReconstructionResult:
     """严格 RρR 重建的结果。
@@ -28,6 +40,7 @@ class RrhoStrictReconstructionResult:
         iterations: 执行的迭代次数。
         converged: 是否满足停止条件。
         diagnostics: 可选的诊断信息（字典），包含支撑维度、H 的最小/最大特征值等。
+        warm_started: 最终结果是否来自调用方提供的热启动 σ（否则来自 I/d_supp）。
     """
 
     density: DensityMatrix
@@ -38,6 +51,76 @@ class RrhoStrictReconstructionResult:
     iterations: int
     converged: bool
     diagnostics: dict
+    warm_started: bool = False
+
+
+@dataclass
+class RrhoStrictBatchReconstructionResult:
+    """批量严格 RρR 的堆叠结果（N 个样本共享同一缓存的 Ē 与支撑算子）。
+
+    属性:
+        densities: (N, n, n) 物理化后的密度矩阵堆栈。
+        rho_matrices_raw: (N, n, n) 映射回 ρ 空间的原始矩阵堆栈。
+        sigma_matrices: (N, d_supp, d_supp) 支撑上的最终 σ 堆栈。
+        expected_probabilities: (m, N) 每个样本最后一次迭代的条件概率 q_j。
+        log_likelihoods: (N,) 每个样本的最终对数似然。
+        iterations: (N,) 每个样本执行的迭代次数。
+        converged: (N,) 每个样本是否满足停止条件。
+        decrease_ll_counts: (N,) 每个样本对数似然下降的次数。
+        reset_counts: (N,) 每个样本因迹过小而重置 σ 的次数。
+        diagnostics: 所有样本共享的诊断信息（支撑维度、H 特征值、Ē 验证）。
+        tolerance: 构造单样本 DensityMatrix 时使用的数值容差。
+    """
+
+    densities: np.ndarray
+    rho_matrices_raw: np.ndarray
+    sigma_matrices: np.ndarray
+    expected_probabilities: np.ndarray
+    log_likelihoods: np.ndarray
+    iterations: np.ndarray
+    converged: np.ndarray
+    decrease_ll_counts: np.ndarray
+    reset_counts: np.ndarray
+    diagnostics: dict
+    tolerance: float = 1e-10
+
+    @property
+    def num_samples(self) -> int:
+        """批量中的样本数 N。"""
+        return int(self.densities.shape[0])
+
+    @property
+    def density_batch(self) -> DensityBatch:
+        """以 DensityBatch 形式返回密度矩阵堆栈，供向量化计算纯度 / 特征值 / 熵等指标。"""
+        return DensityBatch(self.densities, tolerance=self.tolerance)
+
+    def result_at(self, index: int) -> RrhoStrictReconstructionResult:
+        """取出第 ``index`` 个样本，封装为单样本 RrhoStrictReconstructionResult。"""
+
+        converged = bool(self.converged[index])
+        # 复制一份：from_trusted 直接持有数组，不应与可写的批量堆栈共享内存
+        density = DensityMatrix.from_trusted(
+            self.densities[index].copy(),
+            tolerance=self.tolerance,
+            enforce="none",
+        )
+        diagnostics = {
+            **self.diagnostics,
+            "converged": converged,
+            "warm_started": False,
+            "decrease_ll_count": int(self.decrease_ll_counts[index]),
+            "reset_count": int(self.reset_counts[index]),
+        }
+        return RrhoStrictReconstructionResult(
+            density=density,
+            rho_matrix_raw=self.rho_matrices_raw[index].copy(),
+            sigma_matrix=self.sigma_matrices[index].copy(),
+            expected_probabilities=self.expected_probabilities[:, index].copy(),
+            log_likelihood=float(self.log_likelihoods[index]),
+            iterations=int(self.iterations[index]),
+            converged=converged,
+            diagnostics=diagnostics,
+        )
 
 
 class RrhoStrictReconstructor:
@@ -47,6 +130,13 @@ class RrhoStrictReconstructor:
     构造 H = ∑ M_j，限制到其支撑 Π（基为 US），定义
     Ē_j = H^{-1/2} M_j H^{-1/2}（约化到支撑），并在 σ 空间中执行标准
     RρR。最后通过 ρ = H^{-1/2} σ H^{-1/2} / Tr(H^{-1} σ) 映射回原空间。
+
+    check_every 控制收敛判据（状态差与对数似然差）的检查间隔，默认每次迭代检查；
+    取 k > 1 时迭代次数按 k 向上取整，但省去多数迭代中的范数与对数计算。
+
+    acceleration="momentum" 时在因子空间 σ = AA† 上做 Nesterov 外推（A 的 RρR 更新
+    为 A ← R A），以梯度判据重启动量，并在对数似然下降时退回普通 RρR 步，
+    对近纯态通常可将迭代次数降低一个数量级。
     """
 
     def __init__(
@@ -66,6 +156,8 @@ class RrhoStrictReconstructor:
         eig_abs_thresh: Optional[float] = None,
         verbose: bool = False,
         validate_etilde_strict: bool = False,
+        check_every: int = 1,
+        acceleration: Literal["none", "momentum"] = "none",
     ) -> None:
         if dimension < 2:
             raise ValueError("维度必须 >= 2")
@@ -73,6 +165,10 @@ class RrhoStrictReconstructor:
             raise ValueError("diluted_mu 必须在 (0,1] 范围内")
         if max_iterations <= 0:
             raise ValueError("max_iterations 必须为正数")
+        if check_every <= 0:
+            raise ValueError("check_every 必须为正整数")
+        if acceleration not in ("none", "momentum"):
+            raise ValueError(f"未知的加速模式: {acceleration!r}")
 
         self.dimension = dimension
         self.design = design
@@ -87,6 +183,8 @@ class RrhoStrictReconstructor:
         self.eig_abs_thresh = eig_abs_thresh
         self.verbose = verbose
         self.validate_etilde_strict = validate_etilde_strict
+        self.check_every = int(check_every)
+        self.acceleration = acceleration
         self.projector_set = (
             ProjectorSet.get(dimension, design=design)
             if cache_projectors
@@ -105,23 +203,47 @@ class RrhoStrictReconstructor:
     def reconstruct_with_details(
         self,
         counts_or_probs: np.ndarray,
+        initial_sigma: Optional[np.ndarray] = None,
     ) -> RrhoStrictReconstructionResult:
-        """运行严格 RρR 并返回详细结果。"""
+        """运行严格 RρR 并返回详细结果。
+
+        initial_sigma: 可选的支撑空间初始 σ（通常为相邻样本结果的 ``sigma_matrix``），
+            与 I/d_supp 按 ε 混合后作为热启动点。若其初始对数似然低于最大混态，
+            或热启动迭代未收敛且冷启动结果似然更高，则自动回退到 I/d_supp。
+            热启动未收敛而重跑时，iterations 为两次迭代的总和（反映实际开销）。
+        """
 
         # 按组归一化，将输入解释为条件频率
         f = self._normalize_per_group(counts_or_probs)
 
-        # 准备 H、支撑 Π/US，以及支撑上的 Ē
-        projectors = self.projector_set.projectors  # (m, d, d)
-        H = np.sum(projectors, axis=0)
-        (Pi, H_sqrt, H_sqrt_inv, H_inv, support_dim, w_min, w_max, US) = self._prepare_support_operators(H)
-
-        # 在支撑基上构建约化的 Ē: (m, d_supp, d_supp)
-        E_tilde, etilde_diagnostics = self._build_normalized_povm(projectors, US, H_sqrt_inv, support_dim)
+        # H 的支撑算子与支撑上的 Ē 只依赖设计与阈值：从共享缓存获取
+        povm = self._normalized_povm()
+        E_tilde = povm.operators
+        support_dim = povm.support_dim
+        US = povm.support_basis
+        H_sqrt_inv = povm.h_sqrt_inv
+        H_inv = povm.h_inv
 
         # 在支撑上的 σ 空间中执行 RρR
-        sigma0 = np.eye(support_dim, dtype=complex) / float(support_dim)
-        sigma, q, iters, converged, ll, iter_diagnostics = self._iterate_rrr_sigma(E_tilde, f, sigma0)
+        sigma_mixed = np.eye(support_dim, dtype=complex) / float(support_dim)
+        sigma0 = sigma_mixed
+        warm_started = False
+        if initial_sigma is not None:
+            sigma_warm = self._prepare_initial_sigma(initial_sigma, support_dim)
+            if self._log_likelihood(E_tilde, f, sigma_warm) >= self._log_likelihood(E_tilde, f, sigma_mixed):
+                sigma0 = sigma_warm
+                warm_started = True
+        iterate = self._iterate_rrr_momentum if self.acceleration == "momentum" else self._iterate_rrr_sigma
+        sigma, q, iters, converged, ll, iter_diagnostics = iterate(E_tilde, f, sigma0)
+        if warm_started and not converged:
+            # 热启动未收敛：以最大混态重跑，保留似然更高者
+            cold = iterate(E_tilde, f, sigma_mixed)
+            warm_iters = iters
+            if cold[4] > ll:
+                sigma, q, iters, converged, ll, iter_diagnostics = cold
+                warm_started = False
+            # 两次迭代都计入开销，无论保留哪一个
+            iters = warm_iters + cold[2]
 
         # 映射回 ρ 空间：通过 US 提升 σ，然后进行 H^{-1/2} sandwich
         sigma_full = US @ sigma @ US.conj().T
@@ -131,7 +253,7 @@ class RrhoStrictReconstructor:
         rho_raw = rho_raw / denom
         rho_raw = (rho_raw + rho_raw.conj().T) / 2
 
-        density = DensityMatrix(
+        density = DensityMatrix.from_trusted(
             rho_raw,
             tolerance=self.tolerance,
             enforce="within_tol",
@@ -141,10 +263,11 @@ class RrhoStrictReconstructor:
 
         diagnostics = {
             "support_dim": int(support_dim),
-            "eig_min_H": float(w_min),
-            "eig_max_H": float(w_max),
+            "eig_min_H": povm.eig_min_H,
+            "eig_max_H": povm.eig_max_H,
             "converged": bool(converged),
-            **etilde_diagnostics,  # 包含 E_tilde 验证诊断信息
+            "warm_started": bool(warm_started),
+            **povm.diagnostics,  # 包含 E_tilde 验证诊断信息
             **iter_diagnostics,  # 包含迭代诊断信息
         }
 
@@ -157,119 +280,172 @@ class RrhoStrictReconstructor:
             iterations=iters,
             converged=converged,
             diagnostics=diagnostics,
+            warm_started=warm_started,
         )
 
-    # ------------------------------------------------------------------
-    # 内部方法
-    # ------------------------------------------------------------------
-    def _normalize_per_group(self, counts_or_probs: np.ndarray) -> np.ndarray:
-        v = np.asarray(counts_or_probs, dtype=float).reshape(-1)
-        m = self.projector_set.projectors.shape[0]
-        if v.size != m:
-            raise ValueError(f"输入长度必须为 {m}，得到 {v.size}")
-        groups = getattr(self.projector_set, "groups", None)
-        if groups is None or len(groups) != m:
-            total = float(np.sum(v))
-            if np.isclose(total, 0.0, atol=self.tolerance):
-                raise ValueError("总和为零；无法归一化")
-            return v / total
-        out = v.astype(float).copy()
-        for g in np.unique(groups):
-            idx = np.where(groups == g)[0]
-            s = float(np.sum(out[idx]))
-            if np.isclose(s, 0.0, atol=self.tolerance):
-                raise ValueError("组总和为零；无法归一化")
-            out[idx] = out[idx] / s
-        return out
-
-    def _prepare_support_operators(
-        self, H: np.ndarray
-    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, int, float, float, np.ndarray]:
-        # 厄米对称化
-        Hh = (H + H.conj().T) / 2
-        w, U = np.linalg.eigh(Hh)
-        w = np.real(w)
-        w_max = float(np.max(w))
-        tau_abs = float(self.eig_abs_thresh) if self.eig_abs_thresh is not None else 0.0
-        tau_rel = float(self.eig_rel_thresh) * max(w_max, 1.0)
-        tau = max(tau_abs, tau_rel)
-        S = w > tau
-        if not np.any(S):
-            idx = int(np.argmax(w))
-            S = np.zeros_like(w, dtype=bool)
-            S[idx] = True
-        wS = w[S]
-        US = U[:, S]  # (d, d_supp)
-        Pi = US @ US.conj().T  # (d, d)
-        sqrt_wS = np.sqrt(wS)
-        inv_sqrt_wS = 1.0 / np.maximum(sqrt_wS, self.eps_prob)
-        inv_wS = 1.0 / np.maximum(wS, self.eps_prob)
-        H_sqrt = US @ np.diag(sqrt_wS) @ US.conj().T  # (d, d)
-        H_sqrt_inv = US @ np.diag(inv_sqrt_wS) @ US.conj().T  # (d, d)
-        H_inv = US @ np.diag(inv_wS) @ US.conj().T  # (d, d)
-        return Pi, H_sqrt, H_sqrt_inv, H_inv, US.shape[1], float(np.min(wS)), float(np.max(wS)), US
-
-    def _build_normalized_povm(
+    def reconstruct_batch(
         self,
-        projectors: np.ndarray,
-        US: np.ndarray,
-        H_sqrt_inv: np.ndarray,
-        support_dim: int,
-    ) -> Tuple[np.ndarray, dict]:
-        """在支撑基上构建约化的 Ē_j: Ẽ_a = B† M_a B，其中 B = H^{-1/2} US。
-        
-        返回:
-            E_tilde: 支撑上的归一化 POVM，形状为 (m, d_supp, d_supp)
-            diagnostics: 包含验证指标的字典
+        counts_2d: np.ndarray,
+    ) -> RrhoStrictBatchReconstructionResult:
+        """对 (m, N) 计数/概率矩阵的 N 列同时执行严格 RρR。
+
+        σ 以 (N, d_supp, d_supp) 张量堆叠：每次迭代中 q 与 R 分别是实堆叠 Ē 上的一次
+        (N, 2·d_supp²)×(2·d_supp², m) 与 (N, m)×(m, 2·d_supp²) 矩阵乘法，σ 更新为批量
+        matmul。每个样本独立按 tol_state / tol_ll 判定收敛（每 check_every 次迭代），
+        已收敛样本退出后续计算。使用普通（可稀释）RρR 迭代，不使用动量加速；
+        逐样本结果与 ``reconstruct_with_details`` 在舍入误差内一致。
         """
-        B = H_sqrt_inv @ US  # (d, d_supp)
-        E_tilde = np.einsum('pi,apq,qj->aij', B.conj(), projectors, B, optimize=True)
-        E_tilde = (E_tilde + np.transpose(E_tilde.conj(), (0, 2, 1))) / 2
-        
-        # 验证：Σ Ē_j 在支撑上应该等于 I
-        E_sum = np.sum(E_tilde, axis=0)
-        expected_I = np.eye(support_dim, dtype=complex)
-        
-        # 计算偏差
-        E_sum_diff = E_sum - expected_I
-        max_dev_abs = float(np.max(np.abs(E_sum_diff)))
-        max_dev_fro = float(np.linalg.norm(E_sum_diff, ord='fro'))
-        
-        # 基于支撑维度的自适应容差
-        atol_adaptive = 1e-8 * max(support_dim, 1.0)
-        
+
+        f_all = self._normalize_per_group(counts_2d, batch=True).T  # (N, m)
+        num_samples, m = f_all.shape
+        povm = self._normalized_povm()
+        d_supp = povm.support_dim
+        E = np.ascontiguousarray(povm.operators).reshape(m, d_supp * d_supp).view(float)
+        eye = np.eye(d_supp, dtype=complex)
+        diag = np.arange(d_supp)
+        check_every = self.check_every
+
+        sigma = np.broadcast_to(eye / float(d_supp), (num_samples, d_supp, d_supp)).copy()
+        q_all = np.empty((num_samples, m), dtype=float)
+        ll_all = np.full(num_samples, -np.inf)
+        iterations = np.full(num_samples, self.max_iterations, dtype=int)
+        converged = np.zeros(num_samples, dtype=bool)
+        decrease_ll_counts = np.zeros(num_samples, dtype=int)
+        reset_counts = np.zeros(num_samples, dtype=int)
+        active = np.arange(num_samples)
+
+        for it in range(1, self.max_iterations + 1):
+            if active.size == 0:
+                break
+            sig = sigma[active]
+            f = f_all[active]
+            q = sig.reshape(active.size, -1).view(float) @ E.T  # (a, m)
+            np.maximum(q, self.eps_prob, out=q)
+            ll = np.sum(f * np.log(q), axis=1)
+            ll_prev = ll_all[active]
+            if it > 1:
+                decrease_ll_counts[active] += ll - ll_prev < -1e-10
+            q_all[active] = q
+            ll_all[active] = ll
+
+            R = np.ascontiguousarray((f / q) @ E).view(complex).reshape(active.size, d_supp, d_supp)
+            if self.use_diluted:
+                R *= self.diluted_mu
+                R[:, diag, diag] += 1.0 - self.diluted_mu
+            new = R @ sig @ R
+            new += np.conj(np.swapaxes(new, 1, 2))
+            tr = 0.5 * np.real(np.trace(new, axis1=1, axis2=2))
+            small = tr <= self.eps_prob
+            if np.any(small):
+                reset_counts[active[small]] += 1
+                new[small] = eye / float(d_supp)
+                tr[small] = 0.5
+            new *= (0.5 / tr)[:, None, None]
+            sigma[active] = new
+
+            if it % check_every == 0 or it == self.max_iterations:
+                dn = np.linalg.norm((new - sig).reshape(active.size, -1), axis=1)
+                dll = np.abs(ll - ll_prev) if it > 1 else np.full(active.size, np.inf)
+                done = (dn < self.tol_state) & (dll < self.tol_ll)
+                converged[active[done]] = True
+                iterations[active[done]] = it
+                active = active[~done]
+
+        # 映射回 ρ 空间：ρ = H^{-1/2} US σ US† H^{-1/2} / Tr(H^{-1} US σ US†)
+        US = povm.support_basis
+        sigma_full = US @ sigma @ US.conj().T
+        rho_raw = povm.h_sqrt_inv @ sigma_full @ povm.h_sqrt_inv
+        denom = np.real(np.trace(povm.h_inv @ sigma_full, axis1=1, axis2=2))
+        rho_raw /= np.maximum(denom, self.eps_prob)[:, None, None]
+        rho_raw = (rho_raw + np.conj(np.swapaxes(rho_raw, 1, 2))) / 2
+        densities = DensityMatrix.physicalize_stack(rho_raw, tolerance=self.tolerance, enforce="within_tol")
+
         diagnostics = {
-            "etilde_sum_max_dev_abs": max_dev_abs,
-            "etilde_sum_max_dev_fro": max_dev_fro,
-            "etilde_sum_valid": bool(np.allclose(E_sum, expected_I, atol=atol_adaptive)),
+            "support_dim": int(d_supp),
+            "eig_min_H": povm.eig_min_H,
+            "eig_max_H": povm.eig_max_H,
+            **povm.diagnostics,
         }
-        
-        # 可选的严格验证
+        return RrhoStrictBatchReconstructionResult(
+            densities=densities,
+            rho_matrices_raw=rho_raw,
+            sigma_matrices=sigma,
+            expected_probabilities=np.ascontiguousarray(q_all.T),
+            log_likelihoods=ll_all,
+            iterations=iterations,
+            converged=converged,
+            decrease_ll_counts=decrease_ll_counts,
+            reset_counts=reset_counts,
+            diagnostics=diagnostics,
+            tolerance=self.tolerance,
+        )
+
+    # ------------------------------------------------------------------
+    # 内部方法
+    # ------------------------------------------------------------------
+    def _normalize_per_group(self, counts_or_probs: np.ndarray, batch: bool = False) -> np.ndarray:
+        group_index = self.projector_set.group_index
+        m = group_index.size
+        if batch:
+            v = np.asarray(counts_or_probs, dtype=float)
+            if v.ndim == 1:
+                v = v.reshape(-1, 1)
+            if v.ndim != 2 or v.shape[0] != m:
+                raise ValueError(f"输入必须为 ({m}, N) 矩阵，得到 {v.shape}")
+        else:
+            v = np.asarray(counts_or_probs, dtype=float).reshape(-1)
+            if v.size != m:
+                raise ValueError(f"输入长度必须为 {m}，得到 {v.size}")
+        return normalize_per_group(
+            v, group_index, tolerance=self.tolerance, zero_sum_message="组总和为零；无法归一化"
+        )
+
+    @staticmethod
+    def _prepare_initial_sigma(initial_sigma: np.ndarray, support_dim: int) -> np.ndarray:
+        sigma = np.asarray(initial_sigma, dtype=complex)
+        if sigma.shape != (support_dim, support_dim):
+            raise ValueError(f"initial_sigma 形状必须为 ({support_dim}, {support_dim})，得到 {sigma.shape}")
+        sigma = (sigma + sigma.conj().T) / 2
+        tr = float(np.real(np.trace(sigma)))
+        if not np.isfinite(tr) or tr <= 0:
+            raise ValueError("initial_sigma 的迹必须为正")
+        eye = np.eye(support_dim, dtype=complex) / float(support_dim)
+        return (1.0 - _WARM_START_MIXING) * (sigma / tr) + _WARM_START_MIXING * eye
+
+    def _log_likelihood(self, E_tilde: np.ndarray, f: np.ndarray, sigma: np.ndarray) -> float:
+        q = np.real(E_tilde.reshape(E_tilde.shape[0], -1) @ sigma.conj().reshape(-1))
+        return float(np.sum(f * np.log(np.clip(q, self.eps_prob, None))))
+
+    def _normalized_povm(self) -> NormalizedPOVM:
+        povm = self.projector_set.normalized_povm(
+            eig_rel_thresh=self.eig_rel_thresh,
+            eig_abs_thresh=self.eig_abs_thresh,
+            eps_prob=self.eps_prob,
+        )
+        # 可选的严格验证：Σ Ē_j 在支撑上应等于 I
+        atol_adaptive = 1e-8 * max(povm.support_dim, 1.0)
+        max_dev_abs = povm.diagnostics["etilde_sum_max_dev_abs"]
         if self.validate_etilde_strict and max_dev_abs > atol_adaptive:
             raise RuntimeError(
                 f"归一化 POVM 验证失败（严格模式）："
                 f"最大偏差 {max_dev_abs:.2e} > 容差 {atol_adaptive:.2e}"
             )
-        
-        # 可选：对样本进行快速正定性检查
-        if support_dim <= 10:  # 仅适用于小维度
-            sample_idx = min(2, E_tilde.shape[0])
-            min_eig_sample = []
-            for i in range(sample_idx):
-                eigvals = np.linalg.eigvalsh(E_tilde[i])
-                min_eig_sample.append(float(np.min(eigvals)))
-            diagnostics["etilde_min_eig_sample"] = float(np.min(min_eig_sample)) if min_eig_sample else None
-        
-        return E_tilde, diagnostics
+        return povm
 
     def _iterate_rrr_sigma(
         self,
         E_tilde: np.ndarray,
         f: np.ndarray,
         sigma0: np.ndarray,
+        max_iterations: Optional[int] = None,
     ) -> Tuple[np.ndarray, np.ndarray, int, bool, float, dict]:
         """在 σ 空间中使用约化的 Ē_j 执行标准 RρR 迭代。
-        
+
+        Ē_j 与 σ 均为厄米矩阵，故 q_j = Tr(Ē_j σ) = Σ_ik Re(Ē_j)_ik Re σ_ik + Im(Ē_j)_ik Im σ_ik。
+        将 Ē 保存为实堆叠矩阵 E (m, 2·d_supp²) 后，q = E·vec(σ) 与 R = Eᵀ·r
+        都是写入预分配缓冲区的实 GEMV，σ 更新使用双缓冲，不再逐次规划 einsum。
+        收敛判据（以及对数似然）每 check_every 次迭代计算一次。
+
         返回:
             sigma: 最终的 σ 矩阵
             q: 最终概率
@@ -278,9 +454,27 @@ class RrhoStrictReconstructor:
             log_likelihood: 最终对数似然
             diagnostics: 包含迭代统计信息的字典
         """
+        max_iterations = self.max_iterations if max_iterations is None else int(max_iterations)
         d_supp = sigma0.shape[0]
-        sigma = sigma0.copy()
-        ll_prev = -np.inf
+        m = E_tilde.shape[0]
+        E = np.ascontiguousarray(E_tilde, dtype=complex).reshape(m, d_supp * d_supp).view(float)
+        E_T = E.T  # R = Eᵀ r
+
+        # 预分配缓冲区：σ 双缓冲、R、中间积以及 q / r / log q
+        sigma = np.array(sigma0, dtype=complex, order='C')
+        sigma_next = np.empty_like(sigma)
+        product = np.empty_like(sigma)
+        R = np.empty_like(sigma)
+        R_real = R.reshape(-1).view(float)
+        q = np.empty(m, dtype=float)
+        r = np.empty(m, dtype=float)
+        log_q = np.empty(m, dtype=float)
+        diag = np.arange(d_supp)
+        check_every = self.check_every
+
+        ll = -np.inf
+        ll_it = 0  # ll 对应的迭代序号
+        dll = float('inf')
         converged = False
         
         # 诊断计数器
@@ -292,60 +486,223 @@ class RrhoStrictReconstructor:
         final_dn = None
         final_dll = None
 
-        for it in range(1, self.max_iterations + 1):
-            sigma = (sigma + sigma.conj().T) / 2
-            q = np.real(np.einsum('aij,ji->a', E_tilde, sigma, optimize=True))
-            q = np.clip(q, self.eps_prob, None)
-            min_q = min(min_q, float(np.min(q)))
+        for it in range(1, max_iterations + 1):
+            np.dot(E, sigma.reshape(-1).view(float), out=q)
+            np.maximum(q, self.eps_prob, out=q)
+            min_q = min(min_q, float(q.min()))
+
+            # 对数似然只在判据迭代及其前一次迭代上计算（check_every=1 时每次迭代）
+            check = it % check_every == 0 or it == max_iterations
+            if check or (it + 1) % check_every == 0:
+                np.log(q, out=log_q)
+                ll_new = float(np.dot(f, log_q))
+                # 单调性监控（仅比较相邻迭代）
+                if ll_it == it - 1 and it > 1:
+                    delta_logL = ll_new - ll
+                    dll = abs(delta_logL)
+                    if delta_logL < -1e-10:  # 允许小的数值误差
+                        decrease_ll_count += 1
+                        if self.verbose:
+                            print(f"警告：迭代 {it} 时对数似然下降 {delta_logL:.2e}（可能实现问题）")
+                else:
+                    dll = float('inf')
+                ll, ll_it = ll_new, it
+
+            np.divide(f, q, out=r)
+            np.dot(E_T, r, out=R_real)
+            if self.use_diluted:
+                R *= self.diluted_mu
+                R[diag, diag] += 1.0 - self.diluted_mu
+
+            np.matmul(R, sigma, out=product)
+            np.matmul(product, R, out=sigma_next)
+            sigma_next += sigma_next.conj().T
+            tr = 0.5 * float(np.real(np.trace(sigma_next)))
+            min_trace = min(min_trace, tr)
             
-            ll = float(np.sum(f * np.log(q)))
+            if tr <= self.eps_prob:
+                reset_count += 1
+                if reset_first_iter is None:
+                    reset_first_iter = int(it)
+                sigma_next[...] = 0.0
+                sigma_next[diag, diag] = 1.0 / float(d_supp)
+                if self.verbose:
+                    print(f"警告：迭代 {it} 时迹过小 ({tr:.2e} ≤ {self.eps_prob:.2e})，重置")
+            else:
+                sigma_next *= 0.5 / tr
 
-            # 单调性监控
-            if it > 1:
-                delta_logL = ll - ll_prev
-                if delta_logL < -1e-10:  # 允许小的数值误差
-                    decrease_ll_count += 1
-                    if self.verbose:
-                        print(f"警告：迭代 {it} 时对数似然下降 {delta_logL:.2e}（可能实现问题）")
-
-            r = f / q
-            R = np.einsum('a,aij->ij', r, E_tilde, optimize=True)
-            R = (R + R.conj().T) / 2
+            sigma, sigma_next = sigma_next, sigma
+            if check:
+                dn = float(np.linalg.norm(sigma - sigma_next))
+                final_dn = dn
+                final_dll = dll
+                if dn < self.tol_state and dll < self.tol_ll:
+                    converged = True
+                    break
+
+        if not converged and self.verbose:
+            print(f"警告：已达最大迭代次数 {max_iterations}，可能未完全收敛")
+
+        diagnostics = {
+            "decrease_ll_count": int(decrease_ll_count),
+            "reset_count": int(reset_count),
+            "reset_first_iter": reset_first_iter,
+            "min_q": float(min_q),
+            "min_trace": float(min_trace),
+            "final_dn": float(final_dn) if final_dn is not None else None,
+            "final_dll": float(final_dll) if final_dll is not None else None,
+        }
+
+        return sigma, q, (it if converged else max_iterations), converged, ll, diagnostics
+
+
+    def _iterate_rrr_momentum(
+        self,
+        E_tilde: np.ndarray,
+        f: np.ndarray,
+        sigma0: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, int, bool, float, dict]:
+        """带动量外推与重启的加速 RρR 迭代（因子空间 σ = AA†）。
+
+        每次迭代在外推点 Y = A_k + β_k (A_k - A_{k-1})，β_k = (k-1)/(k+2) 处计算
+        R(Y)，令 A_{k+1} ∝ R(Y) Y。当 ⟨A_{k+1} - Y, A_k - A_{k-1}⟩ < 0 时重置 k（梯度重启）；
+        若新点的对数似然仍下降，则计入 decrease_ll_count 并改用自 A_k 出发的普通 RρR 步。
+        停止判据对“自当前点的一步普通 RρR”求值（额外两次 GEMV，仅在检查迭代上计算）。
+        返回值与 `_iterate_rrr_sigma` 相同，诊断中另含 restart_count。
+        """
+        d_supp = sigma0.shape[0]
+        m = E_tilde.shape[0]
+        E = np.ascontiguousarray(E_tilde, dtype=complex).reshape(m, d_supp * d_supp).view(float)
+        E_T = E.T
+
+        # σ0 = A0 A0†（σ0 为满秩厄米矩阵，取特征分解的平方根因子）
+        w, U = np.linalg.eigh(np.asarray(sigma0, dtype=complex))
+        A = np.ascontiguousarray(U * np.sqrt(np.clip(w, 0.0, None)))
+        A /= np.sqrt(np.vdot(A, A).real)
+        A_prev = A.copy()
+        R = np.empty((d_supp, d_supp), dtype=complex)
+        R_real = R.reshape(-1).view(float)
+        r = np.empty(m, dtype=float)
+        diag = np.arange(d_supp)
+        check_every = self.check_every
+
+        def expected(factor: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            sigma_f = factor @ factor.conj().T
+            q_f = E @ sigma_f.reshape(-1).view(float)
+            np.maximum(q_f, self.eps_prob, out=q_f)
+            return sigma_f, q_f
+
+        def rrr_step(factor: np.ndarray, q_f: np.ndarray) -> np.ndarray:
+            np.divide(f, q_f, out=r)
+            np.dot(E_T, r, out=R_real)
             if self.use_diluted:
-                R = self.diluted_mu * R + (1.0 - self.diluted_mu) * np.eye(d_supp, dtype=complex)
+                R[...] *= self.diluted_mu
+                R[diag, diag] += 1.0 - self.diluted_mu
+            return R @ factor
 
-            sigma_prev = sigma
-            sigma = R @ sigma @ R
-            sigma = (sigma + sigma.conj().T) / 2
-            tr = float(np.real(np.trace(sigma)))
+        sigma, q = expected(A)
+        ll = float(np.dot(f, np.log(q)))
+        converged = False
+        k = 1
+        oscillating = False
+        restart_window: deque = deque()
+
+        decrease_ll_count = 0
+        restart_count = 0
+        reset_count = 0
+        reset_first_iter = None
+        min_q = float(q.min())
+        min_trace = float('inf')
+        final_dn = None
+        final_dll = None
+
+        for it in range(1, self.max_iterations + 1):
+            beta = (k - 1.0) / (k + 2.0)
+            Y = A + beta * (A - A_prev) if beta > 0.0 else A
+            _, q_y = expected(Y) if beta > 0.0 else (sigma, q)
+            A_next = rrr_step(Y, q_y)
+
+            # 梯度重启：新步方向与动量方向相反时清零动量
+            if beta > 0.0 and np.vdot(A_next - Y, A - A_prev).real < 0.0:
+                restart_count += 1
+                restart_window.append(it)
+                while restart_window and restart_window[0] <= it - _MOMENTUM_WINDOW:
+                    restart_window.popleft()
+                if len(restart_window) > _MOMENTUM_MAX_RESTARTS:
+                    oscillating = True
+                k = 1
+            else:
+                k += 1
+
+            tr = float(np.vdot(A_next, A_next).real)
             min_trace = min(min_trace, tr)
-            
             if tr <= self.eps_prob:
                 reset_count += 1
                 if reset_first_iter is None:
                     reset_first_iter = int(it)
-                sigma = np.eye(d_supp, dtype=complex) / float(d_supp)
+                A_next = np.eye(d_supp, dtype=complex) / np.sqrt(d_supp)
+                k = 1
                 if self.verbose:
                     print(f"警告：迭代 {it} 时迹过小 ({tr:.2e} ≤ {self.eps_prob:.2e})，重置")
             else:
-                sigma = sigma / tr
+                A_next /= np.sqrt(tr)
+            sigma_next, q_next = expected(A_next)
+            ll_next = float(np.dot(f, np.log(q_next)))
 
-            dn = float(np.linalg.norm(sigma - sigma_prev, ord='fro'))
-            dll = float(abs(ll - ll_prev))
-            final_dn = dn
-            final_dll = dll
-            
-            if dn < self.tol_state and dll < self.tol_ll:
-                converged = True
-                ll_prev = ll
+            if ll_next - ll < -1e-10 and beta > 0.0:
+                # 外推步使似然下降：退回自 A 出发的普通 RρR 步并重启动量
+                decrease_ll_count += 1
+                if self.verbose:
+                    print(f"警告：迭代 {it} 时外推步使对数似然下降 {ll_next - ll:.2e}，退回普通步")
+                A_next = rrr_step(A, q)
+                A_next /= np.sqrt(np.vdot(A_next, A_next).real)
+                sigma_next, q_next = expected(A_next)
+                ll_next = float(np.dot(f, np.log(q_next)))
+                k = 1
+
+            min_q = min(min_q, float(q_next.min()))
+            A_prev, A = A, A_next
+            sigma, q, ll = sigma_next, q_next, ll_next
+            if it % check_every == 0:
+                # 收敛判据按“自当前点再走一步普通 RρR”度量，与未加速迭代的语义一致
+                # （外推步本身的位移含动量，不能反映是否到达不动点）
+                A_plain = rrr_step(A, q)
+                A_plain /= np.sqrt(np.vdot(A_plain, A_plain).real)
+                sigma_plain, q_plain = expected(A_plain)
+                ll_plain = float(np.dot(f, np.log(q_plain)))
+                final_dn = float(np.linalg.norm(sigma_plain - sigma))
+                final_dll = abs(ll_plain - ll)
+                if final_dn < self.tol_state and final_dll < self.tol_ll:
+                    converged = True
+                    if ll_plain >= ll:
+                        sigma, q, ll = sigma_plain, q_plain, ll_plain
+                    break
+            if oscillating and it < self.max_iterations:
                 break
-            ll_prev = ll
+
+        iterations = it if converged else self.max_iterations
+        if oscillating and not converged:
+            # 动量持续振荡：自当前点改用普通 RρR 完成剩余迭代
+            sigma, q, plain_iterations, converged, ll, plain_diagnostics = self._iterate_rrr_sigma(
+                E_tilde, f, sigma, max_iterations=self.max_iterations - it
+            )
+            iterations = it + plain_iterations
+            decrease_ll_count += plain_diagnostics["decrease_ll_count"]
+            reset_count += plain_diagnostics["reset_count"]
+            if reset_first_iter is None and plain_diagnostics["reset_first_iter"] is not None:
+                reset_first_iter = it + plain_diagnostics["reset_first_iter"]
+            min_q = min(min_q, plain_diagnostics["min_q"])
+            min_trace = min(min_trace, plain_diagnostics["min_trace"])
+            final_dn = plain_diagnostics["final_dn"]
+            final_dll = plain_diagnostics["final_dll"]
 
         if not converged and self.verbose:
             print(f"警告：已达最大迭代次数 {self.max_iterations}，可能未完全收敛")
 
         diagnostics = {
             "decrease_ll_count": int(decrease_ll_count),
+            "restart_count": int(restart_count),
+            "momentum_disabled": bool(oscillating),
             "reset_count": int(reset_count),
             "reset_first_iter": reset_first_iter,
             "min_q": float(min_q),
@@ -354,11 +711,12 @@ class RrhoStrictReconstructor:
             "final_dll": float(final_dll) if final_dll is not None else None,
         }
 
-        return sigma, q, (it if converged else self.max_iterations), converged, ll_prev, diagnostics
+        return sigma, q, iterations, converged, ll, diagnostics
 
 
 __all__ = [
     "RrhoStrictReconstructor",
     "RrhoStrictReconstructionResult",
+    "RrhoStrictBatchReconstructionResult",
 ]
 
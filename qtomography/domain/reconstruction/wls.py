@@ -3,15 +3,36 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, Literal
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Literal
 
 import numpy as np
-from scipy.optimize import minimize
+import scipy.sparse as sp
+from scipy.optimize import least_squares, minimize
 from scipy.linalg import cholesky
 
 from qtomography.domain.density import DensityMatrix
+from qtomography.domain.density_batch import DensityBatch
+from qtomography.domain.grouping import normalize_per_group
 from qtomography.domain.projectors import ProjectorSet
 
+if TYPE_CHECKING:
+    from qtomography.domain.reconstruction.linear import (
+        LinearBatchReconstructionResult,
+        LinearReconstructionResult,
+        LinearReconstructor,
+    )
+
+
+# 不使用梯度信息的 scipy.optimize.minimize 方法（不传 jac）
+_GRADIENT_FREE_METHODS = frozenset({"nelder-mead", "powell", "cobyla"})
+
+# 批量 L-BFGS 的 ftol 准则需连续满足的迭代次数（回溯线搜索步长偏保守，单次判定易过早停止）
+_BATCH_STALL_ITERATIONS = 3
+
+# 热启动密度矩阵与 I/n 的混合权重 ε（避免秩亏初始点使 log-Cholesky 对角参数发散）
+_WARM_START_MIXING = 1e-3
+
 
 @dataclass
 class WLSReconstructionResult:
@@ -28,6 +49,7 @@ class WLSReconstructionResult:
         message: 优化器返回的信息，用于调试。
         n_iterations: 优化器迭代次数（若优化器未提供则为 0）。
         n_function_evaluations: 目标函数调用次数（若优化器未提供则为 0）。
+        warm_started: 最终结果是否来自热启动初始点（否则来自常规的冷启动初始点）。
     """
 
     density: DensityMatrix
@@ -40,10 +62,79 @@ class WLSReconstructionResult:
     message: str
     n_iterations: int
     n_function_evaluations: int
+    warm_started: bool = False
+
+
+@dataclass
+class WLSBatchReconstructionResult:
+    """批量 WLS 重构的堆叠结果（N 个样本在同一向量化优化器中联合求解）。
+
+    属性:
+        densities: (N, n, n) 物理化后的密度矩阵堆栈。
+        rho_matrices_raw: (N, n, n) 由最优参数构造的原始密度矩阵堆栈。
+        normalized_probabilities: (m, N) 归一化后的观测概率，每列对应一个样本。
+        expected_probabilities: (m, N) 最终密度矩阵给出的理论概率。
+        objective_values: (N,) 每个样本的最终 chi²（含正则项）。
+        converged: (N,) 每个样本是否满足停止条件。
+        n_iterations: (N,) 每个样本执行的拟牛顿迭代次数。
+        n_function_evaluations: (N,) 每个样本参与的目标函数评估次数。
+        tolerance: 构造单样本 DensityMatrix 时使用的数值容差。
+    """
+
+    densities: np.ndarray
+    rho_matrices_raw: np.ndarray
+    normalized_probabilities: np.ndarray
+    expected_probabilities: np.ndarray
+    objective_values: np.ndarray
+    converged: np.ndarray
+    n_iterations: np.ndarray
+    n_function_evaluations: np.ndarray
+    tolerance: float = 1e-10
+
+    @property
+    def num_samples(self) -> int:
+        """批量中的样本数 N。"""
+        return int(self.densities.shape[0])
+
+    @property
+    def density_batch(self) -> DensityBatch:
+        """以 DensityBatch 形式返回密度矩阵堆栈，供向量化计算纯度 / 特征值 / 熵等指标。"""
+        return DensityBatch(self.densities, tolerance=self.tolerance)
+
+    def result_at(self, index: int) -> WLSReconstructionResult:
+        """取出第 ``index`` 个样本，封装为单样本 WLSReconstructionResult。"""
+
+        converged = bool(self.converged[index])
+        # 复制一份：from_trusted 直接持有数组，不应与可写的批量堆栈共享内存
+        density = DensityMatrix.from_trusted(
+            self.densities[index].copy(),
+            tolerance=self.tolerance,
+            enforce="none",
+        )
+        return WLSReconstructionResult(
+            density=density,
+            rho_matrix_raw=self.rho_matrices_raw[index].copy(),
+            normalized_probabilities=self.normalized_probabilities[:, index].copy(),
+            expected_probabilities=self.expected_probabilities[:, index].copy(),
+            objective_value=float(self.objective_values[index]),
+            success=converged,
+            status=0 if converged else 1,
+            message="CONVERGENCE (batched L-BFGS)" if converged else "STOP: batched L-BFGS did not converge",
+            n_iterations=int(self.n_iterations[index]),
+            n_function_evaluations=int(self.n_function_evaluations[index]),
+        )
 
 
 class WLSReconstructor:
-    """加权最小二乘层析重构器。"""
+    """加权最小二乘层析重构器。
+
+    optimizer 可为任意 scipy.optimize.minimize 方法名（默认 "L-BFGS-B"，基于梯度的
+    方法使用解析梯度），或 "lm"：以 scipy.optimize.least_squares 的信赖域
+    Gauss–Newton（Levenberg–Marquardt 类）求解残差 (p - q)/√q，并提供解析雅可比。
+
+    backend="sparse" 时期望概率通过 CSR 测量矩阵的稀疏矩阵-向量乘积计算
+    （q = Re(M vec(ρᵀ))），nopovm 设计下不构建稠密投影数组。
+    """
 
     def __init__(
         self,
@@ -60,6 +151,7 @@ class WLSReconstructor:
         density_enforce: Literal["within_tol", "project", "none"] = "within_tol",
         density_strict: bool = False,
         density_warn: bool = True,
+        backend: Literal["dense", "sparse"] = "dense",
     ) -> None:
         if dimension < 2:
             raise ValueError("维度必须大于等于 2")
@@ -73,6 +165,8 @@ class WLSReconstructor:
             raise ValueError("min_expected_clip 必须为正数")
         if optimizer_ftol <= 0:
             raise ValueError("optimizer_ftol 必须为正数")
+        if backend not in ("dense", "sparse"):
+            raise ValueError(f"未知的测量矩阵后端: {backend!r}")
 
         self.dimension = dimension
         self.tolerance = tolerance
@@ -84,53 +178,85 @@ class WLSReconstructor:
         self.density_enforce = density_enforce
         self.density_strict = density_strict
         self.density_warn = density_warn
+        self.backend = backend
+        materialize = backend == "dense"
         self.projector_set = (
-            ProjectorSet.get(dimension, design=design)
+            ProjectorSet.get(dimension, design=design, materialize=materialize)
             if cache_projectors
-            else ProjectorSet(dimension, design=design, cache=False)
+            else ProjectorSet(dimension, design=design, cache=False, materialize=materialize)
         )
+        self._stacked_measurement_cache: Optional[np.ndarray] = None
+        self._linear_initializer: Optional["LinearReconstructor"] = None
 
     # ------------------------------------------------------------------
     def reconstruct(
         self,
         probabilities: np.ndarray,
         initial_density: Optional[DensityMatrix | np.ndarray] = None,
+        linear_result: Optional["LinearReconstructionResult"] = None,
     ) -> DensityMatrix:
         """仅返回最终物理化后的密度矩阵。"""
 
-        result = self.reconstruct_with_details(probabilities, initial_density=initial_density)
+        result = self.reconstruct_with_details(
+            probabilities, initial_density=initial_density, linear_result=linear_result
+        )
         return result.density
 
     def reconstruct_with_details(
         self,
         probabilities: np.ndarray,
         initial_density: Optional[DensityMatrix | np.ndarray] = None,
+        linear_result: Optional["LinearReconstructionResult"] = None,
+        warm_start: Optional[DensityMatrix | np.ndarray] = None,
     ) -> WLSReconstructionResult:
-        """执行 WLS 重构并返回包含详细信息的结果对象。"""
-
-        probs_normalized = self._normalize_probabilities_grouped(probabilities)
-        projectors = self.projector_set.projectors
+        """执行 WLS 重构并返回包含详细信息的结果对象。
 
-        rho_initial = self._prepare_initial_density(probs_normalized, initial_density)
-        params0 = self.encode_density_to_params(rho_initial)
+        初始点优先级：initial_density > linear_result（调用方已算好的线性结果）>
+        内部共享的线性初始化器。
 
-        minimize_options = {
-            "maxiter": self.max_iterations,
-            "ftol": self.optimizer_ftol,
-        }
+        warm_start: 可选的热启动密度矩阵（通常为相邻样本的解），与 I/n 按 ε 混合。
+            仅当其目标函数值不高于上述冷启动初始点时采用；若热启动优化未成功，
+            则从冷启动初始点重跑并保留目标函数值更低者。回退时 n_iterations 与
+            n_function_evaluations 计入两次优化的总和（反映实际开销）。
+        """
 
-        res = minimize(
-            fun=self._objective_function,
-            x0=params0,
-            args=(probs_normalized, projectors, self.regularization),
-            method=self.optimizer,
-            options=minimize_options,
-            tol=self.optimizer_ftol,
+        probs_normalized = self._normalize_probabilities_grouped(probabilities)
+        if initial_density is None and linear_result is not None:
+            initial_density = linear_result.density
+        projectors = (
+            self.projector_set.measurement_matrix_sparse
+            if self.backend == "sparse"
+            else self._stacked_measurement()
         )
+        workspace = self._allocate_workspace(probs_normalized.size)
+
+        rho_initial = self._prepare_initial_density(probs_normalized, initial_density)
+        params_cold = self.encode_density_to_params(rho_initial)
+        params0 = params_cold
+        warm_started = False
+        if warm_start is not None:
+            params_warm = self.encode_density_to_params(self._prepare_warm_start(warm_start))
+            args = (probs_normalized, projectors, self.regularization, workspace)
+            if self._objective_function(params_warm, *args) <= self._objective_function(params_cold, *args):
+                params0 = params_warm
+                warm_started = True
+
+        res, n_iterations = self._optimize(params0, probs_normalized, projectors, workspace)
+        n_evaluations = int(getattr(res, "nfev", 0) or 0)
+        if warm_started and not res.success:
+            cold_res, cold_iterations = self._optimize(params_cold, probs_normalized, projectors, workspace)
+            # 两次优化都计入开销，无论保留哪一个
+            n_iterations += cold_iterations
+            n_evaluations += int(getattr(cold_res, "nfev", 0) or 0)
+            args = (probs_normalized, projectors, self.regularization)
+            if self._objective_function(cold_res.x, *args) <= self._objective_function(res.x, *args):
+                res = cold_res
+                warm_started = False
 
         rho_opt = self.decode_params_to_density(res.x, self.dimension)
-        density = DensityMatrix(
-            rho_opt, 
+        # enforce="none" 时 from_trusted 直接持有数组，复制以免与 rho_matrix_raw 别名
+        density = DensityMatrix.from_trusted(
+            rho_opt.copy() if self.density_enforce == "none" else rho_opt,
             tolerance=self.tolerance,
             enforce=self.density_enforce,
             strict=self.density_strict,
@@ -148,11 +274,242 @@ class WLSReconstructor:
             success=bool(res.success),
             status=int(res.status),
             message=str(res.message),
-            n_iterations=int(getattr(res, "nit", 0) or 0),
-            n_function_evaluations=int(getattr(res, "nfev", 0) or 0),
+            n_iterations=n_iterations,
+            n_function_evaluations=n_evaluations,
+            warm_started=warm_started,
+        )
+
+    def _optimize(
+        self,
+        params0: np.ndarray,
+        probabilities: np.ndarray,
+        projectors,
+        workspace: "_WLSWorkspace",
+    ):
+        """从 params0 运行所选优化器，返回 (OptimizeResult, 迭代次数)。"""
+
+        if self.optimizer.lower() == "lm":
+            # 最小二乘形式：残差 (p - q)/√q 与解析雅可比，交给 Levenberg–Marquardt
+            res = self._solve_least_squares(params0, probabilities)
+            return res, int(getattr(res, "njev", 0) or 0)
+
+        minimize_options = {
+            "maxiter": self.max_iterations,
+            "ftol": self.optimizer_ftol,
+        }
+
+        # 基于梯度的方法使用解析梯度，避免 n² 次有限差分目标函数评估
+        use_gradient = self.optimizer.lower() not in _GRADIENT_FREE_METHODS
+        res = minimize(
+            fun=self._objective_and_gradient if use_gradient else self._objective_function,
+            x0=params0,
+            args=(probabilities, projectors, self.regularization, workspace),
+            method=self.optimizer,
+            jac=True if use_gradient else None,
+            options=minimize_options,
+            tol=self.optimizer_ftol,
+        )
+        return res, int(getattr(res, "nit", 0) or 0)
+
+    def reconstruct_batch(
+        self,
+        probabilities_2d: np.ndarray,
+        initial_densities: Optional[np.ndarray] = None,
+        linear_batch: Optional["LinearBatchReconstructionResult"] = None,
+        *,
+        history_size: int = 10,
+        gtol: Optional[float] = None,
+        max_line_search: int = 20,
+    ) -> WLSBatchReconstructionResult:
+        """对 (m, N) 概率矩阵联合执行 WLS 重构。
+
+        N 个独立的 log-Cholesky 参数向量堆叠为 (N, n²)，由向量化 L-BFGS（两环递推 +
+        Armijo 回溯线搜索）同时优化；目标函数、解析梯度与期望概率均在 (N, n, n)
+        张量上批量计算。每个样本独立判定收敛（与 L-BFGS-B 相同的 ftol 相对下降
+        与梯度无穷范数 gtol 准则，gtol 默认等于 optimizer_ftol，与单样本调用
+        ``minimize(tol=optimizer_ftol)`` 一致），已收敛样本退出后续计算。
+
+        初始点优先级：initial_densities (N, n, n) > linear_batch > 共享线性初始化器
+        的批量结果（失败时退化为最大混合态）。
+        """
+
+        if history_size <= 0:
+            raise ValueError("history_size 必须为正整数")
+        if gtol is None:
+            gtol = self.optimizer_ftol
+        probs = self._normalize_probabilities_grouped_batch(probabilities_2d)  # (m, N)
+        num_samples = probs.shape[1]
+        dimension = self.dimension
+        projectors = (
+            self.projector_set.measurement_matrix_sparse
+            if self.backend == "sparse"
+            else self._stacked_measurement()
+        )
+
+        if initial_densities is None and linear_batch is not None:
+            initial_densities = linear_batch.densities
+        if initial_densities is None:
+            try:
+                initial_densities = self.linear_initializer.reconstruct_batch(probs).densities
+            except Exception:
+                initial_densities = np.broadcast_to(
+                    np.eye(dimension, dtype=complex) / dimension, (num_samples, dimension, dimension)
+                )
+        initial_densities = np.asarray(initial_densities, dtype=complex)
+        if initial_densities.shape != (num_samples, dimension, dimension):
+            raise ValueError("initial_densities 形状必须为 (N, n, n)")
+
+        observed = np.ascontiguousarray(probs.T)  # (N, m)
+        x = self._encode_density_stack(initial_densities)  # (N, n²)
+        f, g, _ = self._batch_objective_and_gradient(x, observed, projectors)
+
+        num_params = x.shape[1]
+        s_hist = np.zeros((num_samples, history_size, num_params))
+        y_hist = np.zeros((num_samples, history_size, num_params))
+        rho_hist = np.zeros((num_samples, history_size))
+        gamma = np.ones(num_samples)
+        has_history = np.zeros(num_samples, dtype=bool)
+        n_iterations = np.zeros(num_samples, dtype=int)
+        n_evaluations = np.ones(num_samples, dtype=int)
+        stall_count = np.zeros(num_samples, dtype=int)
+        converged = np.max(np.abs(g), axis=1) <= gtol
+        active = ~converged
+
+        c1 = 1e-4
+        for _ in range(self.max_iterations):
+            idx = np.flatnonzero(active)
+            if idx.size == 0:
+                break
+
+            # L-BFGS 两环递推（逐样本历史，无效历史项 rho=0 不产生贡献）
+            q = g[idx].copy()
+            alphas = np.zeros((idx.size, history_size))
+            for k in range(history_size - 1, -1, -1):
+                alphas[:, k] = rho_hist[idx, k] * np.einsum("ij,ij->i", s_hist[idx, k], q)
+                q -= alphas[:, k, None] * y_hist[idx, k]
+            r = gamma[idx, None] * q
+            for k in range(history_size):
+                beta = rho_hist[idx, k] * np.einsum("ij,ij->i", y_hist[idx, k], r)
+                r += s_hist[idx, k] * (alphas[:, k] - beta)[:, None]
+            direction = -r
+            slope = np.einsum("ij,ij->i", g[idx], direction)
+            not_descent = slope >= 0
+            if np.any(not_descent):
+                # 非下降方向：丢弃该样本的历史，退化为最速下降
+                reset = idx[not_descent]
+                rho_hist[reset] = 0.0
+                gamma[reset] = 1.0
+                has_history[reset] = False
+                direction[not_descent] = -g[reset]
+                slope[not_descent] = -np.einsum("ij,ij->i", g[reset], g[reset])
+
+            # 首步（无历史）按 1/||d|| 缩放，与 L-BFGS-B 的初始步长一致
+            step = np.ones(idx.size)
+            first = ~has_history[idx]
+            step[first] = np.minimum(1.0, 1.0 / np.maximum(np.linalg.norm(direction[first], axis=1), 1e-300))
+
+            # 向量化 Armijo 回溯线搜索
+            x_new = x[idx].copy()
+            f_new = f[idx].copy()
+            g_new = g[idx].copy()
+            accepted = np.zeros(idx.size, dtype=bool)
+            for _ls in range(max_line_search):
+                pending = np.flatnonzero(~accepted)
+                if pending.size == 0:
+                    break
+                trial = x[idx[pending]] + step[pending, None] * direction[pending]
+                f_trial, g_trial, _ = self._batch_objective_and_gradient(
+                    trial, observed[idx[pending]], projectors
+                )
+                n_evaluations[idx[pending]] += 1
+                ok = np.isfinite(f_trial) & (
+                    f_trial <= f[idx[pending]] + c1 * step[pending] * slope[pending]
+                )
+                done = pending[ok]
+                x_new[done] = trial[ok]
+                f_new[done] = f_trial[ok]
+                g_new[done] = g_trial[ok]
+                accepted[done] = True
+                step[pending[~ok]] *= 0.5
+
+            # 线搜索失败的样本终止（保留当前点）
+            failed = idx[~accepted]
+            active[failed] = False
+
+            moved = idx[accepted]
+            if moved.size == 0:
+                continue
+            s_vec = x_new[accepted] - x[moved]
+            y_vec = g_new[accepted] - g[moved]
+            f_old = f[moved]
+            x[moved] = x_new[accepted]
+            f[moved] = f_new[accepted]
+            g[moved] = g_new[accepted]
+            n_iterations[moved] += 1
+
+            sy = np.einsum("ij,ij->i", s_vec, y_vec)
+            yy = np.einsum("ij,ij->i", y_vec, y_vec)
+            good = sy > 1e-10 * np.maximum(yy, 1e-300)
+            upd = moved[good]
+            if upd.size:
+                s_hist[upd] = np.roll(s_hist[upd], -1, axis=1)
+                y_hist[upd] = np.roll(y_hist[upd], -1, axis=1)
+                rho_hist[upd] = np.roll(rho_hist[upd], -1, axis=1)
+                s_hist[upd, -1] = s_vec[good]
+                y_hist[upd, -1] = y_vec[good]
+                rho_hist[upd, -1] = 1.0 / sy[good]
+                gamma[upd] = sy[good] / yy[good]
+                has_history[upd] = True
+
+            f_now = f[moved]
+            rel_drop = (f_old - f_now) / np.maximum(np.maximum(np.abs(f_old), np.abs(f_now)), 1.0)
+            # 仅在拟牛顿步（非首步/重置后的缩放步）上应用 ftol 准则，避免过早停止
+            quasi_newton_step = ~first[accepted]
+            small = quasi_newton_step & (rel_drop <= self.optimizer_ftol)
+            stall_count[moved] = np.where(small, stall_count[moved] + 1, 0)
+            stop = (stall_count[moved] >= _BATCH_STALL_ITERATIONS) | (
+                np.max(np.abs(g[moved]), axis=1) <= gtol
+            )
+            converged[moved[stop]] = True
+            active[moved[stop]] = False
+
+        rho_raw = self._decode_params_stack(x, dimension)
+        expected = self._expected_probabilities_stack(rho_raw, projectors)  # (N, m)
+        densities = DensityMatrix.physicalize_stack(
+            rho_raw,
+            tolerance=self.tolerance,
+            enforce=self.density_enforce,
+            strict=self.density_strict,
+            warn=self.density_warn,
+        )
+        return WLSBatchReconstructionResult(
+            densities=densities,
+            rho_matrices_raw=rho_raw,
+            normalized_probabilities=probs,
+            expected_probabilities=np.ascontiguousarray(expected.T),
+            objective_values=f,
+            converged=converged,
+            n_iterations=n_iterations,
+            n_function_evaluations=n_evaluations,
+            tolerance=self.tolerance,
         )
 
     # ------------------------------------------------------------------
+    @property
+    def linear_initializer(self) -> "LinearReconstructor":
+        """与本重构器共享 ProjectorSet（及其缓存分解）的线性初始化器，首次使用时创建。"""
+
+        if self._linear_initializer is None:
+            from .linear import LinearReconstructor
+
+            self._linear_initializer = LinearReconstructor(
+                self.dimension,
+                tolerance=self.tolerance,
+                backend=self.backend,
+                projector_set=self.projector_set,
+            )
+        return self._linear_initializer
+
     def _prepare_initial_density(
         self,
         probabilities: np.ndarray,
@@ -160,14 +517,7 @@ class WLSReconstructor:
     ) -> np.ndarray:
         if initial_density is None:
             try:
-                from .linear import LinearReconstructor
-
-                linear = LinearReconstructor(
-                    self.dimension,
-                    tolerance=self.tolerance,
-                    cache_projectors=False,
-                )
-                rho_lin = linear.reconstruct(probabilities).matrix
+                rho_lin = self.linear_initializer.reconstruct(probabilities).matrix
             except Exception:
                 rho_lin = np.eye(self.dimension, dtype=complex) / self.dimension
             return rho_lin
@@ -180,6 +530,17 @@ class WLSReconstructor:
             raise ValueError("initial_density 形状必须为 (n, n)")
         return rho_array
 
+    def _prepare_warm_start(self, warm_start: DensityMatrix | np.ndarray) -> np.ndarray:
+        rho = warm_start.matrix if isinstance(warm_start, DensityMatrix) else np.asarray(warm_start, dtype=complex)
+        if rho.shape != (self.dimension, self.dimension):
+            raise ValueError("warm_start 形状必须为 (n, n)")
+        rho = (rho + rho.conj().T) / 2
+        trace = float(np.real(np.trace(rho)))
+        if not np.isfinite(trace) or trace <= 0:
+            raise ValueError("warm_start 的迹必须为正")
+        eye = np.eye(self.dimension, dtype=complex) / self.dimension
+        return (1.0 - _WARM_START_MIXING) * (rho / trace) + _WARM_START_MIXING * eye
+
     # ------------------------------------------------------------------
     def _normalize_probabilities(self, probabilities: np.ndarray) -> np.ndarray:
         probs = np.asarray(probabilities, dtype=float).reshape(-1)
@@ -206,25 +567,32 @@ class WLSReconstructor:
             return self._normalize_probabilities(probabilities)
         
         probs = np.asarray(probabilities, dtype=float).reshape(-1)
-        m = self.projector_set.projectors.shape[0]
+        group_index = self.projector_set.group_index
+        m = group_index.size
         if probs.size != m:
             raise ValueError(
                 f"probability vector length must be {m}, got {probs.size}"
             )
-        groups = getattr(self.projector_set, "groups", None)
-        if groups is None or len(groups) != m:
-            total = float(np.sum(probs))
-            if np.isclose(total, 0.0, atol=self.tolerance):
-                raise ValueError("sum of probabilities is zero")
-            return probs / total
-        out = probs.astype(float).copy()
-        for g in np.unique(groups):
-            idx = np.where(groups == g)[0]
-            s = float(np.sum(out[idx]))
-            if np.isclose(s, 0.0, atol=self.tolerance):
-                raise ValueError("group sum is zero; cannot normalize")
-            out[idx] = out[idx] / s
-        return out
+        return normalize_per_group(probs, group_index, tolerance=self.tolerance)
+
+    def _normalize_probabilities_grouped_batch(self, probabilities_2d: np.ndarray) -> np.ndarray:
+        """对 (m, N) 矩阵逐列执行与单样本版本一致的归一化。"""
+
+        probs = np.asarray(probabilities_2d, dtype=float)
+        if probs.ndim == 1:
+            probs = probs.reshape(-1, 1)
+        if probs.ndim != 2:
+            raise ValueError("probabilities_2d must be a 2-D array of shape (m, N)")
+        group_index = self.projector_set.group_index
+        m = group_index.size
+        if probs.shape[0] != m:
+            raise ValueError(f"probability matrix must have {m} rows, got {probs.shape[0]}")
+        if self.projector_set.design == "nopovm":
+            leading = np.sum(probs[: self.dimension], axis=0)
+            if np.any(np.isclose(leading, 0.0, atol=self.tolerance)):
+                raise ValueError("前 n 个分量之和过小, 无法安全归一化")
+            return probs / leading
+        return normalize_per_group(probs, group_index, tolerance=self.tolerance)
 
     # ------------------------------------------------------------------
     @staticmethod
@@ -247,17 +615,36 @@ class WLSReconstructor:
         else:
             raise np.linalg.LinAlgError("无法对密度矩阵执行 Cholesky 分解")
 
-        params = []
-        for i in range(dimension):
-            params.append(np.log(np.real(lower[i, i]).clip(min=1e-18)))
-            for j in range(i):
-                params.append(np.real(lower[i, j]))
-                params.append(np.imag(lower[i, j]))
-        return np.array(params, dtype=float)
+        layout = _cholesky_layout(dimension)
+        params = np.empty(dimension ** 2, dtype=float)
+        params[layout.diag_params] = np.log(np.real(np.diagonal(lower)).clip(min=1e-18))
+        off_values = lower[layout.off_rows, layout.off_cols]
+        params[layout.real_params] = off_values.real
+        params[layout.imag_params] = off_values.imag
+        return params
+
+    @staticmethod
+    def decode_params_to_density(
+        params: np.ndarray,
+        dimension: int,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """将实参数向量解码为密度矩阵（可写入预分配的 (n, n) 复数缓冲区 ``out``）。"""
+
+        lower = WLSReconstructor._params_to_lower(params, dimension)
+        rho = np.matmul(lower, lower.conj().T, out=out)
+        trace_val = np.trace(rho)
+        if not np.isclose(trace_val, 1.0, rtol=0.0, atol=1e-12):
+            rho /= trace_val
+        return rho
 
     @staticmethod
-    def decode_params_to_density(params: np.ndarray, dimension: int) -> np.ndarray:
-        """将实参数向量解码为密度矩阵。"""
+    def _params_to_lower(
+        params: np.ndarray,
+        dimension: int,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """将实参数向量解码为下三角 Cholesky 因子 L（对角元为 exp(θ)）。"""
 
         params = np.asarray(params, dtype=float)
         if params.size != dimension ** 2:
@@ -265,22 +652,210 @@ class WLSReconstructor:
                 f"参数长度应为 {dimension ** 2}, 实际为 {params.size}"
             )
 
-        lower = np.zeros((dimension, dimension), dtype=complex)
-        idx = 0
-        for i in range(dimension):
-            lower[i, i] = np.exp(params[idx])
-            idx += 1
-            for j in range(i):
-                real_part = params[idx]
-                imag_part = params[idx + 1]
-                lower[i, j] = real_part + 1j * imag_part
-                idx += 2
-
-        rho = lower @ lower.conj().T
-        trace_val = np.trace(rho)
-        if not np.isclose(trace_val, 1.0, atol=1e-12):
-            rho = rho / trace_val
-        return rho
+        layout = _cholesky_layout(dimension)
+        lower = np.zeros((dimension, dimension), dtype=complex) if out is None else out
+        if out is not None:
+            lower.fill(0.0)
+        lower[layout.diag_rows, layout.diag_rows] = np.exp(params[layout.diag_params])
+        lower[layout.off_rows, layout.off_cols] = (
+            params[layout.real_params] + 1j * params[layout.imag_params]
+        )
+        return lower
+
+    def _stacked_measurement(self) -> np.ndarray:
+        """(m, 2n²) 实矩阵 W，W[:, 0::2] = Re M，W[:, 1::2] = Im M（M 的零拷贝实视图）。
+
+        对厄米 ρ 有 q = W @ ρ.view(float).ravel()，Σ_k w_k P_k = (Wᵀ w).view(complex)，
+        期望概率与梯度算子都退化为一次实 GEMV。
+        """
+
+        if self._stacked_measurement_cache is None:
+            measurement = np.ascontiguousarray(self.projector_set.measurement_matrix, dtype=complex)
+            self._stacked_measurement_cache = measurement.view(float)
+        return self._stacked_measurement_cache
+
+    @staticmethod
+    def _encode_density_stack(rhos: np.ndarray) -> np.ndarray:
+        """将 (N, n, n) 密度矩阵堆栈编码为 (N, n²) 参数（批量 Cholesky，失败时逐个回退）。"""
+
+        dimension = rhos.shape[-1]
+        try:
+            lower = np.linalg.cholesky(rhos)
+        except np.linalg.LinAlgError:
+            return np.stack([WLSReconstructor.encode_density_to_params(rho) for rho in rhos])
+        layout = _cholesky_layout(dimension)
+        params = np.empty((rhos.shape[0], dimension ** 2), dtype=float)
+        diag = np.real(lower[:, layout.diag_rows, layout.diag_rows])
+        params[:, layout.diag_params] = np.log(diag.clip(min=1e-18))
+        off_values = lower[:, layout.off_rows, layout.off_cols]
+        params[:, layout.real_params] = off_values.real
+        params[:, layout.imag_params] = off_values.imag
+        return params
+
+    @staticmethod
+    def _params_to_lower_stack(params: np.ndarray, dimension: int) -> np.ndarray:
+        layout = _cholesky_layout(dimension)
+        lower = np.zeros((params.shape[0], dimension, dimension), dtype=complex)
+        lower[:, layout.diag_rows, layout.diag_rows] = np.exp(params[:, layout.diag_params])
+        lower[:, layout.off_rows, layout.off_cols] = (
+            params[:, layout.real_params] + 1j * params[:, layout.imag_params]
+        )
+        return lower
+
+    @staticmethod
+    def _decode_params_stack(params: np.ndarray, dimension: int) -> np.ndarray:
+        """将 (N, n²) 参数解码为 (N, n, n) 单位迹密度矩阵。"""
+
+        lower = WLSReconstructor._params_to_lower_stack(params, dimension)
+        gram = lower @ np.conj(np.swapaxes(lower, -1, -2))
+        trace_val = np.real(np.trace(gram, axis1=-2, axis2=-1))
+        return gram / trace_val[:, None, None]
+
+    @staticmethod
+    def _expected_probabilities_stack(rhos: np.ndarray, projectors) -> np.ndarray:
+        """(N, n, n) 厄米密度矩阵堆栈的期望概率 (N, m)。"""
+
+        num = rhos.shape[0]
+        if sp.issparse(projectors):
+            flat = np.ascontiguousarray(np.swapaxes(rhos, -1, -2)).reshape(num, -1)
+            return np.real(projectors @ flat.T).T
+        rho_flat = np.ascontiguousarray(rhos, dtype=complex).view(float).reshape(num, -1)
+        return rho_flat @ projectors.T
+
+    def _batch_objective_and_gradient(
+        self,
+        params: np.ndarray,
+        probabilities: np.ndarray,
+        projectors,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """`_objective_and_gradient` 的批量版本：params (N, n²)，probabilities (N, m)。
+
+        返回 (chi² (N,), 梯度 (N, n²), 未截断期望概率 (N, m))。
+        """
+
+        dimension = self.dimension
+        num = params.shape[0]
+        layout = _cholesky_layout(dimension)
+        lower = self._params_to_lower_stack(params, dimension)
+        gram = lower @ np.conj(np.swapaxes(lower, -1, -2))
+        trace_val = np.real(np.trace(gram, axis1=-2, axis2=-1))
+        rho = gram / trace_val[:, None, None]
+
+        expected_raw = self._expected_probabilities_stack(rho, projectors)
+        unclipped = expected_raw > self.min_expected_clip
+        expected = np.where(unclipped, expected_raw, self.min_expected_clip)
+        diff = probabilities - expected
+        chi2 = np.sum((diff ** 2) / expected, axis=1)
+
+        weights = np.where(unclipped, (expected ** 2 - probabilities ** 2) / expected ** 2, 0.0)
+        if sp.issparse(projectors):
+            g_tilde = np.asarray(projectors.T @ weights.T).T.reshape(num, dimension, dimension)
+        else:
+            g_tilde = np.ascontiguousarray(weights @ projectors).view(complex).reshape(
+                num, dimension, dimension
+            )
+        g_tilde[:, layout.diag_rows, layout.diag_rows] -= np.einsum(
+            "ij,ij->i", weights, expected_raw
+        )[:, None]
+        c_mat = (g_tilde @ lower) * (2.0 / trace_val)[:, None, None]
+
+        grad = np.empty_like(params)
+        grad[:, layout.diag_params] = np.real(
+            c_mat[:, layout.diag_rows, layout.diag_rows] * lower[:, layout.diag_rows, layout.diag_rows]
+        )
+        c_off = c_mat[:, layout.off_rows, layout.off_cols]
+        grad[:, layout.real_params] = c_off.real
+        grad[:, layout.imag_params] = c_off.imag
+
+        if self.regularization:
+            chi2 = chi2 + self.regularization * np.sum(params ** 2, axis=1)
+            grad += 2.0 * self.regularization * params
+        return chi2, grad, expected_raw
+
+    def _solve_least_squares(self, params0: np.ndarray, probabilities: np.ndarray):
+        """以 scipy.optimize.least_squares 求解残差形式的 WLS。
+
+        残差 r_k = (p_k - q_k)/√q_k（正则化时追加 √λ θ），chi² = Σ r_k²。
+        使用信赖域 Gauss–Newton（"trf"）：MINPACK 的无约束 "lm" 首步步长不受控，
+        从最大混合态出发时会把 log 对角参数推到 ~1e2 而停滞在伪驻点。
+        """
+
+        projectors = (
+            self.projector_set.measurement_matrix_sparse
+            if self.backend == "sparse"
+            else self.projector_set.projectors
+        )
+        return least_squares(
+            self._residuals,
+            params0,
+            jac=self._residual_jacobian,
+            args=(probabilities, projectors),
+            method="trf",
+            ftol=self.optimizer_ftol,
+            xtol=self.optimizer_ftol,
+            gtol=self.optimizer_ftol,
+            max_nfev=self.max_iterations,
+        )
+
+    def _residuals(self, params: np.ndarray, probabilities: np.ndarray, projectors) -> np.ndarray:
+        """加权残差 (p - q)/√q（q 截断到 min_expected_clip），正则化时追加 √λ θ。"""
+
+        rho = self.decode_params_to_density(params, self.dimension)
+        expected = np.clip(self._expected_probabilities(rho, projectors), self.min_expected_clip, None)
+        residuals = (probabilities - expected) / np.sqrt(expected)
+        if self.regularization:
+            residuals = np.concatenate([residuals, np.sqrt(self.regularization) * np.asarray(params)])
+        return residuals
+
+    def _residual_jacobian(self, params: np.ndarray, probabilities: np.ndarray, projectors) -> np.ndarray:
+        """残差对 log-Cholesky 参数的解析雅可比。
+
+        ∂r_k/∂q_k = -(p_k + q_k)/(2 q_k^{3/2})（截断处为 0）；
+        ∂q_k/∂θ 由 C_k = 2 (P_k - q_k I) L / t 按与梯度相同的规则给出。
+        """
+
+        params = np.asarray(params, dtype=float)
+        dimension = self.dimension
+        layout = _cholesky_layout(dimension)
+        lower = self._params_to_lower(params, dimension)
+        gram = lower @ lower.conj().T
+        trace_val = float(np.real(np.trace(gram)))
+        rho = gram / trace_val
+
+        expected_raw = self._expected_probabilities(rho, projectors)
+        unclipped = expected_raw > self.min_expected_clip
+        expected = np.where(unclipped, expected_raw, self.min_expected_clip)
+        d_residual = np.where(
+            unclipped, -(probabilities + expected) / (2.0 * expected ** 1.5), 0.0
+        )
+
+        if sp.issparse(projectors):
+            # (P_k L) 的行优先展平 = M_k · (I ⊗ L)
+            kron = sp.kron(sp.identity(dimension, format="csr"), sp.csr_matrix(lower), format="csr")
+            p_times_l = np.asarray((projectors @ kron).todense()).reshape(-1, dimension, dimension)
+        else:
+            p_times_l = projectors @ lower
+        c_mat = (p_times_l - expected_raw[:, None, None] * lower[None, :, :]) * (2.0 / trace_val)
+
+        jac_q = np.empty((expected.size, params.size), dtype=float)
+        jac_q[:, layout.diag_params] = np.real(
+            c_mat[:, layout.diag_rows, layout.diag_rows] * lower[layout.diag_rows, layout.diag_rows]
+        )
+        c_off = c_mat[:, layout.off_rows, layout.off_cols]
+        jac_q[:, layout.real_params] = c_off.real
+        jac_q[:, layout.imag_params] = c_off.imag
+        jacobian = d_residual[:, None] * jac_q
+        if self.regularization:
+            jacobian = np.vstack([jacobian, np.sqrt(self.regularization) * np.eye(params.size)])
+        return jacobian
+
+    def _allocate_workspace(self, num_measurements: int) -> "_WLSWorkspace":
+        d = self.dimension
+        return _WLSWorkspace(
+            lower=np.zeros((d, d), dtype=complex),
+            rho=np.zeros((d, d), dtype=complex),
+            expected=np.zeros(num_measurements, dtype=float),
+        )
 
     # ------------------------------------------------------------------
     def _objective_function(
@@ -289,9 +864,12 @@ class WLSReconstructor:
         probabilities: np.ndarray,
         projectors: np.ndarray,
         regularization: Optional[float],
+        workspace: Optional["_WLSWorkspace"] = None,
     ) -> float:
-        rho = self.decode_params_to_density(params, self.dimension)
-        expected = self._expected_probabilities(rho, projectors)
+        rho_out = None if workspace is None else workspace.rho
+        q_out = None if workspace is None else workspace.expected
+        rho = self.decode_params_to_density(params, self.dimension, out=rho_out)
+        expected = self._expected_probabilities(rho, projectors, out=q_out)
         expected = np.clip(expected, self.min_expected_clip, None)
         diff = probabilities - expected
         chi2 = np.sum((diff ** 2) / expected)
@@ -299,10 +877,133 @@ class WLSReconstructor:
             chi2 += regularization * np.sum(params ** 2)
         return float(chi2)
 
+    def _objective_and_gradient(
+        self,
+        params: np.ndarray,
+        probabilities: np.ndarray,
+        projectors,
+        regularization: Optional[float],
+        workspace: Optional["_WLSWorkspace"] = None,
+    ) -> tuple[float, np.ndarray]:
+        """chi² 目标函数及其对 log-Cholesky 参数的解析梯度。
+
+        记 S = L L†，t = Tr(S)，ρ = S / t，q_k = Tr(P_k ρ)。对未被截断的 q_k，
+        ∂chi²/∂q_k = w_k = (q_k² - p_k²) / q_k²（被截断处为 0）。令
+        G̃ = Σ_k w_k P_k - (Σ_k w_k q_k) I，C = G̃ L，则
+        ∂/∂Re L_ij = 2 Re C_ij / t，∂/∂Im L_ij = 2 Im C_ij / t，
+        ∂/∂θ_i = 2 Re C_ii · L_ii / t（L_ii = exp(θ_i)）；正则项贡献 2λθ。
+        """
+
+        params = np.asarray(params, dtype=float)
+        dimension = self.dimension
+        layout = _cholesky_layout(dimension)
+        lower_out = None if workspace is None else workspace.lower
+        rho_out = None if workspace is None else workspace.rho
+        q_out = None if workspace is None else workspace.expected
+
+        lower = self._params_to_lower(params, dimension, out=lower_out)
+        rho = np.matmul(lower, lower.conj().T, out=rho_out)
+        trace_val = float(np.real(np.trace(rho)))
+        rho /= trace_val
+
+        expected_raw = self._expected_probabilities(rho, projectors, out=q_out)
+        unclipped = expected_raw > self.min_expected_clip
+        expected = np.where(unclipped, expected_raw, self.min_expected_clip)
+        diff = probabilities - expected
+        chi2 = float(np.sum((diff ** 2) / expected))
+
+        weights = np.where(unclipped, (expected ** 2 - probabilities ** 2) / expected ** 2, 0.0)
+        g_tilde = self._weighted_operator_sum(weights, projectors, dimension)
+        g_tilde[layout.diag_rows, layout.diag_rows] -= float(np.dot(weights, expected_raw))
+        c_mat = (g_tilde @ lower) * (2.0 / trace_val)
+
+        grad = np.empty_like(params)
+        grad[layout.diag_params] = np.real(
+            c_mat[layout.diag_rows, layout.diag_rows] * lower[layout.diag_rows, layout.diag_rows]
+        )
+        c_off = c_mat[layout.off_rows, layout.off_cols]
+        grad[layout.real_params] = c_off.real
+        grad[layout.imag_params] = c_off.imag
+
+        if regularization:
+            chi2 += regularization * float(np.sum(params ** 2))
+            grad += 2.0 * regularization * params
+        return chi2, grad
+
+    @staticmethod
+    def _weighted_operator_sum(weights: np.ndarray, projectors, dimension: int) -> np.ndarray:
+        """Σ_k w_k P_k；projectors 为 (m, n, n) 数组、(m, 2n²) 实堆叠矩阵 W 或稀疏测量矩阵。"""
+        if sp.issparse(projectors):
+            return np.asarray(projectors.T @ weights).reshape(dimension, dimension)
+        if projectors.ndim == 2:
+            return (weights @ projectors).view(complex).reshape(dimension, dimension)
+        return np.tensordot(weights, projectors, axes=(0, 0))
+
     @staticmethod
-    def _expected_probabilities(rho: np.ndarray, projectors: np.ndarray) -> np.ndarray:
+    def _expected_probabilities(
+        rho: np.ndarray,
+        projectors,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """q_a = Tr(P_a ρ)。
+
+        projectors 可为 (m, n, n) 投影数组、(m, 2n²) 实堆叠矩阵 W（要求 ρ 厄米且 C 连续，
+        q = W @ ρ.view(float).ravel()，可写入 ``out``）或 (m, n²) 稀疏测量矩阵。
+        """
+        if sp.issparse(projectors):
+            # 行优先展平下 Tr(P ρ) = Σ_ab P_ab ρ_ba = M_a · vec(ρᵀ)
+            return np.real(projectors @ np.ascontiguousarray(rho.T).reshape(-1))
+        if projectors.ndim == 2:
+            rho_flat = np.ascontiguousarray(rho, dtype=complex).view(float).reshape(-1)
+            if out is None:
+                return projectors @ rho_flat
+            return np.dot(projectors, rho_flat, out=out)
         return np.real(np.einsum('aij,ji->a', projectors, rho, optimize=True))
 
 
-__all__ = ["WLSReconstructor", "WLSReconstructionResult"]
+@dataclass(frozen=True)
+class _CholeskyLayout:
+    """log-Cholesky 参数向量与下三角因子之间的索引映射（每个维度计算一次）。
+
+    参数顺序为逐行：θ_i = log L_ii 位于 i²，随后 (Re L_ij, Im L_ij)（j < i）
+    位于 i² + 1 + 2j 与 i² + 2 + 2j。
+    """
+
+    diag_rows: np.ndarray
+    diag_params: np.ndarray
+    off_rows: np.ndarray
+    off_cols: np.ndarray
+    real_params: np.ndarray
+    imag_params: np.ndarray
+
+
+@lru_cache(maxsize=None)
+def _cholesky_layout(dimension: int) -> _CholeskyLayout:
+    diag_rows = np.arange(dimension)
+    off_rows, off_cols = np.tril_indices(dimension, k=-1)
+    real_params = off_rows ** 2 + 1 + 2 * off_cols
+    layout = _CholeskyLayout(
+        diag_rows=diag_rows,
+        diag_params=diag_rows ** 2,
+        off_rows=off_rows,
+        off_cols=off_cols,
+        real_params=real_params,
+        imag_params=real_params + 1,
+    )
+    for arr in (layout.diag_rows, layout.diag_params, layout.off_rows,
+                layout.off_cols, layout.real_params, layout.imag_params):
+        arr.setflags(write=False)
+    return layout
+
+
+@dataclass
+class _WLSWorkspace:
+    """单次重构内复用的预分配缓冲区（Cholesky 因子、密度矩阵、期望概率）。"""
+
+    lower: np.ndarray
+    rho: np.ndarray
+    expected: np.ndarray
+
+
+__all__ = ["WLSReconstructor", "WLSReconstructionResult", "WLSBatchReconstructionResult"]
 
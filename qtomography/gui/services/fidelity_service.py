@@ -8,7 +8,7 @@ from typing import List, Optional, Sequence
 
 import numpy as np
 
-from qtomography.domain.density import DensityMatrix
+from qtomography.domain.density import DensityMatrix, fidelity_many
 from qtomography.domain.theoretical_state import (
     TheoreticalStateResult,
     generate_theoretical_state,
@@ -19,6 +19,7 @@ __all__ = [
     "FidelityComputationError",
     "FidelityResult",
     "compute_fidelity_from_files",
+    "compute_fidelities_from_files",
     "compute_fidelity_with_custom_state",
 ]
 
@@ -112,6 +113,40 @@ def compute_fidelity_from_files(
     )
 
 
+def compute_fidelities_from_files(
+    experimental_paths: Sequence[Path],
+    theoretical_path: Path,
+) -> List[FidelityResult]:
+    """Compute fidelities of many density-matrix files against one theoretical state.
+
+    The theoretical state is loaded once and its square root (or pure-state vector)
+    is reused for the whole stack.
+    """
+
+    theoretical_dm = _load_density(theoretical_path, label="理论密度矩阵")
+    experimental = [_load_density(path, label="实验密度矩阵") for path in experimental_paths]
+    if not experimental:
+        return []
+    for path, density in zip(experimental_paths, experimental):
+        if density.dimension != theoretical_dm.dimension:
+            raise FidelityComputationError(
+                f"维度不匹配：实验态 {Path(path).name} 为 {density.dimension} 维，"
+                f"理论态 {theoretical_dm.dimension} 维。"
+            )
+
+    values = fidelity_many(theoretical_dm, np.stack([density.matrix for density in experimental]))
+    return [
+        FidelityResult(
+            fidelity=float(value),
+            experimental_dimension=density.dimension,
+            theoretical_dimension=theoretical_dm.dimension,
+            theoretical_state=None,
+            warnings=[],
+        )
+        for value, density in zip(values, experimental)
+    ]
+
+
 def compute_fidelity_with_custom_state(
     experimental_path: Path,
     dimension: int,
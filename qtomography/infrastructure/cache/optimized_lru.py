@@ -8,10 +8,13 @@
 4. 专门为投影算符等大对象缓存设计
 """
 
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from collections import OrderedDict
+import sys
 import threading
 
+from qtomography.domain.cache import ByteBudgetLRU
+
 
 class OptimizedLRUCache:
     """
@@ -70,47 +73,23 @@ class OptimizedLRUCache:
         return key in self.cache
 
 
-class ProjectorLRUCache:
+class ProjectorLRUCache(ByteBudgetLRU):
     """
     专门为ProjectorSet设计的高性能LRU缓存
-    
+
     特点：
-    1. 按字节数限制内存使用
+    1. 按字节数限制内存使用，超出预算时真正淘汰最久未使用的条目
     2. 自动计算数据大小
     3. 线程安全
-    4. 基于OrderedDict实现，性能优异
+    4. 与 domain.ProjectorSet / 分解缓存共用同一个 ByteBudgetLRU 实现
     """
-    
-    def __init__(self, max_bytes: int):
-        self.max_bytes = max_bytes
-        self.current_bytes = 0
-        self._cache = OptimizedLRUCache(max_size=1000)  # 设置合理的最大条目数
-        self._lock = threading.RLock()
-    
-    def get(self, key: int) -> Optional[tuple]:
-        """获取投影算符数据"""
-        with self._lock:
-            return self._cache.get(key)
-    
-    def put(self, key: int, value: tuple) -> None:
-        """存储投影算符数据"""
-        with self._lock:
-            # 计算数据大小
-            size = self._calculate_size(value)
-            
-            # 检查是否需要清理空间
-            while (self.current_bytes + size > self.max_bytes and 
-                   self._cache.size() > 0):
-                # 删除最久未使用的条目
-                self._evict_oldest()
-            
-            # 存储新数据
-            self._cache.put(key, value)
-            self.current_bytes += size
-    
-    def _calculate_size(self, value: tuple) -> int:
+
+    def __init__(self, max_bytes: int, on_evict: Optional[Callable[[Any, Any], None]] = None):
+        super().__init__(max_bytes, size_of=self._calculate_size, on_evict=on_evict)
+
+    @staticmethod
+    def _calculate_size(value: tuple) -> int:
         """计算数据大小（字节）"""
-        import sys
         total_size = 0
         for item in value:
             if hasattr(item, 'nbytes'):  # numpy数组
@@ -118,28 +97,20 @@ class ProjectorLRUCache:
             else:
                 total_size += sys.getsizeof(item)
         return total_size
-    
-    def _evict_oldest(self) -> None:
-        """删除最久未使用的条目"""
-        # 由于OptimizedLRUCache内部管理，这里只需要清空
-        # 实际的内存释放由OptimizedLRUCache的popitem完成
-        pass
-    
-    def clear(self) -> None:
-        """清空缓存"""
-        with self._lock:
-            self._cache.clear()
-            self.current_bytes = 0
-    
+
     def get_stats(self) -> dict:
         """获取缓存统计信息"""
-        with self._lock:
-            return {
-                'current_bytes': self.current_bytes,
-                'max_bytes': self.max_bytes,
-                'current_entries': self._cache.size(),
-                'memory_usage_ratio': self.current_bytes / self.max_bytes if self.max_bytes > 0 else 0
-            }
+        stats = self.stats()
+        return {
+            'current_bytes': stats.current_bytes,
+            'max_bytes': stats.max_bytes,
+            'current_entries': stats.entries,
+            'memory_usage_ratio': stats.current_bytes / stats.max_bytes,
+            'hits': stats.hits,
+            'misses': stats.misses,
+            'evictions': stats.evictions,
+            'hit_rate': stats.hit_rate,
+        }
 
 
 # 使用示例
@@ -0,0 +1,127 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from qtomography.domain.density import project_to_simplex
+from qtomography.domain.projectors import ProjectorSet
+from qtomography.domain.reconstruction.apg import APGReconstructor
+from qtomography.domain.reconstruction.rhor_strict import RrhoStrictReconstructor
+
+
+def _mixed_state(d: int, rank: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    A = rng.normal(size=(d, rank)) + 1j * rng.normal(size=(d, rank))
+    rho = A @ A.conj().T
+    return rho / np.trace(rho)
+
+
+def _counts(rho: np.ndarray, design: str, shots: int, seed: int) -> np.ndarray:
+    ps = ProjectorSet.get(rho.shape[0], design=design)
+    probs = np.real(np.einsum("aij,ji->a", ps.projectors, rho))
+    rng = np.random.default_rng(seed)
+    return rng.poisson(np.clip(probs, 0.0, None) * shots).astype(float)
+
+
+def test_project_to_simplex_matches_definition():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(5, 7))
+    projected = project_to_simplex(values)
+    assert np.allclose(projected.sum(axis=-1), 1.0)
+    assert np.all(projected >= 0.0)
+    # 投影只平移并截断：正分量与原分量之差在每行内为常数
+    for row, proj in zip(values, projected):
+        shift = row[proj > 0] - proj[proj > 0]
+        assert np.allclose(shift, shift[0])
+    # 已在单纯形上的向量保持不变
+    p = np.array([0.2, 0.5, 0.3])
+    assert np.allclose(project_to_simplex(p), p)
+
+
+def test_apg_recovers_state_from_exact_probabilities():
+    rho = _mixed_state(3, 3, seed=1)
+    ps = ProjectorSet.get(3, design="mub")
+    probs = np.real(np.einsum("aij,ji->a", ps.projectors, rho))
+
+    result = APGReconstructor(3, max_iterations=5000).reconstruct_with_details(probs)
+
+    assert result.converged
+    assert np.linalg.norm(result.rho_matrix_raw - rho) < 1e-4
+    eigvals = np.linalg.eigvalsh(result.rho_matrix_raw)
+    assert eigvals.min() >= -1e-12
+    assert np.isclose(np.trace(result.rho_matrix_raw).real, 1.0)
+
+
+@pytest.mark.parametrize("design,d", [("mub", 5), ("nopovm", 4)])
+def test_apg_reaches_rhor_likelihood(design, d):
+    rho = _mixed_state(d, 2, seed=d)
+    counts = _counts(rho, design, shots=2000, seed=d)
+
+    apg = APGReconstructor(d, design=design).reconstruct_with_details(counts)
+    rhor = RrhoStrictReconstructor(d, design=design, acceleration="momentum").reconstruct_with_details(counts)
+
+    assert apg.converged
+    # 同一（按组条件）似然的最大值：比较两解在 APG 目标下的取值
+    ps = ProjectorSet.get(d, design=design)
+    f = apg.normalized_probabilities
+    groups = ps.group_index
+
+    def ll(r):
+        q = np.real(np.einsum("aij,ji->a", ps.projectors, r))
+        return float(np.dot(f, np.log(q / groups.group_sums(q)[groups.inverse])))
+
+    assert np.isclose(apg.log_likelihood, ll(apg.rho_matrix_raw))
+    assert apg.log_likelihood >= ll(rhor.rho_matrix_raw) - 1e-7
+
+
+def test_apg_linear_initialization_is_quiet_and_does_not_mask_errors(monkeypatch):
+    rho = _mixed_state(5, 2, seed=3)
+    counts = _counts(rho, "mub", shots=200, seed=4)
+    apg = APGReconstructor(5, max_iterations=50)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        apg.reconstruct(counts)
+
+    def broken(*args, **kwargs):
+        raise ValueError("boom")
+
+    monkeypatch.setattr(apg.linear_initializer, "reconstruct_with_details", broken)
+    with pytest.raises(ValueError, match="boom"):
+        apg.reconstruct(counts)
+
+
+def test_apg_final_density_reuses_projection_spectrum(monkeypatch):
+    from qtomography.domain.density import DensityMatrix
+
+    rho = _mixed_state(3, 2, seed=5)
+    counts = _counts(rho, "mub", shots=500, seed=6)
+    projections = []
+    heig_calls = []
+    original_project = APGReconstructor._project
+    original_heig = DensityMatrix._heig.__func__
+
+    def counting_project(self, matrix):
+        projections.append(1)
+        return original_project(self, matrix)
+
+    def counting_heig(cls, H):
+        heig_calls.append(1)
+        return original_heig(cls, H)
+
+    monkeypatch.setattr(APGReconstructor, "_project", counting_project)
+    monkeypatch.setattr(DensityMatrix, "_heig", classmethod(counting_heig))
+    result = APGReconstructor(3, max_iterations=20).reconstruct_with_details(counts)
+    assert len(heig_calls) == len(projections)
+
+    monkeypatch.undo()
+    assert np.allclose(result.density.matrix, DensityMatrix(result.rho_matrix_raw).matrix, atol=1e-12)
+
+
+def test_apg_rejects_invalid_arguments():
+    with pytest.raises(ValueError):
+        APGReconstructor(1)
+    with pytest.raises(ValueError):
+        APGReconstructor(2, backtrack=1.5)
+    with pytest.raises(ValueError):
+        APGReconstructor(2).reconstruct(np.ones(3))
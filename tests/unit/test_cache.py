@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from qtomography.domain.cache import ByteBudgetLRU
+from qtomography.infrastructure.cache.optimized_lru import ProjectorLRUCache
+
+
+def test_lru_evicts_by_bytes_and_reports_stats():
+    evicted = []
+    cache = ByteBudgetLRU(2000, on_evict=lambda key, value: evicted.append(key))
+    for key in range(3):
+        cache.put(key, np.zeros(100))  # 800 字节
+    assert cache.keys() == [1, 2]
+    assert evicted == [0]
+
+    assert cache.get(1) is not None  # 1 成为最近使用
+    assert cache.get(0) is None
+    cache.put(3, np.zeros(100))
+    assert cache.keys() == [1, 3]
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions) == (1, 1, 2)
+    assert stats.current_bytes == 1600 and stats.entries == 2
+    assert stats.hit_rate == pytest.approx(0.5)
+
+
+def test_lru_keeps_newest_oversized_entry_and_discards_by_key():
+    cache = ByteBudgetLRU(100)
+    cache.put(("a", 1), np.zeros(4))
+    cache.put(("b", 1), np.zeros(50))
+    assert cache.keys() == [("b", 1)]
+    assert cache.current_bytes == 400
+
+    cache.put(("b", 2), np.zeros(1))
+    assert cache.discard_where(lambda key: key[0] == "b") == 1
+    assert len(cache) == 0 and cache.current_bytes == 0
+    with pytest.raises(ValueError):
+        cache.resize(0)
+
+
+def test_projector_lru_cache_actually_evicts():
+    cache = ProjectorLRUCache(max_bytes=2500)
+    for dim in range(10):
+        cache.put(dim, (np.zeros(100), np.zeros(10)))  # 880 字节
+    stats = cache.get_stats()
+    assert stats["current_entries"] == 2
+    assert stats["current_bytes"] == 1760
+    assert stats["evictions"] == 8
+    assert cache.get(9) is not None and cache.get(0) is None
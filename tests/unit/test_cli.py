@@ -323,3 +323,28 @@ def test_cli_summarize_detailed_mode(tmp_path, capsys):
     assert "Max" in captured.out
     assert "指标: purity" in captured.out
     assert "指标: trace" in captured.out
+
+
+def test_cli_warm_start_and_wls_batched_options(tmp_path, capsys):
+    from qtomography.app import load_config_file
+
+    data = np.full((6, 2), 1/6, dtype=float)
+    input_file = _write_probabilities(tmp_path, data)
+    output_dir = tmp_path / "cli_warm"
+    saved_config_path = tmp_path / "saved.json"
+
+    exit_code = cli_main([
+        "reconstruct",
+        str(input_file),
+        "--dimension", "2",
+        "--method", "wls",
+        "--output-dir", str(output_dir),
+        "--warm-start", "previous",
+        "--wls-batched",
+        "--save-config", str(saved_config_path),
+    ])
+    assert exit_code == 0
+    saved = load_config_file(saved_config_path)
+    assert saved.warm_start == "previous"
+    assert saved.wls_batched is True
+    assert (output_dir / "summary.csv").exists()
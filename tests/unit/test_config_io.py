@@ -27,9 +27,14 @@ def _make_config(tmp_path: Path) -> ReconstructionConfig:
         wls_max_iterations=1500,
         wls_min_expected_clip=1e-10,
         wls_optimizer_ftol=1e-8,
+        apg_max_iterations=500,
         tolerance=1e-8,
         cache_projectors=False,
+        wls_batched=True,
+        warm_start='previous',
+        rhor_acceleration='momentum',
         analyze_bell=True,
+        cache_max_bytes=64 * 1024 * 1024,
     )
 
 
@@ -46,8 +51,13 @@ def test_config_to_payload_serialises_paths(tmp_path: Path) -> None:
     assert payload['tolerance'] == pytest.approx(1e-8)
     assert payload['wls_min_expected_clip'] == pytest.approx(1e-10)
     assert payload['wls_optimizer_ftol'] == pytest.approx(1e-8)
+    assert payload['apg_max_iterations'] == 500
     assert payload['cache_projectors'] is False
+    assert payload['wls_batched'] is True
+    assert payload['warm_start'] == 'previous'
+    assert payload['rhor_acceleration'] == 'momentum'
     assert payload['analyze_bell'] is True
+    assert payload['cache_max_bytes'] == 64 * 1024 * 1024
 
 
 def test_round_trip_config_file(tmp_path: Path) -> None:
@@ -66,9 +76,14 @@ def test_round_trip_config_file(tmp_path: Path) -> None:
     assert loaded.wls_max_iterations == config.wls_max_iterations
     assert loaded.wls_min_expected_clip == pytest.approx(config.wls_min_expected_clip)
     assert loaded.wls_optimizer_ftol == pytest.approx(config.wls_optimizer_ftol)
+    assert loaded.apg_max_iterations == 500
     assert loaded.tolerance == config.tolerance
     assert loaded.cache_projectors is False
+    assert loaded.wls_batched is True
+    assert loaded.warm_start == 'previous'
+    assert loaded.rhor_acceleration == 'momentum'
     assert loaded.analyze_bell is True
+    assert loaded.cache_max_bytes == config.cache_max_bytes
 
 
 def test_load_config_resolves_relative_paths(tmp_path: Path) -> None:
@@ -101,6 +116,8 @@ def test_load_config_resolves_relative_paths(tmp_path: Path) -> None:
         ('wls_max_iterations', 0, 'wls_max_iterations must be a positive integer'),
         ('wls_min_expected_clip', -1, 'wls_min_expected_clip must be positive'),
         ('wls_optimizer_ftol', 0, 'wls_optimizer_ftol must be positive'),
+        ('apg_max_iterations', 0, 'apg_max_iterations must be a positive integer'),
+        ('rhor_acceleration', 'anderson', 'rhor_acceleration must be one of'),
     ],
 )
 def test_invalid_configuration_raises(tmp_path: Path, field: str, value, message: str) -> None:
@@ -187,3 +187,195 @@ def test_column_range_rejects_empty_columns(tmp_path):
     controller = ReconstructionController()
     with pytest.raises(ReconstructionError):
         controller.run_batch(config)
+
+
+def test_run_batch_apg(tmp_path):
+    from qtomography.domain.projectors import ProjectorSet
+
+    rho = np.array([[0.7, 0.2 - 0.1j], [0.2 + 0.1j, 0.3]])
+    ps = ProjectorSet.get(2, design="mub")
+    probs = np.real(np.einsum("aij,ji->a", ps.projectors, rho))
+    input_file = _write_probabilities(tmp_path, probs.reshape(-1, 1))
+
+    config = ReconstructionConfig(
+        input_path=input_file,
+        output_dir=tmp_path / "out",
+        methods=("linear", "apg", "rhor"),
+        dimension=2,
+        apg_max_iterations=500,
+    )
+    result = ReconstructionController().run_batch(config)
+
+    summary = pd.read_csv(result.summary_path)
+    assert set(summary["method"]) == {"linear", "apg", "rhor"}
+    apg_row = summary[summary["method"] == "apg"].iloc[0]
+    assert bool(apg_row["converged"])
+    assert apg_row["iterations"] <= 500
+    # APG 的按组条件似然与 RρR 的似然分列存放
+    assert np.isfinite(apg_row["grouped_log_likelihood"])
+    assert pd.isna(apg_row["log_likelihood"])
+    rhor_row = summary[summary["method"] == "rhor"].iloc[0]
+    assert pd.isna(rhor_row["grouped_log_likelihood"])
+    assert np.isclose(apg_row["purity"], np.real(np.trace(rho @ rho)), atol=1e-6)
+
+
+def test_rhor_acceleration_reaches_reconstructor(tmp_path, monkeypatch):
+    from qtomography.domain.projectors import ProjectorSet
+    from qtomography.domain.reconstruction.rhor_strict import RrhoStrictReconstructor
+
+    rho = np.array([[0.7, 0.2 - 0.1j], [0.2 + 0.1j, 0.3]])
+    ps = ProjectorSet.get(2, design="mub")
+    probs = np.real(np.einsum("aij,ji->a", ps.projectors, rho))
+    input_file = _write_probabilities(tmp_path, probs.reshape(-1, 1))
+
+    seen = []
+    original = RrhoStrictReconstructor.__init__
+
+    def recording(self, *args, **kwargs):
+        seen.append(kwargs.get("acceleration"))
+        original(self, *args, **kwargs)
+
+    monkeypatch.setattr(RrhoStrictReconstructor, "__init__", recording)
+    config = ReconstructionConfig(
+        input_path=input_file,
+        output_dir=tmp_path / "out",
+        methods=("rhor",),
+        dimension=2,
+        rhor_acceleration="Momentum",
+    )
+    assert config.rhor_acceleration == "momentum"
+    ReconstructionController().run_batch(config)
+    assert seen == ["momentum"]
+
+    with pytest.raises(ValueError):
+        ReconstructionConfig(
+            input_path=input_file,
+            output_dir=tmp_path / "out",
+            rhor_acceleration="anderson",
+        )
+
+
+def test_batched_wls_is_chunked_and_cancellable(tmp_path, monkeypatch):
+    from threading import Event
+
+    from qtomography.app import controller as controller_module
+    from qtomography.app.exceptions import ReconstructionCancelled
+    from qtomography.domain.projectors import ProjectorSet
+    from qtomography.domain.reconstruction.wls import WLSReconstructor
+
+    rng = np.random.default_rng(0)
+    A = rng.normal(size=(5, 2, 2)) + 1j * rng.normal(size=(5, 2, 2))
+    rho = A @ np.conj(np.swapaxes(A, 1, 2))
+    rho /= np.trace(rho, axis1=1, axis2=2)[:, None, None]
+    ps = ProjectorSet.get(2, design="mub")
+    probs = np.real(np.einsum("aij,nji->an", ps.projectors, rho))
+    input_file = _write_probabilities(tmp_path, probs)
+
+    def make_config(name):
+        return ReconstructionConfig(
+            input_path=input_file,
+            output_dir=tmp_path / name,
+            methods=("linear", "wls"),
+            dimension=2,
+            wls_batched=True,
+        )
+
+    calls = []
+    original = WLSReconstructor.reconstruct_batch
+
+    def counting(self, probabilities_2d, *args, **kwargs):
+        calls.append(probabilities_2d.shape[1])
+        return original(self, probabilities_2d, *args, **kwargs)
+
+    monkeypatch.setattr(WLSReconstructor, "reconstruct_batch", counting)
+    full = pd.read_csv(ReconstructionController().run_batch(make_config("full")).summary_path)
+    assert calls == [5]
+
+    calls.clear()
+    monkeypatch.setattr(controller_module, "_WLS_BATCH_CHUNK", 2)
+    chunked = pd.read_csv(ReconstructionController().run_batch(make_config("chunked")).summary_path)
+    assert calls == [2, 2, 1]
+    assert np.allclose(chunked["purity"], full["purity"], atol=1e-8)
+
+    # 取消请求在下一块求解之前生效
+    calls.clear()
+    cancel = Event()
+
+    def on_progress(event):
+        if event.stage == "sample" and event.sample_index == 1:
+            cancel.set()
+
+    with pytest.raises(ReconstructionCancelled):
+        ReconstructionController().run_batch(
+            make_config("cancelled"), progress_callback=on_progress, cancel_event=cancel
+        )
+    assert calls == [2]
+
+
+def test_linear_batch_is_chunked_and_cancellable(tmp_path, monkeypatch):
+    from threading import Event
+
+    from qtomography.app import controller as controller_module
+    from qtomography.app.exceptions import ReconstructionCancelled
+    from qtomography.domain.projectors import ProjectorSet
+    from qtomography.domain.reconstruction.linear import LinearReconstructor
+    from qtomography.domain.reconstruction.wls import WLSReconstructor
+
+    rng = np.random.default_rng(1)
+    A = rng.normal(size=(5, 2, 2)) + 1j * rng.normal(size=(5, 2, 2))
+    rho = A @ np.conj(np.swapaxes(A, 1, 2))
+    rho /= np.trace(rho, axis1=1, axis2=2)[:, None, None]
+    ps = ProjectorSet.get(2, design="mub")
+    probs = np.real(np.einsum("aij,nji->an", ps.projectors, rho))
+    input_file = _write_probabilities(tmp_path, probs)
+
+    def make_config(name):
+        return ReconstructionConfig(
+            input_path=input_file,
+            output_dir=tmp_path / name,
+            methods=("linear", "wls"),
+            dimension=2,
+            wls_batched=True,
+        )
+
+    linear_calls = []
+    wls_calls = []
+    original_linear = LinearReconstructor.reconstruct_batch
+    original_wls = WLSReconstructor.reconstruct_batch
+
+    def counting_linear(self, probabilities_2d, *args, **kwargs):
+        linear_calls.append(probabilities_2d.shape[1])
+        return original_linear(self, probabilities_2d, *args, **kwargs)
+
+    def counting_wls(self, probabilities_2d, *args, **kwargs):
+        wls_calls.append(probabilities_2d.shape[1])
+        return original_wls(self, probabilities_2d, *args, **kwargs)
+
+    monkeypatch.setattr(LinearReconstructor, "reconstruct_batch", counting_linear)
+    monkeypatch.setattr(WLSReconstructor, "reconstruct_batch", counting_wls)
+    full = pd.read_csv(ReconstructionController().run_batch(make_config("full")).summary_path)
+    assert linear_calls == [5]
+
+    # WLS 块不跨越线性块：线性块 2 列、WLS 块 3 列时按线性块边界截断
+    linear_calls.clear()
+    wls_calls.clear()
+    monkeypatch.setattr(controller_module, "_LINEAR_BATCH_CHUNK", 2)
+    monkeypatch.setattr(controller_module, "_WLS_BATCH_CHUNK", 3)
+    chunked = pd.read_csv(ReconstructionController().run_batch(make_config("chunked")).summary_path)
+    assert linear_calls == [2, 2, 1]
+    assert wls_calls == [2, 2, 1]
+    assert np.allclose(chunked["purity"], full["purity"], atol=1e-8)
+
+    # 取消请求在下一块线性求解之前生效
+    linear_calls.clear()
+    cancel = Event()
+
+    def on_progress(event):
+        if event.stage == "sample" and event.sample_index == 1:
+            cancel.set()
+
+    with pytest.raises(ReconstructionCancelled):
+        ReconstructionController().run_batch(
+            make_config("cancelled"), progress_callback=on_progress, cancel_event=cancel
+        )
+    assert linear_calls == [2]
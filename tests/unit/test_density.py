@@ -12,7 +12,7 @@ DensityMatrix类的单元测试
 
 import pytest
 import numpy as np
-from qtomography.domain.density import DensityMatrix, make_physical, compute_fidelity
+from qtomography.domain.density import DensityMatrix, make_physical, compute_fidelity, fidelity_many
 
 
 class TestDensityMatrixCreation:
@@ -120,6 +120,17 @@ class TestDensityMatrixProperties:
             rho = DensityMatrix(matrix)
             assert rho.dimension == dim
     
+    def test_matrix_property_is_read_only_view(self):
+        """matrix 返回零拷贝只读视图，.copy() 后可写且不影响原对象"""
+        rho = DensityMatrix(np.array([[0.6, 0.2], [0.2, 0.4]], dtype=complex))
+        view = rho.matrix
+        assert not view.flags.writeable
+        with pytest.raises(ValueError):
+            view[0, 0] = 1.0
+        writable = rho.matrix.copy()
+        writable[0, 0] = 1.0
+        assert np.isclose(rho.matrix[0, 0], 0.6)
+    
     def test_trace_property(self):
         """测试迹属性"""
         matrix = np.array([[0.6, 0.2], [0.2, 0.4]], dtype=complex)
@@ -317,6 +328,73 @@ class TestFidelityCalculation:
         with pytest.raises(ValueError):
             rho1.fidelity(rho2)
 
+    @staticmethod
+    def _reference_fidelity(rho1, rho2):
+        """未经优化的定义式：两次完整平方根"""
+        def sqrtm(A):
+            vals, vecs = np.linalg.eigh((A + A.conj().T) / 2)
+            return (vecs * np.sqrt(np.clip(vals, 0, None))) @ vecs.conj().T
+        s = sqrtm(rho1)
+        return float(np.real(np.trace(sqrtm(s @ rho2 @ s))) ** 2)
+
+    def test_fidelity_matches_definition(self):
+        """一般情形与纯态捷径均与定义式一致"""
+        rng = np.random.default_rng(0)
+        A = rng.normal(size=(3, 3)) + 1j * rng.normal(size=(3, 3))
+        mixed = DensityMatrix(A @ A.conj().T / np.trace(A @ A.conj().T))
+        B = rng.normal(size=(3, 3)) + 1j * rng.normal(size=(3, 3))
+        other = DensityMatrix(B @ B.conj().T / np.trace(B @ B.conj().T))
+        pure = DensityMatrix.pure_state(np.array([1, 1j, -1]) / np.sqrt(3))
+
+        for rho1, rho2 in [(mixed, other), (pure, mixed), (mixed, pure)]:
+            expected = self._reference_fidelity(rho1.matrix, rho2.matrix)
+            assert np.isclose(rho1.fidelity(rho2), expected, atol=1e-8)
+
+    def test_pure_state_fidelity_skips_eigendecomposition(self, monkeypatch):
+        """纯态参与时不做特征值分解"""
+        pure = DensityMatrix.pure_state(np.array([1, 1]) / np.sqrt(2))
+        mixed = DensityMatrix(np.array([[0.6, 0.2], [0.2, 0.4]], dtype=complex))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("unexpected eigendecomposition")
+
+        monkeypatch.setattr(DensityMatrix, "_heig", classmethod(fail))
+        monkeypatch.setattr(np.linalg, "eigvalsh", fail)
+        assert np.isclose(mixed.fidelity(pure), 0.7)
+        assert np.allclose(fidelity_many(pure, np.stack([mixed.matrix, pure.matrix])), [0.7, 1.0])
+
+    def test_non_psd_matrix_is_not_treated_as_pure(self):
+        """非半正定输入（enforce="none"）不走纯态捷径，结果与定义式一致"""
+        rng = np.random.default_rng(2)
+        Q, _ = np.linalg.qr(rng.normal(size=(3, 3)) + 1j * rng.normal(size=(3, 3)))
+        B = rng.normal(size=(3, 3)) + 1j * rng.normal(size=(3, 3))
+        other = DensityMatrix(B @ B.conj().T / np.trace(B @ B.conj().T))
+
+        for spectrum in ([1.15, 0.0, -0.15], [1.0, 1.0, -0.5]):
+            raw = (Q * np.array(spectrum)) @ Q.conj().T
+            rho = DensityMatrix(raw, enforce="none")
+            assert rho._rank_one_vector() is None
+            assert np.isclose(rho.fidelity(other), self._reference_fidelity(raw, other.matrix), atol=1e-8)
+            assert np.isclose(other.fidelity(rho), self._reference_fidelity(other.matrix, raw), atol=1e-8)
+            assert np.isclose(
+                fidelity_many(rho, other.matrix)[0], self._reference_fidelity(raw, other.matrix), atol=1e-8
+            )
+
+    def test_fidelity_many_matches_pairwise(self):
+        """批量保真度与逐对计算一致，并支持数组形式的参考态"""
+        rng = np.random.default_rng(1)
+        A = rng.normal(size=(5, 3, 3)) + 1j * rng.normal(size=(5, 3, 3))
+        stack = A @ np.conj(np.swapaxes(A, 1, 2))
+        stack /= np.trace(stack, axis1=1, axis2=2)[:, None, None]
+        reference = stack[0]
+
+        values = fidelity_many(reference, stack)
+        expected = [DensityMatrix(reference).fidelity(DensityMatrix(rho)) for rho in stack]
+        assert np.allclose(values, expected, atol=1e-8)
+        assert np.isclose(values[0], 1.0)
+        with pytest.raises(ValueError):
+            fidelity_many(reference, np.eye(2)[None] / 2)
+
 
 class TestMatrixOperations:
     """测试矩阵操作"""
@@ -398,6 +476,161 @@ class TestEqualityAndComparison:
         assert rho != None
 
 
+class TestProjectionToPhysical:
+    """测试谱投影（clip / simplex）与批量版本"""
+
+    @staticmethod
+    def _random_hermitian(n, seed):
+        rng = np.random.default_rng(seed)
+        A = rng.normal(size=(n, n)) + 1j * rng.normal(size=(n, n))
+        return (A + A.conj().T) / 2 / n
+
+    def test_simplex_is_closest_physical_state(self):
+        """simplex 投影在 Frobenius 范数下不劣于 clip，且结果物理"""
+        for seed in range(5):
+            H = self._random_hermitian(4, seed) + np.eye(4) / 4
+            rho_simplex = DensityMatrix.project_to_physical(H, method="simplex")
+            rho_clip = DensityMatrix.project_to_physical(H, method="clip")
+            assert DensityMatrix(rho_simplex).is_physical()
+            assert np.linalg.norm(H - rho_simplex) <= np.linalg.norm(H - rho_clip) + 1e-12
+
+    def test_simplex_spectrum_is_shifted_and_truncated(self):
+        """对角输入：谱被统一平移后截断到 0"""
+        rho = DensityMatrix.project_to_physical(np.diag([0.8, 0.5, -0.1]), method="simplex")
+        assert np.allclose(np.diag(rho).real, [0.65, 0.35, 0.0])
+
+    def test_single_eigendecomposition_with_diagnostics(self, monkeypatch):
+        """return_diag=True 时只做一次特征值分解"""
+        calls = []
+        original = DensityMatrix._heig.__func__
+
+        def counting_heig(cls, H):
+            calls.append(1)
+            return original(cls, H)
+
+        monkeypatch.setattr(DensityMatrix, "_heig", classmethod(counting_heig))
+        for method in ("clip", "simplex"):
+            calls.clear()
+            _, diag = DensityMatrix.project_to_physical(
+                np.diag([1.2, -0.2]), return_diag=True, method=method
+            )
+            assert len(calls) == 1
+            assert diag["projection_applied"]
+            assert np.isclose(diag["min_eig_in"], -0.2)
+
+    def test_stack_matches_single_projection(self):
+        """批量投影与逐个投影一致"""
+        stack = np.stack([self._random_hermitian(3, seed) for seed in range(6)])
+        for method in ("clip", "simplex"):
+            batched = DensityMatrix.project_stack_to_physical(stack, method=method)
+            single = np.stack([DensityMatrix.project_to_physical(H, method=method) for H in stack])
+            assert np.allclose(batched, single, atol=1e-12)
+        via_physicalize = DensityMatrix.physicalize_stack(stack, enforce="project", projection="simplex")
+        assert np.allclose(via_physicalize, DensityMatrix.project_stack_to_physical(stack), atol=1e-12)
+
+    def test_invalid_projection_method(self):
+        with pytest.raises(ValueError):
+            DensityMatrix.project_to_physical(np.eye(2) / 2, method="nearest")
+        with pytest.raises(ValueError):
+            DensityMatrix.project_stack_to_physical(np.eye(2)[None] / 2, method="nearest")
+
+
+class TestSpectralCache:
+    """测试谱分解缓存：多次谱查询只做一次特征值分解，矩阵重新赋值后失效"""
+
+    @staticmethod
+    def _count_heig(monkeypatch):
+        calls = []
+        original = DensityMatrix._heig.__func__
+
+        def counting_heig(cls, H):
+            calls.append(1)
+            return original(cls, H)
+
+        monkeypatch.setattr(DensityMatrix, "_heig", classmethod(counting_heig))
+        return calls
+
+    def test_spectral_queries_share_one_eigendecomposition(self, monkeypatch):
+        rho = DensityMatrix(np.diag([0.7, 0.2, 0.1]).astype(complex))
+        calls = self._count_heig(monkeypatch)
+
+        vals = rho.eigenvalues
+        assert np.min(rho.eigenvalues) <= np.max(rho.eigenvalues)
+        assert rho.is_positive_semidefinite()
+        assert rho.is_physical()
+        assert rho.physical_diagnostics()["min_eig"] >= 0
+        sqrt_rho = rho.matrix_square_root()
+        assert np.allclose(rho.matrix_square_root(), sqrt_rho)
+        assert len(calls) == 1
+        assert np.allclose(vals, [0.7, 0.2, 0.1])
+        assert np.allclose(sqrt_rho @ sqrt_rho, rho.matrix)
+
+    def test_cached_results_are_not_aliased(self):
+        rho = DensityMatrix(np.eye(2, dtype=complex) / 2)
+        rho.matrix_square_root()[0, 0] = 10.0
+        rho.eigenvalues[0] = 10.0
+        assert np.allclose(rho.matrix_square_root(), np.eye(2) / np.sqrt(2))
+        assert np.allclose(rho.eigenvalues, [0.5, 0.5])
+
+    def test_cache_invalidated_when_matrix_replaced(self, monkeypatch):
+        rho = DensityMatrix(np.eye(2, dtype=complex) / 2)
+        assert np.allclose(rho.eigenvalues, [0.5, 0.5])
+        calls = self._count_heig(monkeypatch)
+
+        rho._matrix = np.diag([1.0, 0.0]).astype(complex)
+        assert np.allclose(rho.eigenvalues, [1.0, 0.0])
+        assert np.allclose(rho.matrix_square_root(), np.diag([1.0, 0.0]))
+        assert len(calls) == 1
+
+
+class TestTrustedConstruction:
+    """测试重构器使用的 from_trusted 快速构造路径"""
+
+    @staticmethod
+    def _noisy_state():
+        rng = np.random.default_rng(0)
+        A = rng.normal(size=(4, 4)) + 1j * rng.normal(size=(4, 4))
+        rho = A @ A.conj().T
+        return rho / np.trace(rho) + 1e-12 * np.eye(4)
+
+    def test_matches_constructor(self):
+        matrix = self._noisy_state()
+        for enforce in ("within_tol", "project", "none"):
+            trusted = DensityMatrix.from_trusted(matrix, enforce=enforce)
+            assert np.allclose(trusted.matrix, DensityMatrix(matrix, enforce=enforce).matrix, atol=1e-14)
+        with pytest.raises(ValueError):
+            DensityMatrix.from_trusted(matrix, enforce="clip")
+
+    def test_precomputed_eigendecomposition_skips_eigh(self, monkeypatch):
+        matrix = self._noisy_state()
+        vals, vecs = np.linalg.eigh(matrix)
+        expected = DensityMatrix(matrix).matrix
+        calls = []
+        original = DensityMatrix._heig.__func__
+
+        def counting_heig(cls, H):
+            calls.append(1)
+            return original(cls, H)
+
+        monkeypatch.setattr(DensityMatrix, "_heig", classmethod(counting_heig))
+        sanitized = DensityMatrix.from_trusted(matrix, eig=(vals, vecs))
+        assert not calls
+        assert np.allclose(sanitized.matrix, expected, atol=1e-14)
+
+        raw = DensityMatrix.from_trusted(matrix, enforce="none", eig=(vals[::-1], vecs[:, ::-1]))
+        assert np.allclose(raw.eigenvalues, np.sort(vals)[::-1])
+        assert np.allclose(raw.matrix_square_root() @ raw.matrix_square_root(), matrix, atol=1e-10)
+        assert not calls
+
+    def test_no_copy_and_slots(self):
+        matrix = np.eye(2, dtype=complex) / 2
+        rho = DensityMatrix.from_trusted(matrix, enforce="none")
+        assert np.shares_memory(rho.matrix, matrix)
+        assert not hasattr(rho, "__dict__")
+        with pytest.raises(AttributeError):
+            rho.extra = 1
+
+
 class TestConvenienceFunctions:
     """测试便捷函数"""
     
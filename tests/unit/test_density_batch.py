@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from qtomography.analysis.metrics import eigenvalue_entropy
+from qtomography.domain import DensityBatch, DensityMatrix
+from qtomography.domain.reconstruction.linear import LinearReconstructor
+from qtomography.domain.projectors import ProjectorSet
+
+
+def _random_states(n: int, d: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    A = rng.normal(size=(n, d, d)) + 1j * rng.normal(size=(n, d, d))
+    rho = A @ np.conj(np.swapaxes(A, 1, 2))
+    return rho / np.trace(rho, axis1=1, axis2=2)[:, None, None]
+
+
+def test_batch_metrics_match_per_sample():
+    stack = _random_states(5, 3, seed=0)
+    stack[0] = np.diag([1.0, 0.0, 0.0])
+    batch = DensityBatch(stack)
+    densities = [DensityMatrix(rho, enforce="none") for rho in stack]
+
+    assert np.allclose(batch.traces, [rho.trace for rho in densities])
+    assert np.allclose(batch.purities, [rho.purity for rho in densities])
+    assert np.allclose(batch.eigenvalues, [rho.eigenvalues for rho in densities], atol=1e-12)
+    assert np.allclose(
+        batch.entropies(), [eigenvalue_entropy(rho.eigenvalues) for rho in densities], atol=1e-12
+    )
+    assert np.allclose(
+        batch.entropies(base="2"),
+        [eigenvalue_entropy(rho.eigenvalues, base="2") for rho in densities],
+        atol=1e-12,
+    )
+
+
+def test_batch_fidelity_matches_density_matrix():
+    stack = _random_states(4, 3, seed=1)
+    reference = DensityMatrix(_random_states(1, 3, seed=2)[0])
+    batch = DensityBatch(stack)
+
+    expected = [reference.fidelity(DensityMatrix(rho)) for rho in stack]
+    assert np.allclose(batch.fidelity(reference), expected, atol=1e-8)
+    assert np.allclose(batch.fidelity(stack[0])[0], 1.0)
+
+
+def test_batch_physicalize_matches_project_to_physical():
+    stack = _random_states(3, 2, seed=3)
+    stack[1] = np.diag([1.2, -0.2])
+    projected = DensityBatch(stack).physicalize(projection="simplex")
+
+    for raw, rho in zip(stack, projected.matrices):
+        assert np.allclose(rho, DensityMatrix.project_to_physical(raw, method="simplex"), atol=1e-12)
+    assert np.all(projected.eigenvalues >= 0)
+
+
+def test_batch_round_trip_and_indexing():
+    stack = _random_states(3, 2, seed=4)
+    batch = DensityBatch.from_densities(DensityMatrix(rho) for rho in stack)
+
+    assert len(batch) == 3 and batch.dimension == 2
+    assert not batch.matrices.flags.writeable
+    assert isinstance(batch[1], DensityMatrix)
+    assert np.allclose(batch[1].matrix, stack[1])
+    assert len(batch[1:]) == 2
+    assert np.allclose(np.stack([rho.matrix for rho in batch.to_densities()]), batch.matrices)
+    stack[0] = 0.0
+    assert not np.allclose(batch.matrices[0], 0.0)
+
+
+def test_linear_batch_result_exposes_density_batch():
+    rho = _random_states(2, 2, seed=5)
+    ps = ProjectorSet.get(2)
+    probs = np.real(np.einsum("aij,nji->an", ps.projectors, rho))
+    result = LinearReconstructor(2).reconstruct_batch(probs)
+
+    assert np.allclose(result.density_batch.purities, np.real(np.einsum("nij,nji->n", rho, rho)))
+
+
+def test_batch_rejects_invalid_input():
+    with pytest.raises(ValueError):
+        DensityBatch(np.zeros((2, 2, 3)))
+    with pytest.raises(ValueError):
+        DensityBatch.from_densities([])
+    with pytest.raises(ValueError):
+        DensityBatch(_random_states(2, 2, seed=6)).fidelity(np.eye(3) / 3)
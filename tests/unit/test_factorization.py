@@ -0,0 +1,80 @@
+"""测量矩阵分解缓存测试。"""
+
+import numpy as np
+import pytest
+
+from qtomography.domain.factorization import (
+    FactorizationCache,
+    clear_factorization_cache,
+    factorize_measurement_matrix,
+    get_factorization,
+)
+from qtomography.domain.projectors import ProjectorSet
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_factorization_cache()
+    yield
+    clear_factorization_cache()
+
+
+def test_factorization_matches_numpy():
+    ps = ProjectorSet.get(3)
+    fac = ps.factorization()
+    M = ps.measurement_matrix
+    assert fac.rank == np.linalg.matrix_rank(M)
+    assert np.allclose(fac.singular_values, np.linalg.svd(M, compute_uv=False))
+    assert np.allclose(fac.pseudo_inverse, np.linalg.pinv(M))
+    assert fac.solve_operator is fac.pseudo_inverse
+    assert fac.condition_number >= 1.0
+
+
+def test_factorization_is_shared_and_keyed_by_regularization():
+    ps_a = ProjectorSet.get(2)
+    ps_b = ProjectorSet(2, cache=False)
+    assert get_factorization(ps_a) is get_factorization(ps_b)
+
+    ridge = get_factorization(ps_a, 1e-3)
+    assert ridge is not get_factorization(ps_a)
+    M = ps_a.measurement_matrix
+    expected = np.linalg.solve(M.T @ M + 1e-3 * np.eye(M.shape[1]), M.T)
+    assert np.allclose(ridge.solve_operator, expected)
+    assert not ridge.solve_operator.flags.writeable
+
+
+def test_cache_evicts_by_byte_budget():
+    ps2 = ProjectorSet.get(2)
+    ps3 = ProjectorSet.get(3)
+    small = factorize_measurement_matrix(ps2.measurement_matrix, dimension=2, design="mub")
+    large = factorize_measurement_matrix(ps3.measurement_matrix, dimension=3, design="mub")
+
+    cache = FactorizationCache(max_bytes=large.nbytes + 1)
+    cache.put((2, "mub", None), small)
+    cache.put((3, "mub", None), large)
+    assert (2, "mub", None) not in cache
+    assert (3, "mub", None) in cache
+    assert cache.current_bytes == large.nbytes
+
+    cache.resize(1)
+    assert len(cache) == 1
+
+
+def test_normalized_povm_is_shared_and_keyed_by_thresholds():
+    from qtomography.domain.reconstruction.rhor_strict import RrhoStrictReconstructor
+
+    ps = ProjectorSet.get(3, design="nopovm")
+    povm = ps.normalized_povm()
+    assert povm is ProjectorSet(3, design="nopovm", cache=False).normalized_povm()
+    assert povm is not ps.normalized_povm(eig_rel_thresh=1e-6)
+    assert not povm.operators.flags.writeable
+
+    # Σ Ē_j 在支撑上为单位阵，且 B = H^{-1/2} US 给出 Ē_j = B† M_j B
+    assert povm.diagnostics["etilde_sum_valid"]
+    assert np.allclose(povm.operators.sum(axis=0), np.eye(povm.support_dim), atol=1e-8)
+    B = povm.h_sqrt_inv @ povm.support_basis
+    assert np.allclose(povm.operators[1], B.conj().T @ ps.projectors[1] @ B)
+
+    recon_a = RrhoStrictReconstructor(3, design="nopovm")
+    recon_b = RrhoStrictReconstructor(3, design="nopovm", cache_projectors=False)
+    assert recon_a._normalized_povm() is recon_b._normalized_povm() is povm
@@ -8,6 +8,7 @@ import pytest
 
 from qtomography.gui.services.fidelity_service import (
     FidelityComputationError,
+    compute_fidelities_from_files,
     compute_fidelity_from_files,
     compute_fidelity_with_custom_state,
 )
@@ -67,6 +68,22 @@ def test_compute_fidelity_dimension_mismatch(tmp_path: Path) -> None:
         compute_fidelity_from_files(experimental_file, theory_file)
 
 
+def test_compute_fidelities_from_files_matches_pairwise(tmp_path: Path) -> None:
+    theory_file = tmp_path / "th.json"
+    _write_density_json(theory_file, np.array([[0.6, 0.2], [0.2, 0.4]], dtype=complex))
+    paths = []
+    for k, matrix in enumerate(
+        [np.eye(2, dtype=complex) / 2, np.array([[1, 0], [0, 0]], dtype=complex)]
+    ):
+        paths.append(tmp_path / f"exp{k}.json")
+        _write_density_json(paths[-1], matrix)
+
+    results = compute_fidelities_from_files(paths, theory_file)
+
+    expected = [compute_fidelity_from_files(path, theory_file).fidelity for path in paths]
+    assert np.allclose([result.fidelity for result in results], expected, atol=1e-8)
+
+
 def test_compute_fidelity_custom_invalid_amplitudes(tmp_path: Path) -> None:
     rho = np.eye(2, dtype=complex) / 2
     experimental_file = tmp_path / "exp.json"
@@ -0,0 +1,52 @@
+"""分组索引与向量化按组归一化测试。"""
+
+import numpy as np
+import pytest
+
+from qtomography.domain.grouping import GroupIndex, normalize_per_group
+from qtomography.domain.projectors import ProjectorSet
+
+
+def _loop_normalize(values, groups):
+    out = np.asarray(values, dtype=float).copy()
+    for g in np.unique(groups):
+        idx = np.where(groups == g)[0]
+        out[idx] = out[idx] / np.sum(out[idx], axis=0)
+    return out
+
+
+def test_group_index_contiguous_for_mub():
+    ps = ProjectorSet.get(3, design="mub")
+    gi = ps.group_index
+    assert gi.contiguous
+    assert gi.size == ps.projectors.shape[0]
+    assert gi.num_groups == 4
+    assert np.all(gi.counts == 3)
+    assert ps.group_index is gi
+
+
+def test_normalize_matches_loop_for_unsorted_groups():
+    rng = np.random.default_rng(0)
+    groups = np.array([2, 0, 1, 0, 2, 1, 1])
+    gi = GroupIndex.from_labels(groups)
+    assert not gi.contiguous
+    values = rng.random((7, 5)) + 0.1
+    assert np.allclose(normalize_per_group(values, gi, tolerance=1e-12), _loop_normalize(values, groups))
+    assert np.allclose(
+        normalize_per_group(values[:, 0], gi, tolerance=1e-12), _loop_normalize(values[:, 0], groups)
+    )
+
+
+def test_normalize_rejects_zero_group_sum():
+    gi = GroupIndex.from_labels(np.array([0, 0, 1, 1]))
+    data = np.array([[1.0, 1.0], [1.0, 1.0], [0.0, 1.0], [0.0, 2.0]])
+    with pytest.raises(ValueError, match="zero"):
+        normalize_per_group(data, gi, tolerance=1e-12)
+    with pytest.raises(ValueError, match="bad"):
+        normalize_per_group(data, gi, tolerance=1e-12, zero_sum_message="bad")
+
+
+def test_normalize_rejects_wrong_length():
+    gi = GroupIndex.from_labels(np.array([0, 0, 1]))
+    with pytest.raises(ValueError):
+        normalize_per_group(np.ones(4), gi, tolerance=1e-12)
@@ -1,5 +1,7 @@
 ﻿"""LinearReconstructor 单元测试。"""
 
+import warnings
+
 import numpy as np
 import pytest
 
@@ -7,6 +9,7 @@ from qtomography.domain.reconstruction.linear import (
     LinearReconstructionResult,
     LinearReconstructor,
 )
+from qtomography.domain.density import DensityMatrix
 from qtomography.domain.projectors import ProjectorSet
 
 
@@ -80,3 +83,240 @@ class TestLinearReconstructorAdvanced:
 
 
 
+class TestLinearReconstructorBatch:
+    def _random_densities(self, dim: int, count: int, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        out = []
+        for _ in range(count):
+            a = rng.normal(size=(dim, dim)) + 1j * rng.normal(size=(dim, dim))
+            rho = a @ a.conj().T
+            out.append(rho / np.trace(rho))
+        return out
+
+    @pytest.mark.parametrize("regularization", [None, 1e-3])
+    def test_batch_matches_per_sample(self, regularization):
+        dim = 3
+        reconstructor = LinearReconstructor(dim, regularization=regularization, density_warn=False)
+        projectors = reconstructor.projector_set.projectors
+        rng = np.random.default_rng(1)
+        columns = [
+            _probabilities_from_density(projectors, rho) + rng.normal(scale=1e-3, size=len(projectors))
+            for rho in self._random_densities(dim, 5)
+        ]
+        data = np.abs(np.stack(columns, axis=1))
+
+        batch = reconstructor.reconstruct_batch(data)
+        assert batch.num_samples == 5
+        assert batch.densities.shape == (5, dim, dim)
+        assert batch.normalized_probabilities.shape == data.shape
+
+        for idx in range(data.shape[1]):
+            single = reconstructor.reconstruct_with_details(data[:, idx])
+            item = batch.result_at(idx)
+            assert np.allclose(item.rho_matrix_raw, single.rho_matrix_raw, atol=1e-10)
+            assert np.allclose(item.density.matrix, single.density.matrix, atol=1e-10)
+            assert np.allclose(item.normalized_probabilities, single.normalized_probabilities)
+            assert item.rank == single.rank
+            assert item.residuals.size == single.residuals.size
+            if single.residuals.size:
+                assert np.allclose(item.residuals, single.residuals, atol=1e-12)
+
+    def test_batch_zero_group_sum(self):
+        reconstructor = LinearReconstructor(2)
+        data = np.ones((reconstructor.projector_set.projectors.shape[0], 2))
+        data[:2, 1] = 0.0
+        with pytest.raises(ValueError):
+            reconstructor.reconstruct_batch(data)
+
+
+    def test_batch_simplex_projection_matches_per_sample(self):
+        rng = np.random.default_rng(5)
+        reconstructor = LinearReconstructor(3, density_enforce="project", density_projection="simplex")
+        m = reconstructor.projector_set.projectors.shape[0]
+        data = np.abs(rng.normal(size=(m, 4)))
+
+        batch = reconstructor.reconstruct_batch(data)
+        for idx in range(data.shape[1]):
+            single = reconstructor.reconstruct_with_details(data[:, idx])
+            expected = DensityMatrix.project_to_physical(single.rho_matrix_raw, method="simplex")
+            assert np.allclose(single.density.matrix, expected, atol=1e-12)
+            assert np.allclose(batch.densities[idx], expected, atol=1e-10)
+
+    def test_simplex_projection_reuses_its_eigendecomposition(self, monkeypatch):
+        reconstructor = LinearReconstructor(3, density_enforce="project", density_projection="simplex")
+        m = reconstructor.projector_set.projectors.shape[0]
+        probs = np.abs(np.random.default_rng(6).normal(size=m))
+        calls = []
+        original = DensityMatrix._heig.__func__
+
+        def counting_heig(cls, H):
+            calls.append(1)
+            return original(cls, H)
+
+        monkeypatch.setattr(DensityMatrix, "_heig", classmethod(counting_heig))
+        density = reconstructor.reconstruct(probs)
+        assert np.allclose(np.sort(density.eigenvalues), np.sort(np.linalg.eigvalsh(density.matrix)), atol=1e-12)
+        assert len(calls) == 1
+
+    def test_unprojected_density_does_not_alias_returned_arrays(self):
+        reconstructor = LinearReconstructor(2, density_enforce="none")
+        m = reconstructor.projector_set.projectors.shape[0]
+        data = np.abs(np.random.default_rng(7).normal(size=(m, 2)))
+
+        single = reconstructor.reconstruct_with_details(data[:, 0])
+        expected = single.density.matrix.copy()
+        purity = single.density.purity
+        single.rho_matrix_raw[:] = 0.0
+        assert np.allclose(single.density.matrix, expected)
+        assert np.isclose(single.density.purity, purity)
+
+        batch = reconstructor.reconstruct_batch(data)
+        item = batch.result_at(1)
+        expected = item.density.matrix.copy()
+        batch.densities[1] = 0.0
+        assert np.allclose(item.density.matrix, expected)
+
+    def test_rejects_unknown_density_projection(self):
+        with pytest.raises(ValueError):
+            LinearReconstructor(2, density_projection="nearest")
+
+
+class TestDualFrameSolver:
+    @pytest.mark.parametrize("design,dim", [("mub", 2), ("mub", 3), ("mub", 4), ("nopovm", 3)])
+    def test_dual_frame_matches_lstsq(self, design, dim):
+        rng = np.random.default_rng(3)
+        a = rng.normal(size=(dim, dim)) + 1j * rng.normal(size=(dim, dim))
+        rho = a @ a.conj().T
+        rho /= np.trace(rho)
+
+        lstsq = LinearReconstructor(dim, design=design, density_warn=False)
+        dual = LinearReconstructor(dim, design=design, solver="dual_frame", density_warn=False)
+        projectors = lstsq.projector_set.projectors
+        probs = _probabilities_from_density(projectors, rho) + rng.normal(scale=1e-3, size=len(projectors))
+        probs = np.abs(probs)
+
+        expected = lstsq.reconstruct_with_details(probs)
+        result = dual.reconstruct_with_details(probs)
+        assert np.allclose(result.rho_matrix_raw, expected.rho_matrix_raw, atol=1e-10)
+        assert result.rank == expected.rank
+
+        batch = dual.reconstruct_batch(np.stack([probs, probs], axis=1))
+        assert np.allclose(batch.rho_matrices_raw[1], expected.rho_matrix_raw, atol=1e-10)
+
+    def test_mub_dual_operators_closed_form(self):
+        ps = ProjectorSet.get(3)
+        frame = ps.dual_frame()
+        assert frame.closed_form
+        expected = ps.projectors - np.eye(3)[None, :, :] / 4
+        assert np.allclose(ps.dual_operators, expected)
+
+    def test_mub_dual_frame_skips_svd(self, monkeypatch):
+        from qtomography.domain import factorization as factorization_module
+
+        def fail(*args, **kwargs):
+            raise AssertionError("unexpected SVD of the measurement matrix")
+
+        ProjectorSet.clear_cache()
+        monkeypatch.setattr(factorization_module, "factorize_measurement_matrix", fail)
+        reconstructor = LinearReconstructor(3, solver="dual_frame", density_warn=False)
+        m = reconstructor.projector_set.projectors.shape[0]
+        probs = np.abs(np.random.default_rng(8).normal(size=m))
+
+        result = reconstructor.reconstruct_with_details(probs)
+        assert result.rank == 9
+        assert result.singular_values.size == 0
+        assert result.residuals.size == 1
+        batch = reconstructor.reconstruct_batch(np.stack([probs, probs], axis=1))
+        assert batch.residuals_available and batch.rank == 9
+        assert np.allclose(batch.residuals, result.residuals[0])
+
+    def test_dual_frame_rejects_regularization(self):
+        with pytest.raises(ValueError):
+            LinearReconstructor(2, solver="dual_frame", regularization=1e-3)
+
+
+class TestHermitianSolver:
+    @pytest.mark.parametrize("design,dim", [("mub", 2), ("mub", 3), ("nopovm", 4)])
+    def test_hermitian_matches_lstsq(self, design, dim):
+        rng = np.random.default_rng(5)
+        a = rng.normal(size=(dim, dim)) + 1j * rng.normal(size=(dim, dim))
+        rho = a @ a.conj().T
+        rho /= np.trace(rho)
+
+        lstsq = LinearReconstructor(dim, design=design, density_warn=False)
+        herm = LinearReconstructor(dim, design=design, solver="hermitian", density_warn=False)
+        projectors = lstsq.projector_set.projectors
+        probs = np.abs(_probabilities_from_density(projectors, rho) + rng.normal(scale=1e-3, size=len(projectors)))
+
+        expected = lstsq.reconstruct_with_details(probs)
+        result = herm.reconstruct_with_details(probs)
+        assert np.allclose(result.rho_matrix_raw, result.rho_matrix_raw.conj().T)
+        assert np.allclose(result.rho_matrix_raw, expected.rho_matrix_raw, atol=1e-10)
+        assert result.rank == dim * dim
+        assert result.residuals.size == expected.residuals.size
+
+        batch = herm.reconstruct_batch(np.stack([probs, probs], axis=1))
+        assert np.allclose(batch.rho_matrices_raw[0], expected.rho_matrix_raw, atol=1e-10)
+
+    def test_real_design_matrix_is_real_and_cached(self):
+        ps = ProjectorSet.get(3)
+        fac = ps.hermitian_factorization()
+        assert fac.design_matrix.dtype == np.float64
+        assert fac.design_matrix.shape == (12, 9)
+        assert ps.hermitian_factorization() is fac
+
+
+class TestSparseBackend:
+    def _nopovm_probs(self, dimension, seed=0):
+        rng = np.random.default_rng(seed)
+        A = rng.normal(size=(dimension, dimension)) + 1j * rng.normal(size=(dimension, dimension))
+        rho = A @ A.conj().T
+        rho /= np.trace(rho)
+        projectors = ProjectorSet.get(dimension, design="nopovm").projectors
+        return np.real(np.einsum("aij,ji->a", projectors, rho))
+
+    def test_sparse_matrix_matches_dense_nopovm(self):
+        for dimension in (2, 3, 5):
+            ps = ProjectorSet(dimension, design="nopovm", cache=False, materialize=False)
+            sparse = ps.measurement_matrix_sparse
+            assert not ps.is_materialized
+            assert sparse.getnnz(axis=1).max() <= 4
+            assert np.allclose(sparse.toarray(), ps.measurement_matrix)
+
+    @pytest.mark.parametrize("regularization", [None, 1e-2])
+    def test_sparse_matches_dense(self, regularization):
+        probs = self._nopovm_probs(4)
+        dense = LinearReconstructor(4, design="nopovm", regularization=regularization)
+        sparse = LinearReconstructor(4, design="nopovm", regularization=regularization, backend="sparse")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            a = dense.reconstruct_with_details(probs)
+            b = sparse.reconstruct_with_details(probs)
+        assert np.allclose(a.rho_matrix_raw, b.rho_matrix_raw, atol=1e-10)
+        assert np.allclose(a.residuals, b.residuals)
+        assert b.singular_values.size == 0
+
+    def test_sparse_batch_matches_dense_batch(self):
+        probs = np.stack([self._nopovm_probs(3, seed) for seed in range(4)], axis=1)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            a = LinearReconstructor(3, design="nopovm").reconstruct_batch(probs)
+            b = LinearReconstructor(3, design="nopovm", backend="sparse").reconstruct_batch(probs)
+        assert np.allclose(a.rho_matrices_raw, b.rho_matrices_raw, atol=1e-10)
+
+    def test_sparse_rejects_other_solvers(self):
+        with pytest.raises(ValueError):
+            LinearReconstructor(2, backend="sparse", solver="dual_frame")
+        with pytest.raises(ValueError):
+            LinearReconstructor(2, backend="bogus")
+
+
+class TestSharedProjectorSet:
+    def test_reuses_given_projector_set(self):
+        ps = ProjectorSet(2, design="mub", cache=False)
+        reconstructor = LinearReconstructor(2, projector_set=ps)
+        assert reconstructor.projector_set is ps
+
+    def test_rejects_dimension_mismatch(self):
+        with pytest.raises(ValueError):
+            LinearReconstructor(3, projector_set=ProjectorSet.get(2))
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from qtomography.domain.projectors import ProjectorSet
+from qtomography.domain.reconstruction.apg import APGReconstructor
+from qtomography.domain.reconstruction.low_rank import LowRankReconstructor
+
+
+def _state(d: int, rank: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    A = rng.normal(size=(d, rank)) + 1j * rng.normal(size=(d, rank))
+    rho = A @ A.conj().T
+    return rho / np.trace(rho)
+
+
+def _probabilities(rho: np.ndarray, design: str) -> np.ndarray:
+    ps = ProjectorSet.get(rho.shape[0], design=design)
+    return np.real(np.einsum("aij,ji->a", ps.projectors, rho))
+
+
+@pytest.mark.parametrize("design", ["mub", "nopovm"])
+def test_low_rank_recovers_pure_state_with_fixed_rank(design):
+    rho = _state(5, 1, seed=3)
+    result = LowRankReconstructor(5, rank=1, design=design).reconstruct_with_details(
+        _probabilities(rho, design)
+    )
+
+    assert result.rank == 1
+    assert result.factor.shape == (5, 1)
+    assert np.isclose(np.linalg.norm(result.factor), 1.0)
+    assert np.linalg.norm(result.rho_matrix_raw - rho) < 1e-5
+
+
+def test_low_rank_escalates_to_true_rank_from_counts():
+    rho = _state(7, 2, seed=4)
+    rng = np.random.default_rng(0)
+    counts = rng.poisson(_probabilities(rho, "mub") * 20000).astype(float)
+
+    result = LowRankReconstructor(7).reconstruct_with_details(counts)
+
+    assert result.rank == 2
+    assert [r for r, _ in result.rank_history] == [1, 2, 3]
+    assert np.linalg.norm(result.rho_matrix_raw - rho) < 0.05
+
+
+def test_low_rank_matches_full_rank_likelihood():
+    rho = _state(4, 4, seed=5)
+    rng = np.random.default_rng(1)
+    counts = rng.poisson(_probabilities(rho, "mub") * 5000).astype(float)
+
+    low_rank = LowRankReconstructor(4, rank=4).reconstruct_with_details(counts)
+    apg = APGReconstructor(4).reconstruct_with_details(counts)
+
+    assert np.isclose(low_rank.log_likelihood, apg.log_likelihood, atol=1e-6)
+
+
+def test_low_rank_chi2_gradient_matches_finite_differences():
+    recon = LowRankReconstructor(3, rank=2, objective="chi2", design="nopovm")
+    f = recon._normalize_probabilities(_probabilities(_state(3, 3, seed=6), "nopovm"))
+    V = recon._measurement_vectors()
+    x = np.random.default_rng(2).normal(size=2 * 3 * 2)
+
+    _, grad = recon._objective_and_gradient(x, f, V, 2)
+    eps = 1e-6
+    numeric = np.array([
+        (recon._objective_and_gradient(x + eps * e, f, V, 2)[0]
+         - recon._objective_and_gradient(x - eps * e, f, V, 2)[0]) / (2 * eps)
+        for e in np.eye(x.size)
+    ])
+    assert np.allclose(grad, numeric, atol=1e-6)
+
+
+def test_low_rank_rejects_invalid_arguments():
+    with pytest.raises(ValueError):
+        LowRankReconstructor(3, rank=4)
+    with pytest.raises(ValueError):
+        LowRankReconstructor(3, objective="l2")
+    with pytest.raises(ValueError):
+        LowRankReconstructor(3, rank_start=3, max_rank=2)
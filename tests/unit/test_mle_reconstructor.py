@@ -62,3 +62,234 @@ class TestMLEReconstructorAddsNoise:
         result = mle.reconstruct_with_details(noisy_probs, initial_density=rho_true)
         frob = np.linalg.norm(result.density.matrix - rho_true)
         assert frob < 5e-2
+
+
+class TestMLEReconstructorSparseBackend:
+    def test_sparse_expected_probabilities_match_dense(self):
+        dim = 3
+        dense = MLEReconstructor(dim, design="nopovm")
+        sparse = MLEReconstructor(dim, design="nopovm", backend="sparse")
+        rho = _random_density(dim, seed=5)
+        q_dense = dense._expected_probabilities(rho, dense.projector_set.projectors)
+        q_sparse = sparse._expected_probabilities(rho, sparse.projector_set.measurement_matrix_sparse)
+        assert np.allclose(q_dense, q_sparse)
+
+    def test_sparse_reconstruction_matches_dense(self):
+        dim = 3
+        dense = MLEReconstructor(dim, design="nopovm")
+        sparse = MLEReconstructor(dim, design="nopovm", backend="sparse")
+        rho_true = _random_density(dim, seed=9)
+        probs = _probabilities(dense.projector_set.projectors, rho_true)
+        a = dense.reconstruct_with_details(probs, initial_density=rho_true)
+        b = sparse.reconstruct_with_details(probs, initial_density=rho_true)
+        assert np.allclose(a.rho_matrix_raw, b.rho_matrix_raw, atol=1e-6)
+
+
+class TestMLEReconstructorAnalyticGradient:
+    @pytest.mark.parametrize("regularization", [None, 1e-3])
+    def test_gradient_matches_finite_differences(self, regularization):
+        from scipy.optimize import approx_fprime
+
+        dim = 3
+        mle = MLEReconstructor(dim)
+        projectors = mle.projector_set.projectors
+        rng = np.random.default_rng(7)
+        params = rng.normal(scale=0.5, size=dim * dim)
+        probs = _probabilities(projectors, _random_density(dim, seed=3))
+        value, grad = mle._objective_and_gradient(params, probs, projectors, regularization)
+        assert value == pytest.approx(mle._objective_function(params, probs, projectors, regularization))
+        numeric = approx_fprime(
+            params, lambda x: mle._objective_function(x, probs, projectors, regularization), 1e-7
+        )
+        assert np.allclose(grad, numeric, rtol=1e-4, atol=1e-5)
+
+    def test_gradient_reduces_function_evaluations(self):
+        dim = 3
+        mle = MLEReconstructor(dim)
+        rho_true = _random_density(dim, seed=11)
+        probs = _probabilities(mle.projector_set.projectors, rho_true)
+        result = mle.reconstruct_with_details(probs, initial_density=np.eye(dim) / dim)
+        assert result.success
+        assert result.n_function_evaluations <= 2 * (result.n_iterations + 5)
+        assert np.allclose(result.rho_matrix_raw, rho_true, atol=1e-4)
+
+
+class TestMLEReconstructorVectorizedParameterization:
+    def test_parameter_order_matches_row_major_layout(self):
+        dim = 4
+        rho = _random_density(dim, seed=17)
+        params = MLEReconstructor.encode_density_to_params(rho)
+        lower = np.linalg.cholesky(rho)
+        expected = []
+        for i in range(dim):
+            expected.append(np.log(lower[i, i].real))
+            for j in range(i):
+                expected.extend([lower[i, j].real, lower[i, j].imag])
+        assert np.allclose(params, expected)
+
+    def test_decode_into_preallocated_buffer(self):
+        dim = 3
+        rho = _random_density(dim, seed=21)
+        params = MLEReconstructor.encode_density_to_params(rho)
+        buffer = np.empty((dim, dim), dtype=complex)
+        out = MLEReconstructor.decode_params_to_density(params, dim, out=buffer)
+        assert out is buffer
+        assert np.allclose(buffer, rho, atol=1e-10)
+
+    def test_stacked_measurement_expected_probabilities(self):
+        dim = 3
+        mle = MLEReconstructor(dim)
+        rho = _random_density(dim, seed=2)
+        stacked = mle._stacked_measurement()
+        assert stacked.shape == (mle.projector_set.projectors.shape[0], 2 * dim * dim)
+        buffer = np.empty(stacked.shape[0])
+        q = mle._expected_probabilities(rho, stacked, out=buffer)
+        assert q is buffer
+        assert np.allclose(q, _probabilities(mle.projector_set.projectors, rho))
+
+
+class TestMLEReconstructorLinearInitializer:
+    def test_initializer_shares_projector_set(self):
+        mle = MLEReconstructor(3, design="nopovm")
+        initializer = mle.linear_initializer
+        assert initializer.projector_set is mle.projector_set
+        assert initializer.projector_set.design == "nopovm"
+        assert mle.linear_initializer is initializer
+
+    def test_accepts_precomputed_linear_result(self):
+        from qtomography.domain.reconstruction.linear import LinearReconstructor
+
+        dim = 3
+        mle = MLEReconstructor(dim)
+        rho_true = _random_density(dim, seed=31)
+        probs = _probabilities(mle.projector_set.projectors, rho_true)
+        linear_result = LinearReconstructor(dim).reconstruct_with_details(probs)
+        result = mle.reconstruct_with_details(probs, linear_result=linear_result)
+        assert mle._linear_initializer is None
+        assert np.allclose(result.rho_matrix_raw, rho_true, atol=1e-5)
+
+
+class TestMLEReconstructorBatch:
+    def _noisy_batch(self, mle, dim, num_samples, seed=0):
+        rng = np.random.default_rng(seed)
+        projectors = mle.projector_set.projectors
+        columns = []
+        for k in range(num_samples):
+            vec = rng.normal(size=dim) + 1j * rng.normal(size=dim)
+            vec /= np.linalg.norm(vec)
+            rho = 0.9 * np.outer(vec, vec.conj()) + 0.1 * np.eye(dim) / dim
+            probs = _probabilities(projectors, rho) + rng.normal(scale=2e-3, size=projectors.shape[0])
+            columns.append(np.clip(probs, 1e-6, None))
+        return np.stack(columns, axis=1)
+
+    def test_batch_matches_per_sample_objective(self):
+        dim = 3
+        mle = MLEReconstructor(dim)
+        data = self._noisy_batch(mle, dim, 8)
+        start = np.broadcast_to(np.eye(dim) / dim, (8, dim, dim))
+        batch = mle.reconstruct_batch(data, initial_densities=start)
+        assert batch.num_samples == 8
+        assert batch.converged.all()
+        for k in range(8):
+            single = mle.reconstruct_with_details(data[:, k], initial_density=np.eye(dim) / dim)
+            assert batch.objective_values[k] == pytest.approx(single.objective_value, abs=1e-5)
+            assert np.allclose(batch.rho_matrices_raw[k], single.rho_matrix_raw, atol=5e-3)
+
+    def test_result_at_matches_stack(self):
+        dim = 2
+        mle = MLEReconstructor(dim)
+        data = self._noisy_batch(mle, dim, 3, seed=4)
+        batch = mle.reconstruct_batch(data)
+        result = batch.result_at(1)
+        assert np.allclose(result.density.matrix, batch.densities[1])
+        assert np.allclose(result.expected_probabilities, batch.expected_probabilities[:, 1])
+        assert result.n_iterations == batch.n_iterations[1]
+        assert result.objective_value == pytest.approx(batch.objective_values[1])
+
+    def test_batch_rejects_bad_initial_shape(self):
+        mle = MLEReconstructor(2)
+        data = self._noisy_batch(mle, 2, 2)
+        with pytest.raises(ValueError):
+            mle.reconstruct_batch(data, initial_densities=np.zeros((3, 2, 2)))
+
+
+class TestMLEReconstructorLeastSquares:
+    @pytest.mark.parametrize("regularization", [None, 1e-3])
+    def test_residual_jacobian_matches_finite_differences(self, regularization):
+        from scipy.optimize import approx_fprime
+
+        dim = 3
+        mle = MLEReconstructor(dim, optimizer="lm", regularization=regularization)
+        projectors = mle.projector_set.projectors
+        rng = np.random.default_rng(13)
+        params = rng.normal(scale=0.5, size=dim * dim)
+        probs = _probabilities(projectors, _random_density(dim, seed=8))
+        jac = mle._residual_jacobian(params, probs, projectors)
+        residuals = mle._residuals(params, probs, projectors)
+        assert np.sum(residuals ** 2) == pytest.approx(
+            mle._objective_function(params, probs, projectors, regularization)
+        )
+        numeric = np.stack([
+            approx_fprime(params, lambda x, k=k: mle._residuals(x, probs, projectors)[k], 1e-7)
+            for k in range(jac.shape[0])
+        ])
+        assert np.allclose(jac, numeric, rtol=1e-4, atol=1e-5)
+
+    def test_lm_reconstruction_reports_counts(self):
+        dim = 3
+        mle = MLEReconstructor(dim, optimizer="lm")
+        rho_true = _random_density(dim, seed=19)
+        probs = _probabilities(mle.projector_set.projectors, rho_true)
+        result = mle.reconstruct_with_details(probs, initial_density=np.eye(dim) / dim)
+        assert result.success
+        assert 0 < result.n_iterations <= 100
+        assert result.n_function_evaluations > 0
+        assert np.allclose(result.rho_matrix_raw, rho_true, atol=1e-6)
+
+
+class TestMLEReconstructorWarmStart:
+    def test_warm_start_used_when_closer(self):
+        dim = 3
+        mle = MLEReconstructor(dim)
+        rho_true = _random_density(dim, seed=21)
+        probs = _probabilities(mle.projector_set.projectors, rho_true)
+        cold = mle.reconstruct_with_details(probs, initial_density=np.eye(dim) / dim)
+        warm = mle.reconstruct_with_details(
+            probs, initial_density=np.eye(dim) / dim, warm_start=cold.rho_matrix_raw
+        )
+        assert warm.warm_started and not cold.warm_started
+        assert warm.n_iterations <= cold.n_iterations
+        assert warm.objective_value == pytest.approx(cold.objective_value, abs=1e-8)
+
+    def test_warm_start_ignored_when_objective_worse(self):
+        dim = 3
+        mle = MLEReconstructor(dim)
+        rho_true = _random_density(dim, seed=22)
+        probs = _probabilities(mle.projector_set.projectors, rho_true)
+        far = _random_density(dim, seed=99)
+        result = mle.reconstruct_with_details(probs, initial_density=rho_true, warm_start=far)
+        assert not result.warm_started
+        assert np.allclose(result.rho_matrix_raw, rho_true, atol=1e-5)
+
+    def test_failed_warm_start_counts_both_runs(self):
+        dim = 3
+        rng = np.random.default_rng(0)
+        a = rng.normal(size=(dim, dim)) + 1j * rng.normal(size=(dim, dim))
+        rho_true = a @ a.conj().T / np.trace(a @ a.conj().T)
+        probs = np.abs(
+            _probabilities(MLEReconstructor(dim).projector_set.projectors, rho_true)
+            + rng.normal(scale=0.05, size=dim * (dim + 1))
+        )
+        optimum = MLEReconstructor(dim).reconstruct_with_details(probs).rho_matrix_raw
+        capped = MLEReconstructor(dim, max_iterations=2)
+        cold = capped.reconstruct_with_details(probs)
+        result = capped.reconstruct_with_details(probs, warm_start=optimum)
+        assert not result.success
+        assert result.n_iterations == cold.n_iterations + 2
+        assert result.n_function_evaluations > cold.n_function_evaluations
+
+    def test_warm_start_rejects_bad_shape(self):
+        mle = MLEReconstructor(2)
+        probs = _probabilities(mle.projector_set.projectors, np.eye(2) / 2)
+        with pytest.raises(ValueError):
+            mle.reconstruct_with_details(probs, warm_start=np.eye(3))
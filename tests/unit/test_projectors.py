@@ -3,6 +3,7 @@
 import numpy as np
 import pytest
 
+from qtomography.domain.factorization import _FACTORIZATION_CACHE
 from qtomography.domain.projectors import ProjectorSet
 
 
@@ -70,6 +71,36 @@ class TestProjectorSetCache:
         ProjectorSet.clear_cache()
         assert not ProjectorSet._CACHE
 
+    def test_cached_arrays_are_shared_read_only_views(self):
+        first = ProjectorSet.get(3)
+        second = ProjectorSet.get(3)
+        for name in ("projectors", "measurement_matrix", "groups"):
+            array = getattr(first, name)
+            assert array is getattr(second, name)
+            assert not array.flags.writeable
+            with pytest.raises(ValueError):
+                array[0] = 0
+        writable = first.projectors.copy()
+        writable[0] = 0
+        assert not np.allclose(first.projectors[0], 0)
+
+    def test_cache_limit_evicts_projectors_and_derived_factorizations(self):
+        ProjectorSet.clear_cache()
+        limit = ProjectorSet.cache_stats().max_bytes
+        try:
+            small = ProjectorSet.get(2)
+            small.dual_frame()
+            ProjectorSet.set_cache_limit(1)
+            assert (2, "mub") in ProjectorSet._CACHE
+            ProjectorSet.get(3)
+            assert (2, "mub") not in ProjectorSet._CACHE
+            assert not any(key[:2] == (2, "mub") for key in _FACTORIZATION_CACHE.keys())
+            stats = ProjectorSet.cache_stats()
+            assert stats.evictions >= 1 and stats.entries == 1
+        finally:
+            ProjectorSet.set_cache_limit(limit)
+            ProjectorSet.clear_cache()
+
 
 class TestProjectorSetErrors:
     def test_invalid_dimension(self):
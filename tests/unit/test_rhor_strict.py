@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from qtomography.domain.reconstruction.rhor_strict import RrhoStrictReconstructor
 from qtomography.domain.projectors import ProjectorSet
@@ -51,3 +52,142 @@ def test_rhor_strict_nopovm_reconstruction_high_fidelity():
         q = result.expected_probabilities
         assert np.isclose(np.sum(q), 1.0, atol=1e-6)
 
+
+
+def test_rhor_strict_warm_start_from_neighbouring_sample():
+    np.random.seed(11)
+    d = 3
+    ps = ProjectorSet.get(d, design="nopovm")
+    rho_true = 0.9 * random_pure_state(d) + 0.1 * np.eye(d) / d
+    recon = RrhoStrictReconstructor(d, design="nopovm", max_iterations=5000)
+
+    first = recon.reconstruct_with_details(simulate_counts_conditional(rho_true, ps.projectors, N=50000))
+    counts = simulate_counts_conditional(rho_true, ps.projectors, N=50000)
+    cold = recon.reconstruct_with_details(counts)
+    warm = recon.reconstruct_with_details(counts, initial_sigma=first.sigma_matrix)
+
+    assert warm.warm_started and not cold.warm_started
+    assert warm.diagnostics["warm_started"] is True
+    assert warm.iterations < cold.iterations
+    assert np.isclose(warm.log_likelihood, cold.log_likelihood, atol=1e-6)
+
+
+def test_rhor_strict_failed_warm_start_counts_both_runs():
+    np.random.seed(6)
+    d = 3
+    ps = ProjectorSet.get(d, design="nopovm")
+    counts = simulate_counts_conditional(0.9 * random_pure_state(d) + 0.1 * np.eye(d) / d, ps.projectors, N=50000)
+    seed = RrhoStrictReconstructor(d, design="nopovm").reconstruct_with_details(counts).sigma_matrix
+
+    result = RrhoStrictReconstructor(d, design="nopovm", max_iterations=3).reconstruct_with_details(
+        counts, initial_sigma=seed
+    )
+    assert not result.converged
+    assert result.iterations == 6
+
+
+def test_rhor_strict_warm_start_falls_back_when_likelihood_worse():
+    np.random.seed(5)
+    d = 2
+    ps = ProjectorSet.get(d, design="nopovm")
+    psi = np.array([1.0, 0.0], dtype=complex)
+    counts = simulate_counts_conditional(np.outer(psi, psi.conj()), ps.projectors, N=20000)
+    recon = RrhoStrictReconstructor(d, design="nopovm")
+
+    orthogonal = np.diag([0.0, 1.0]).astype(complex)
+    result = recon.reconstruct_with_details(counts, initial_sigma=orthogonal)
+    assert not result.warm_started
+
+    with pytest.raises(ValueError):
+        recon.reconstruct_with_details(counts, initial_sigma=np.eye(3))
+
+
+def test_rhor_strict_check_every_matches_every_iteration_check():
+    np.random.seed(3)
+    d = 3
+    ps = ProjectorSet.get(d, design="nopovm")
+    counts = simulate_counts_conditional(random_pure_state(d), ps.projectors, N=20000)
+
+    every = RrhoStrictReconstructor(d, design="nopovm").reconstruct_with_details(counts)
+    sparse_checks = RrhoStrictReconstructor(d, design="nopovm", check_every=7).reconstruct_with_details(counts)
+
+    assert every.converged and sparse_checks.converged
+    assert sparse_checks.iterations % 7 == 0
+    assert every.iterations <= sparse_checks.iterations < every.iterations + 7
+    assert np.isclose(sparse_checks.log_likelihood, every.log_likelihood, atol=1e-8)
+    assert np.allclose(sparse_checks.rho_matrix_raw, every.rho_matrix_raw, atol=1e-6)
+    assert every.diagnostics["decrease_ll_count"] == 0
+
+    with pytest.raises(ValueError):
+        RrhoStrictReconstructor(d, design="nopovm", check_every=0)
+
+
+def test_rhor_strict_expected_probabilities_match_trace_formula():
+    np.random.seed(4)
+    d = 3
+    ps = ProjectorSet.get(d, design="mub")
+    rho_true = 0.8 * random_pure_state(d) + 0.2 * np.eye(d) / d
+    probs = np.real(np.einsum('aij,ji->a', ps.projectors, rho_true))
+    recon = RrhoStrictReconstructor(d, design="mub")
+    result = recon.reconstruct_with_details(probs)
+
+    E_tilde = ps.normalized_povm().operators
+    q = np.real(np.einsum('aij,ji->a', E_tilde, result.sigma_matrix))
+    # q 为倒数第二次迭代的 σ 给出的概率，收敛后与最终 σ 一致
+    assert np.allclose(result.expected_probabilities, q, atol=1e-6)
+    assert np.allclose(result.rho_matrix_raw, rho_true, atol=1e-4)
+
+
+def test_rhor_strict_momentum_converges_faster_to_same_likelihood():
+    np.random.seed(8)
+    d = 5
+    ps = ProjectorSet.get(d, design="mub")
+    rho_true = 0.999 * random_pure_state(d) + 0.001 * np.eye(d) / d
+    probs = np.real(np.einsum('aij,ji->a', ps.projectors, rho_true))
+    counts = np.random.multinomial(100000, probs / probs.sum())
+
+    plain = RrhoStrictReconstructor(d, design="mub").reconstruct_with_details(counts)
+    fast = RrhoStrictReconstructor(d, design="mub", acceleration="momentum").reconstruct_with_details(counts)
+
+    assert plain.converged and fast.converged
+    assert fast.iterations * 3 < plain.iterations
+    assert fast.log_likelihood >= plain.log_likelihood - 1e-8
+    assert np.allclose(fast.rho_matrix_raw, plain.rho_matrix_raw, atol=1e-3)
+    assert "restart_count" in fast.diagnostics
+    assert fast.diagnostics["decrease_ll_count"] >= 0
+
+    with pytest.raises(ValueError):
+        RrhoStrictReconstructor(d, design="mub", acceleration="nesterov")
+
+
+def test_rhor_strict_batch_matches_per_sample_runs():
+    np.random.seed(12)
+    d = 3
+    ps = ProjectorSet.get(d, design="nopovm")
+    data = np.stack(
+        [
+            simulate_counts_conditional(0.9 * random_pure_state(d) + 0.1 * np.eye(d) / d, ps.projectors, N=20000)
+            for _ in range(6)
+        ],
+        axis=1,
+    )
+    recon = RrhoStrictReconstructor(d, design="nopovm", check_every=3)
+    batch = recon.reconstruct_batch(data)
+
+    assert batch.num_samples == 6
+    assert batch.expected_probabilities.shape == (ps.projectors.shape[0], 6)
+    for k in range(6):
+        single = recon.reconstruct_with_details(data[:, k])
+        assert batch.iterations[k] == single.iterations
+        assert batch.converged[k] == single.converged
+        assert np.isclose(batch.log_likelihoods[k], single.log_likelihood, atol=1e-10)
+        assert np.allclose(batch.rho_matrices_raw[k], single.rho_matrix_raw, atol=1e-10)
+
+    result = batch.result_at(2)
+    assert np.allclose(result.density.matrix, batch.densities[2])
+    assert result.iterations == batch.iterations[2]
+    assert result.diagnostics["support_dim"] == batch.diagnostics["support_dim"]
+    assert result.diagnostics["decrease_ll_count"] == batch.decrease_ll_counts[2]
+
+    with pytest.raises(ValueError):
+        recon.reconstruct_batch(data[:-1])
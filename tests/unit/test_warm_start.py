@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from qtomography.app.controller import ReconstructionConfig
+from qtomography.app.warm_start import WarmStartCache
+
+
+def test_none_policy_never_returns_seed():
+    cache = WarmStartCache("none")
+    cache.record("wls", np.ones(4), np.eye(2))
+    assert cache.lookup("wls", np.ones(4)) is None
+
+
+def test_previous_policy_returns_last_solution_per_method():
+    cache = WarmStartCache("previous")
+    assert cache.lookup("wls", np.ones(4)) is None
+    cache.record("wls", np.ones(4), np.eye(2))
+    cache.record("wls", np.arange(4.0), 2 * np.eye(2))
+    cache.record("rhor", np.ones(4), 3 * np.eye(2))
+    assert np.allclose(cache.lookup("wls", np.ones(4)), 2 * np.eye(2))
+    assert np.allclose(cache.lookup("rhor", np.ones(4)), 3 * np.eye(2))
+
+
+def test_nearest_policy_matches_on_normalised_probabilities():
+    cache = WarmStartCache("nearest", capacity=2)
+    cache.record("wls", np.array([1.0, 0.0, 0.0, 1.0]), np.eye(2))
+    cache.record("wls", np.array([0.0, 1.0, 1.0, 0.0]), 2 * np.eye(2))
+    # 计数与概率尺度无关
+    assert np.allclose(cache.lookup("wls", np.array([90.0, 5.0, 5.0, 100.0])), np.eye(2))
+    cache.record("wls", np.array([0.0, 1.0, 1.0, 0.0]), 3 * np.eye(2))
+    # 容量为 2，最早的条目已被淘汰
+    assert np.allclose(cache.lookup("wls", np.array([1.0, 0.0, 0.0, 1.0])), 2 * np.eye(2))
+
+
+def test_invalid_policy_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        WarmStartCache("sometimes")
+    with pytest.raises(ValueError):
+        ReconstructionConfig(input_path=tmp_path / "p.csv", output_dir=tmp_path, warm_start="sometimes")
+    config = ReconstructionConfig(input_path=tmp_path / "p.csv", output_dir=tmp_path, warm_start="Previous")
+    assert config.warm_start == "previous"